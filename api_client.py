@@ -1,133 +1,636 @@
 """
 통합 API 클라이언트 모듈
-모든 API 호출을 일관된 방식으로 처리합니다.
+모든 webSetup.cgi 호출을 하나의 엔진(CameraApiClient)으로 처리합니다.
+- 재시도/백오프 정책, 성공 코드 판정(returnCode=0/301), 액션별 지연 시간 통계를 한 곳에서 관리
+- 테스트 모듈은 get_api_client()로 카메라별 공유 클라이언트를 사용합니다.
+
+전송 계층(Transport)은 교체 가능합니다.
+- HttpTransport: requests 기반 keep-alive 연결 풀 + Digest 인증 (기본값, 인증 정보별 1개 공유)
+- PlaywrightTransport: 브라우저 세션(page.evaluate → fetch) 경유 (브라우저 세션이 꼭 필요한 경우만)
+
+AsyncCameraApiClient는 asyncio로 여러 액션/카메라를 동시에 조회합니다.
 """
 
+import asyncio
+import os
+import threading
 import time
-from typing import Optional, Dict, Any
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Union, Iterable, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPDigestAuth
 from playwright.sync_api import Page
-from common_actions import parse_api_response
-from config import TIMEOUTS
+from common_actions import parse_api_response, wait_until
+from config import TIMEOUTS, API_CLIENT_SETTINGS
+import tracing
+import config  # USERNAME/PASSWORD를 실행 시점에 참조하기 위해
+
+# 성공으로 간주하는 returnCode (0: 성공, 301: 재부팅/재접속 필요)
+SUCCESS_CODES = ("0", "301")
+
+# 연결 끊김으로 판단하는 예외 메시지 (IP/포트 변경 시 정상적으로 발생)
+DISCONNECT_MARKERS = ("Connection aborted", "Remote end closed", "RemoteDisconnected")
+
+
+def is_success_code(return_code: str) -> bool:
+    """returnCode 성공 여부 판정"""
+    return return_code in SUCCESS_CODES
+
+
+# ===========================================================
+# 📊 API 호출 통계
+# ===========================================================
+
+class ApiMetrics:
+    """액션별 호출 수/지연 시간/오류/재시도 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, float]] = {}
+
+    def record(self, action: str, elapsed: float, ok: bool = True, retry: bool = False):
+        with self._lock:
+            stat = self._stats.setdefault(action, {
+                "calls": 0, "errors": 0, "retries": 0, "total_time": 0.0, "max_time": 0.0
+            })
+            stat["calls"] += 1
+            stat["total_time"] += elapsed
+            stat["max_time"] = max(stat["max_time"], elapsed)
+            if not ok:
+                stat["errors"] += 1
+            if retry:
+                stat["retries"] += 1
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """현재 통계 복사본 (평균 지연 시간 포함)"""
+        with self._lock:
+            result = {}
+            for action, stat in self._stats.items():
+                item = dict(stat)
+                item["avg_time"] = stat["total_time"] / stat["calls"] if stat["calls"] else 0.0
+                result[action] = item
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def print_summary(self):
+        """액션별 통계 출력"""
+        stats = self.snapshot()
+        if not stats:
+            return
+        print(f"\n{'='*60}")
+        print("📡 API 호출 통계")
+        print(f"{'='*60}")
+        print(f"{'Action':<22}{'Calls':>7}{'Err':>5}{'Retry':>7}{'Avg(ms)':>10}{'Max(ms)':>10}")
+        for action, s in sorted(stats.items(), key=lambda kv: -kv[1]["total_time"]):
+            print(f"{action:<22}{s['calls']:>7}{s['errors']:>5}{s['retries']:>7}"
+                  f"{s['avg_time']*1000:>10.1f}{s['max_time']*1000:>10.1f}")
+
+
+# 모든 클라이언트가 공유하는 전역 통계
+API_METRICS = ApiMetrics()
+
+
+# ===========================================================
+# 🔌 전송 계층 (Transport)
+# ===========================================================
+
+class PlaywrightTransport:
+    """
+    브라우저 세션을 통한 전송
+    page.evaluate(fetch(...))로 요청하므로 호출마다 Playwright IPC 비용이 발생합니다.
+    """
+    name = "playwright"
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    def send(self, url: str, method: str = "GET", params: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None) -> str:
+        """요청 전송 후 응답 텍스트 반환 (실패 시 'Error: ...' 문자열)"""
+        if params:
+            query_str = "&".join([f"{k}={v}" for k, v in params.items()])
+            url = f"{url}?{query_str}"
+        return self.page.evaluate("""async (args) => {
+            try {
+                const { url, method } = args;
+                const options = method === 'POST' ? { method: 'POST' } : {};
+                const response = await fetch(url, options);
+                if (!response.ok) return `Error: ${response.status}`;
+                return await response.text();
+            } catch (e) { return `Error: ${e.message}`; }
+        }""", {"url": url, "method": method})
+
+    def fetch(self, url: str, params: Optional[Dict[str, Any]] = None,
+              timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        바이너리 응답을 메모리로 받아 반환 (실패 시 None)
+        브라우저 안에서 base64로 변환해 IPC로 받으므로 HttpTransport.fetch보다 느립니다.
+        """
+        if params:
+            query_str = "&".join([f"{k}={v}" for k, v in params.items()])
+            url = f"{url}?{query_str}"
+        data_b64 = self.page.evaluate("""async (url) => {
+            try {
+                const response = await fetch(url);
+                if (!response.ok) return null;
+                const blob = await response.blob();
+                return new Promise((resolve) => {
+                    const reader = new FileReader();
+                    reader.onloadend = () => resolve(reader.result.split(',')[1]);
+                    reader.readAsDataURL(blob);
+                });
+            } catch (e) { return null; }
+        }""", url)
+        if not data_b64:
+            return None
+        import base64
+        return base64.b64decode(data_b64)
+
+    def download(self, url: str, path: str, params: Optional[Dict[str, Any]] = None,
+                 chunk_size: int = None, timeout: Optional[float] = None) -> int:
+        """바이너리 응답을 파일로 저장 후 바이트 수 반환 (실패 시 0)"""
+        data = self.fetch(url, params=params, timeout=timeout)
+        if not data:
+            return 0
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+    def recover(self):
+        """401 발생 시 페이지 새로고침으로 세션 복구"""
+        self.page.reload()
+        self.page.wait_for_selector("#Page200_id", timeout=TIMEOUTS["page_load"])
+
+    def close(self):
+        pass
+
+
+class HttpTransport:
+    """
+    requests 기반 직접 HTTP 전송
+    Digest 인증 + keep-alive 연결 풀을 사용하므로 브라우저 없이 동작합니다.
+    """
+    name = "http"
+
+    def __init__(self, username: str, password: str, pool_size: int = None, timeout: float = None):
+        pool_size = pool_size or API_CLIENT_SETTINGS["pool_size"]
+        self.timeout = timeout or TIMEOUTS["api_request"]
+        self.session = requests.Session()
+        self.session.auth = HTTPDigestAuth(username, password)
+        # 재시도는 CameraApiClient에서 일괄 처리하므로 어댑터 재시도는 끔
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def send(self, url: str, method: str = "GET", params: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None) -> str:
+        """
+        요청 전송 후 응답 텍스트 반환
+        실패 시 'Error: <status>' / 'Error: Timeout' / 'Error: Disconnected (...)' / 'Error: <message>'
+        """
+        try:
+            if method == "POST":
+                res = self.session.post(url, params=params, timeout=timeout or self.timeout)
+            else:
+                res = self.session.get(url, params=params, timeout=timeout or self.timeout)
+        except requests.exceptions.ReadTimeout:
+            return "Error: Timeout"
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
+            if any(marker in str(e) for marker in DISCONNECT_MARKERS):
+                return f"Error: Disconnected ({e})"
+            return f"Error: {e}"
+        except requests.exceptions.RequestException as e:
+            return f"Error: {e}"
+        if not res.ok:
+            return f"Error: {res.status_code}"
+        return res.text
 
+    def fetch(self, url: str, params: Optional[Dict[str, Any]] = None,
+              timeout: Optional[float] = None) -> Optional[bytes]:
+        """바이너리 응답을 메모리로 받아 반환 (실패 시 None)"""
+        try:
+            res = self.session.get(url, params=params, timeout=timeout or self.timeout)
+        except requests.exceptions.RequestException:
+            return None
+        return res.content if res.ok and res.content else None
+
+    def download(self, url: str, path: str, params: Optional[Dict[str, Any]] = None,
+                 chunk_size: int = None, timeout: Optional[float] = None) -> int:
+        """
+        바이너리 응답을 청크 단위로 파일에 바로 기록 후 바이트 수 반환 (실패 시 0)
+        임시 파일(.part)에 받은 뒤 교체하므로 중간에 끊겨도 깨진 파일이 남지 않습니다.
+        """
+        chunk_size = chunk_size or 64 * 1024
+        tmp_path = path + ".part"
+        written = 0
+        try:
+            with self.session.get(url, params=params, stream=True, timeout=timeout or self.timeout) as res:
+                if not res.ok:
+                    return 0
+                with open(tmp_path, "wb") as f:
+                    for chunk in res.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        written += len(chunk)
+            if written == 0:
+                os.remove(tmp_path)
+                return 0
+            os.replace(tmp_path, path)
+            return written
+        except (requests.exceptions.RequestException, OSError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return 0
+
+    def recover(self):
+        """401 발생 시 Digest 인증 상태(nonce) 초기화"""
+        auth = self.session.auth
+        self.session.auth = HTTPDigestAuth(auth.username, auth.password)
+
+    def close(self):
+        """유휴 연결 정리 (세션은 이후에도 재사용 가능)"""
+        self.session.close()
+
+
+# 인증 정보별 공유 HTTP 전송 (하나의 연결 풀)
+_HTTP_TRANSPORTS: Dict[Tuple[str, str], HttpTransport] = {}
+_HTTP_TRANSPORTS_LOCK = threading.Lock()
+
+
+def get_http_transport(username: str, password: str) -> HttpTransport:
+    """인증 정보별 공유 HttpTransport 반환"""
+    with _HTTP_TRANSPORTS_LOCK:
+        transport = _HTTP_TRANSPORTS.get((username, password))
+        if transport is None:
+            transport = HttpTransport(username, password)
+            _HTTP_TRANSPORTS[(username, password)] = transport
+        return transport
+
+
+def create_transport(page: Optional[Page] = None, kind: str = None,
+                     username: str = None, password: str = None):
+    """
+    설정에 맞는 Transport 생성
+    HTTP 전송에 필요한 인증 정보가 없으면 브라우저 세션으로 폴백합니다.
+    """
+    kind = kind or API_CLIENT_SETTINGS["transport"]
+    username = username or config.USERNAME
+    password = password or config.PASSWORD
+
+    if kind == "http" and username and password:
+        return get_http_transport(username, password)
+    if page is not None:
+        return PlaywrightTransport(page)
+    raise ValueError("API 전송 계층을 만들 수 없습니다 (인증 정보 또는 Playwright page 필요)")
+
+
+# ===========================================================
+# 📡 API 클라이언트 (공통 요청 엔진)
+# ===========================================================
 
 class CameraApiClient:
     """
-    Playwright 기반 API 클라이언트
+    카메라 webSetup.cgi API 클라이언트
     모든 API 호출을 통합 관리합니다.
     """
     
-    def __init__(self, page: Page, camera_ip: str, base_port: str = "80"):
+    def __init__(self, page: Optional[Page], camera_ip: str, base_port: str = "80",
+                 transport: Union[str, PlaywrightTransport, HttpTransport, None] = None):
+        """
+        Args:
+            page: Playwright 페이지 (PlaywrightTransport 사용 시 또는 폴백용, 없으면 None)
+            camera_ip: 카메라 IP
+            base_port: 웹 포트
+            transport: Transport 인스턴스 또는 "http" | "playwright" (None이면 config 기본값)
+        """
         self.page = page
         self.camera_ip = camera_ip
-        self.base_port = base_port
+        self.base_port = str(base_port)
         self.base_url = f"http://{camera_ip}:{base_port}/cgi-bin/webSetup.cgi"
+        if transport is None or isinstance(transport, str):
+            transport = create_transport(page, transport)
+        self.transport = transport
+        # 읽기 캐시 (opt-in): {(camera_ip, action, channel): (저장 시각, 응답 dict)}
+        self.cache_ttl = 0.0
+        self._cache: Dict[Tuple[str, str, Optional[int]], Tuple[float, Dict[str, Any]]] = {}
+        self._cache_lock = threading.Lock()
+        self._page_listener = False
     
-    def _make_request(self, action: str, mode: str = "1", params: Optional[Dict[str, Any]] = None, 
-                     method: str = "GET", retry_on_401: bool = True) -> Optional[Dict[str, Any]]:
+    def close(self):
+        """전송 계층 연결 정리"""
+        self.transport.close()
+    
+    # ===========================================================
+    # 읽기 캐시 (opt-in)
+    # ===========================================================
+    
+    def enable_cache(self, ttl: Optional[float] = None):
         """
-        통합 API 요청 함수
+        읽기(GET) 결과 캐시 활성화
+        
+        같은 액션에 대한 set(), TTL 만료, returnCode=301(재부팅) 시 자동 무효화됩니다.
+        page가 있으면 웹 UI에서 발생한 webSetup.cgi 쓰기 요청도 감지하여 무효화합니다.
+        """
+        self.cache_ttl = API_CLIENT_SETTINGS["cache_ttl"] if ttl is None else ttl
+        if not self._page_listener and self.page is not None:
+            self.page.on("request", self._on_page_request)
+            self._page_listener = True
+    
+    @contextmanager
+    def cached(self, ttl: Optional[float] = None):
+        """
+        with 블록 동안만 읽기 캐시 사용 (검증 루프의 반복 조회용)
+        
+        page 요청 감지는 다음 Playwright 호출 때에야 전달되므로, 진입/종료 시 캐시를 비워
+        블록 밖에서 웹 UI로 저장한 값을 이전 값으로 돌려주지 않도록 합니다.
+        """
+        previous = self.cache_ttl
+        self.invalidate()
+        self.enable_cache(ttl)
+        try:
+            yield self
+        finally:
+            self.cache_ttl = previous
+            self.invalidate()
+    
+    def disable_cache(self):
+        """읽기 캐시 비활성화"""
+        self.cache_ttl = 0.0
+        self.invalidate()
+    
+    def invalidate(self, action: Optional[str] = None):
+        """캐시 무효화 (action이 None이면 전체)"""
+        with self._cache_lock:
+            if action is None:
+                self._cache.clear()
+            else:
+                for key in [k for k in self._cache if k[1] == action]:
+                    del self._cache[key]
+    
+    def _cache_get(self, action: str, channel: Optional[int]) -> Optional[Dict[str, Any]]:
+        if self.cache_ttl <= 0:
+            return None
+        key = (self.camera_ip, action, channel)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if not entry:
+                return None
+            if time.monotonic() - entry[0] > self.cache_ttl:
+                del self._cache[key]
+                return None
+            return dict(entry[1])
+    
+    def _cache_put(self, action: str, channel: Optional[int], data: Dict[str, Any]):
+        if self.cache_ttl <= 0:
+            return
+        with self._cache_lock:
+            self._cache[(self.camera_ip, action, channel)] = (time.monotonic(), dict(data))
+    
+    def _on_page_request(self, request):
+        """웹 UI의 webSetup.cgi 쓰기 요청(mode=0) 감지 시 해당 액션 캐시 무효화"""
+        try:
+            if "webSetup.cgi" not in request.url:
+                return
+            query = dict(parse_qsl(urlsplit(request.url).query))
+            if request.method == "POST" and request.post_data:
+                query.update(parse_qsl(request.post_data))
+            if query.get("mode", "1") != "1":
+                self.invalidate(query.get("action"))
+        except Exception:
+            # 판단할 수 없으면 전체 무효화 (안전 우선)
+            self.invalidate()
+    
+    @staticmethod
+    def _retry_delay(attempt: int) -> float:
+        """재시도 대기 시간 (지수 백오프)"""
+        delay = TIMEOUTS["retry_delay"] * (API_CLIENT_SETTINGS["backoff"] ** attempt)
+        return min(delay, API_CLIENT_SETTINGS["max_retry_delay"])
+    
+    def _request_text(self, action: str, mode: str = "1", params: Optional[Dict[str, Any]] = None,
+                      method: str = "GET", retry_on_401: bool = True, channel: Optional[int] = None,
+                      timeout: Optional[float] = None, max_retries: Optional[int] = None,
+                      silent: bool = False, expect_disconnect: bool = False) -> Optional[str]:
+        """
+        요청 전송 후 응답 원문 반환 (재시도/백오프/통계 공통 처리)
         
         Args:
             action: API 액션 이름 (예: "systemInfo", "videoEasySetting")
             mode: 모드 ("1"=읽기, "0"=쓰기, "2"=확인)
-            params: POST 요청 시 파라미터 딕셔너리
+            params: 추가 파라미터 딕셔너리
             method: HTTP 메서드 ("GET" 또는 "POST")
             retry_on_401: 401 에러 시 재시도 여부
+            channel: 채널 번호 (videoPrivacy 등 채널별 액션)
+            timeout: 요청 타임아웃 (초, None이면 Transport 기본값)
+            max_retries: 최대 시도 횟수 (None이면 TIMEOUTS["max_retries"])
+            silent: 오류 메시지 출력 생략 (폴링 루프용)
+            expect_disconnect: 타임아웃/연결 끊김을 정상 응답으로 간주 (IP/포트 변경 요청)
         
         Returns:
-            파싱된 응답 딕셔너리 또는 None
+            응답 원문 또는 None
         """
-        max_retries = TIMEOUTS["max_retries"]
+        max_retries = max_retries or TIMEOUTS["max_retries"]
+        query = {"action": action, "mode": mode}
+        if channel is not None:
+            query["channel"] = channel
+        if params:
+            query.update(params)
         
         for attempt in range(max_retries):
+            is_last = attempt >= max_retries - 1
+            start = time.perf_counter()
             try:
-                if method == "GET":
-                    api_url = f"{self.base_url}?action={action}&mode={mode}"
-                    if params:
-                        query_str = "&".join([f"{k}={v}" for k, v in params.items()])
-                        api_url += f"&{query_str}"
-                else:  # POST
-                    if params:
-                        query_str = "&".join([f"{k}={v}" for k, v in params.items()])
-                        api_url = f"{self.base_url}?action={action}&mode={mode}&{query_str}"
-                    else:
-                        api_url = f"{self.base_url}?action={action}&mode={mode}"
-                
-                response_text = self.page.evaluate("""async (args) => {
-                    try {
-                        const { url, method } = args;
-                        const options = method === 'POST' ? { method: 'POST' } : {};
-                        const response = await fetch(url, options);
-                        if (!response.ok) return `Error: ${response.status}`;
-                        return await response.text();
-                    } catch (e) { return `Error: ${e.message}`; }
-                }""", {"url": api_url, "method": method})
-                
-                # 401 에러 처리
-                if "Error: 401" in response_text and retry_on_401:
-                    if attempt < max_retries - 1:
-                        print(f"⚠️ [API] 401 Unauthorized (시도 {attempt+1}/{max_retries}). 페이지 새로고침...")
-                        self.page.reload()
-                        self.page.wait_for_selector("#Page200_id", timeout=TIMEOUTS["page_load"])
-                        time.sleep(TIMEOUTS["retry_delay"])
-                        continue
-                
-                # 403 에러 처리 (HTTPS 필요)
-                if "Error: 403" in response_text:
-                    if action == "userSetup":
-                        print(f"   ⚠️ [API] 403 Forbidden: userSetup API는 HTTPS 또는 RSA 암호화가 필요합니다.")
-                        print(f"   💡 [Tip] 사용자 관리 작업은 UI로 폴백합니다.")
-                    else:
-                        print(f"⚠️ [API] 403 Forbidden: {response_text}")
-                    return None
-                
-                # 에러 응답 처리
-                if response_text and response_text.startswith("Error"):
-                    print(f"⚠️ [API] 응답 오류: {response_text}")
-                    if attempt < max_retries - 1:
-                        time.sleep(TIMEOUTS["retry_delay"])
-                        continue
-                    return None
-                
-                # 성공 응답 파싱
-                if response_text:
-                    return parse_api_response(response_text)
-                    
+                with tracing.span(action, "api", mode=mode, attempt=attempt + 1):
+                    response_text = self.transport.send(self.base_url, method, query, timeout)
             except Exception as e:
-                print(f"⚠️ [API] 에러 (시도 {attempt+1}/{max_retries}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(TIMEOUTS["retry_delay"])
-                else:
+                API_METRICS.record(action, time.perf_counter() - start, ok=False, retry=attempt > 0)
+                if not silent:
+                    print(f"⚠️ [API] 에러 (시도 {attempt+1}/{max_retries}): {e}")
+                if is_last:
                     return None
+                tracing.sleep(self._retry_delay(attempt), f"API 재시도 대기 ({action})")
+                continue
+            
+            elapsed = time.perf_counter() - start
+            is_error = not response_text or response_text.startswith("Error")
+            
+            # IP/포트 변경 중 연결 끊김은 정상
+            if is_error and expect_disconnect and \
+                    response_text.startswith(("Error: Timeout", "Error: Disconnected")):
+                API_METRICS.record(action, elapsed, ok=True, retry=attempt > 0)
+                return response_text
+            
+            API_METRICS.record(action, elapsed, ok=not is_error, retry=attempt > 0)
+            if not is_error:
+                return response_text
+            
+            # 401 에러 처리
+            if "Error: 401" in response_text and retry_on_401 and not is_last:
+                if not silent:
+                    print(f"⚠️ [API] 401 Unauthorized (시도 {attempt+1}/{max_retries}). 세션 복구...")
+                self.transport.recover()
+                tracing.sleep(self._retry_delay(attempt), f"API 재시도 대기 ({action})")
+                continue
+            
+            # 403 에러 처리 (HTTPS 필요)
+            if "Error: 403" in response_text:
+                if action == "userSetup":
+                    print(f"   ⚠️ [API] 403 Forbidden: userSetup API는 HTTPS 또는 RSA 암호화가 필요합니다.")
+                    print(f"   💡 [Tip] 사용자 관리 작업은 UI로 폴백합니다.")
+                elif not silent:
+                    print(f"⚠️ [API] 403 Forbidden: {response_text}")
+                return None
+            
+            # 그 외 에러 응답
+            if not silent:
+                print(f"⚠️ [API] 응답 오류 ({action}): {response_text or '빈 응답'}")
+            if is_last:
+                return None
+            tracing.sleep(self._retry_delay(attempt), f"API 재시도 대기 ({action})")
         
         return None
     
-    def get(self, action: str, mode: str = "1") -> Optional[Dict[str, Any]]:
-        """설정 읽기 (GET)"""
-        return self._make_request(action, mode, method="GET")
+    def _make_request(self, action: str, mode: str = "1", params: Optional[Dict[str, Any]] = None, 
+                     method: str = "GET", retry_on_401: bool = True, **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        통합 API 요청 함수
+        
+        Returns:
+            파싱된 응답 딕셔너리 또는 None
+        """
+        response_text = self._request_text(action, mode, params, method, retry_on_401, **kwargs)
+        if response_text:
+            return parse_api_response(response_text)
+        return None
+    
+    def get(self, action: str, mode: str = "1", channel: Optional[int] = None,
+            timeout: Optional[float] = None, max_retries: Optional[int] = None,
+            silent: bool = False, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        설정 읽기 (GET)
+        
+        Args:
+            use_cache: False면 캐시를 건너뛰고 항상 카메라에서 조회 (반영 폴링용)
+        """
+        cacheable = use_cache and mode == "1"
+        if cacheable:
+            cached = self._cache_get(action, channel)
+            if cached is not None:
+                return cached
+        
+        data = self._make_request(action, mode, method="GET", channel=channel, timeout=timeout,
+                                  max_retries=max_retries, silent=silent)
+        if data and mode == "1":
+            self._cache_put(action, channel, data)
+        return dict(data) if data else data
     
-    def set(self, action: str, params: Dict[str, Any], mode: str = "0") -> bool:
+    def submit(self, action: str, params: Dict[str, Any], mode: str = "0",
+               channel: Optional[int] = None, timeout: Optional[float] = None,
+               max_retries: Optional[int] = None, expect_disconnect: bool = False) -> Tuple[bool, str]:
+        """
+        설정 쓰기 (POST) 후 (성공 여부, 응답 원문) 반환
+        
+        Args:
+            expect_disconnect: IP/포트 변경처럼 응답 전에 연결이 끊기는 요청이면 True
+        """
+        # returnCode 제거 (읽기 전용 필드)
+        clean_params = {k: v for k, v in params.items() if k != "returnCode"}
+        
+        response_text = self._request_text(action, mode, clean_params, method="POST", channel=channel,
+                                           timeout=timeout, max_retries=max_retries,
+                                           expect_disconnect=expect_disconnect)
+        # 쓰기 시도 후에는 결과와 관계없이 해당 액션 캐시 무효화
+        self.invalidate(action)
+        if response_text is None:
+            return False, "응답 없음"
+        if expect_disconnect and response_text.startswith(("Error: Timeout", "Error: Disconnected")):
+            return True, f"{response_text} (Expected)"
+        
+        return_code = parse_api_response(response_text).get("returnCode", "")
+        if return_code == "301":
+            # 재부팅/재접속 필요: 다른 액션 값도 바뀔 수 있으므로 전체 무효화
+            self.invalidate()
+        if is_success_code(return_code):
+            return True, response_text
+        
+        print(f"   ❌ [API Fail] 요청: {action} {clean_params}")
+        print(f"   ❌ [API Fail] 응답: returnCode={return_code}")
+        return False, response_text
+    
+    def set(self, action: str, params: Dict[str, Any], mode: str = "0",
+            channel: Optional[int] = None) -> bool:
         """
         설정 쓰기 (POST)
         
         Returns:
             성공 여부 (returnCode=0 또는 returnCode=301 포함 시 True)
         """
-        # returnCode 제거 (읽기 전용 필드)
-        clean_params = {k: v for k, v in params.items() if k != "returnCode"}
+        success, _ = self.submit(action, params, mode, channel=channel)
+        return success
+    
+    def wait_for_values(self, action: str, expected: Dict[str, Any], channel: Optional[int] = None,
+                        timeout: Optional[float] = None) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        읽기 값에 expected가 반영될 때까지 폴링 (반영 시간은 SETTLE_METRICS에 기록)
+        
+        Returns:
+            (반영 여부, 마지막으로 조회한 설정 dict)
+        """
+        last = {}
+        
+        def _applied():
+            data = self.get(action, channel=channel, use_cache=False)
+            last["data"] = data
+            return data if data and all(data.get(k) == v for k, v in expected.items()) else None
+        
+        result = wait_until(_applied, timeout=timeout, label=f"{action}({','.join(expected)})")
+        return (True, result) if result else (False, last.get("data"))
+    
+    def apply_and_verify(self, action: str, deltas: List[Dict[str, Any]], on_applied=None,
+                         channel: Optional[int] = None, restore: bool = True
+                         ) -> Optional[List[Tuple[Dict[str, Any], bool, Optional[Dict[str, Any]]]]]:
+        """
+        파라미터 변경(delta) 목록을 순서대로 적용/검증하고 마지막에 1회만 복구
+        
+        기준 설정을 1회 조회한 뒤 현재 상태와 다른 키만 전송하고(최소 payload),
+        검증은 delta의 키만 읽기 값으로 확인합니다.
         
-        response = self._make_request(action, mode, clean_params, method="POST")
+        Args:
+            deltas: 케이스별 변경 파라미터 목록 (예: [{"wbMode": "manual", "redGain": "10"}, ...])
+            on_applied: 케이스 검증 직후 호출되는 콜백 (delta, ok, data) - 스냅샷/출력용
+            restore: True면 종료 시 변경된 키를 기준값으로 1회 복구
+        
+        Returns:
+            [(delta, 성공 여부, 읽기 값), ...] (기준 설정 조회 실패 시 None)
+        """
+        baseline = self.get(action, channel=channel)
+        if not baseline:
+            return None
+        baseline = {k: v for k, v in baseline.items() if k != "returnCode"}
         
-        if response:
-            return_code = response.get("returnCode", "")
-            # 0: 성공, 301: 재부팅/재접속 필요 (성공으로 간주)
-            if return_code == "0" or return_code == "301":
-                return True
+        state = dict(baseline)
+        touched = set()
+        results = []
+        for delta in deltas:
+            payload = {k: v for k, v in delta.items() if state.get(k) != v}
+            if payload and not self.set(action, payload, channel=channel):
+                ok, data = False, None
             else:
-                print(f"   ❌ [API Fail] 요청: {clean_params}")
-                print(f"   ❌ [API Fail] 응답: returnCode={return_code}")
+                touched.update(payload)
+                state.update(payload)
+                ok, data = self.wait_for_values(action, delta, channel=channel)
+            results.append((delta, ok, data))
+            if on_applied:
+                on_applied(delta, ok, data)
         
-        return False
+        if restore:
+            restore_payload = {k: baseline[k] for k in touched if k in baseline}
+            if restore_payload and self.set(action, restore_payload, channel=channel):
+                self.wait_for_values(action, restore_payload, channel=channel)
+        return results
     
     # ===========================================================
     # 편의 메서드들 (기존 코드 호환성 유지)
@@ -320,3 +823,113 @@ class CameraApiClient:
     
     def set_video_streaming(self, params: Dict[str, Any]) -> bool:
         return self.set("videoStreaming", params)
+
+
+# 카메라별 공유 클라이언트 (모든 테스트 모듈이 같은 엔진/연결 풀 사용)
+_CLIENTS: Dict[Tuple[str, str], CameraApiClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_api_client(camera_ip: str, base_port: str = "80", page: Optional[Page] = None) -> CameraApiClient:
+    """
+    카메라별 공유 CameraApiClient 반환
+    
+    Args:
+        page: HTTP 인증 정보가 없을 때 브라우저 세션 폴백용 (선택)
+    """
+    key = (camera_ip, str(base_port))
+    # 여러 스레드(매트릭스/스냅샷/스트림 검사)가 동시에 호출해도 카메라당 1개만 생성
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = CameraApiClient(page, camera_ip, base_port)
+            _CLIENTS[key] = client
+        elif page is not None and client.page is not page:
+            # 브라우저 세션이 새로 열린 경우 페이지 갱신
+            client.page = page
+            if isinstance(client.transport, PlaywrightTransport):
+                client.transport.page = page
+    return client
+
+
+def register_api_client(client: CameraApiClient, camera_ip: str = None, base_port: str = "80"):
+    """
+    get_api_client(camera_ip, base_port)가 반환할 클라이언트 지정
+    (웹 포트가 다른 시뮬레이터 등을 기존 테스트 코드 그대로 사용할 때)
+    """
+    with _CLIENTS_LOCK:
+        _CLIENTS[(camera_ip or client.camera_ip, str(base_port))] = client
+
+
+# ===========================================================
+# ⚡ 비동기 API 클라이언트
+# ===========================================================
+
+# 비디오 설정 전체 스냅샷용 액션 목록
+VIDEO_SETTING_ACTIONS = (
+    "videoEasySetting", "videoImage", "videoWb", "videoExposure",
+    "videoDaynight", "videoMisc", "videoStreaming", "videoMat",
+)
+
+
+class AsyncCameraApiClient:
+    """
+    asyncio 기반 API 클라이언트
+    CameraApiClient와 같은 action/mode 규칙과 응답 형식(parse_api_response)을 사용하며,
+    카메라당 동시 요청 수를 제한하여 펌웨어 과부하를 막습니다.
+    
+    ⚠️ Playwright page는 스레드 간 공유가 불가능하므로 HttpTransport만 지원합니다.
+    """
+
+    def __init__(self, camera_ip: str, base_port: str = "80", max_concurrency: int = None,
+                 transport: Optional[HttpTransport] = None):
+        if transport is None:
+            transport = create_transport(kind="http")
+        if not isinstance(transport, HttpTransport):
+            raise ValueError("AsyncCameraApiClient는 HttpTransport만 지원합니다")
+        self.camera_ip = camera_ip
+        self.max_concurrency = max_concurrency or API_CLIENT_SETTINGS["max_concurrency"]
+        self._client = CameraApiClient(None, camera_ip, base_port, transport=transport)
+        self._semaphore = None
+        self._loop = None
+
+    def _limit(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에 묶인 카메라별 동시성 제한 세마포어"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def get(self, action: str, mode: str = "1") -> Optional[Dict[str, Any]]:
+        """설정 읽기 (GET)"""
+        async with self._limit():
+            return await asyncio.to_thread(self._client.get, action, mode)
+
+    async def set(self, action: str, params: Dict[str, Any], mode: str = "0") -> bool:
+        """설정 쓰기 (POST), 성공 기준은 CameraApiClient.set과 동일"""
+        async with self._limit():
+            return await asyncio.to_thread(self._client.set, action, params, mode)
+
+    async def gather_get(self, actions: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        여러 액션 동시 조회
+        
+        Returns:
+            {action: 파싱된 응답 딕셔너리 또는 None}
+        """
+        actions = list(actions)
+        results = await asyncio.gather(*(self.get(action) for action in actions))
+        return dict(zip(actions, results))
+
+    def close(self):
+        self._client.close()
+
+
+def snapshot_video_settings(camera_ip: str, base_port: str = "80") -> Dict[str, Optional[Dict[str, Any]]]:
+    """동기 코드에서 비디오 설정 전체를 한 번에 조회 (VIDEO_SETTING_ACTIONS)"""
+    client = AsyncCameraApiClient(camera_ip, base_port)
+    try:
+        return asyncio.run(client.gather_get(VIDEO_SETTING_ACTIONS))
+    finally:
+        client.close()
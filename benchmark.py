@@ -0,0 +1,214 @@
+"""
+하네스 자체 오버헤드 벤치마크
+
+카메라 시뮬레이터(지연 0)를 대상으로 run_*_test 함수를 실행하여
+카메라가 아닌 하네스가 쓰는 시간을 측정합니다.
+
+측정 항목 (테스트별):
+- wall: 전체 소요 시간
+- sleep: tracing.sleep 및 작업자 대기 시간
+- overhead: wall - sleep (API 왕복, 폴링, 파싱, 출력 등 하네스 순수 시간)
+- cpu: 테스트 스레드의 Python CPU 시간
+- api_calls / bytes: 클라이언트 기준 API 호출 수, 시뮬레이터 기준 송수신 바이트
+
+기준값(JSON)과 비교해 API 호출 수나 overhead가 허용치 이상 늘면 종료 코드 1을 반환합니다.
+
+사용 예:
+    python benchmark.py --save-baseline          # 기준값 저장
+    python benchmark.py                          # 기준값과 비교 (CI)
+    python benchmark.py --tests image,wb --repeat 5
+"""
+import argparse
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+import config
+from config import BENCHMARK_SETTINGS, SIMULATOR_SETTINGS
+from api_client import API_METRICS, CameraApiClient, register_api_client
+from camera_simulator import start_simulator
+from snapshot_service import flush_snapshots
+from tracing import TRACER
+
+# 벤치마크 대상 (웹 UI / iRAS 없이 API만으로 실행되는 테스트): test_id → (모듈, 함수)
+BENCHMARK_TESTS = {
+    "self_adjust": ("video_test", "run_self_adjust_mode_test"),
+    "image": ("video_test", "run_video_image_test"),
+    "white_balance": ("video_test", "run_white_balance_test"),
+    "daynight": ("video_test", "run_daynight_test"),
+    "misc": ("video_test", "run_video_misc_test"),
+    "privacy": ("video_test", "run_privacy_mask_test"),
+    "osd": ("video_test", "run_osd_test"),
+    "alarm_out": ("event_action", "run_alarm_out_test"),
+    "email": ("event_action", "run_email_test"),
+    "ftp": ("event_action", "run_ftp_test"),
+    "recording": ("event_action", "run_recording_test"),
+}
+
+# 무인 실행 시 테스트가 묻는 값 (시뮬레이터용 더미 값)
+BENCHMARK_INPUTS = {
+    "smtp_id": "bench", "smtp_pw": "bench", "email_sender": "bench@sim.local",
+    "email_recipient": "qa@sim.local", "ftp_server": "127.0.0.1", "ftp_path": "/bench",
+    "ftp_user": "bench", "ftp_password": "bench",
+}
+
+# 카테고리별 대기 시간으로 집계할 trace 카테고리
+SLEEP_CATEGORIES = ("sleep", "operator")
+
+
+def _sleep_time(events, start_us, end_us) -> float:
+    """구간 내 sleep/작업자 대기 합계 (초, 최상위 구간만)"""
+    total = 0.0
+    for e in events:
+        if e.get("ph") == "X" and e["cat"] in SLEEP_CATEGORIES and start_us <= e["ts"] <= end_us:
+            total += e["dur"]
+    return total / 1e6
+
+
+def run_once(test_id, func, camera_ip, camera) -> dict:
+    """테스트 1회 실행 후 측정값 반환"""
+    API_METRICS.reset()
+    TRACER.reset()
+    camera.reset()
+    before = camera.snapshot_stats()
+
+    start_us = time.time() * 1e6
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    output = io.StringIO()
+    try:
+        with redirect_stdout(output):
+            success, msg = func(None, camera_ip)
+            flush_snapshots()
+    except Exception as e:
+        success, msg = False, f"예외 발생: {e}"
+    cpu = time.thread_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    end_us = time.time() * 1e6
+
+    after = camera.snapshot_stats()
+    sleep = _sleep_time(TRACER.events(), start_us, end_us)
+    return {
+        "success": bool(success), "message": msg,
+        "wall": wall, "sleep": sleep, "overhead": max(wall - sleep, 0.0), "cpu": cpu,
+        "api_calls": sum(s["calls"] for s in API_METRICS.snapshot().values()),
+        "requests": after["requests"] - before["requests"],
+        "bytes": (after["bytes_in"] + after["bytes_out"]) - (before["bytes_in"] + before["bytes_out"]),
+    }
+
+
+def run_benchmark(test_ids, repeat) -> dict:
+    """시뮬레이터를 띄우고 테스트별로 repeat회 실행 (시간 항목은 최소값, 횟수는 마지막 값)"""
+    server, camera = start_simulator(port=0, apply_latency=0.0, response_latency=0.0,
+                                     error_rate=0.0, disconnect_rate=0.0, reboot_time=0.0)
+    camera_ip, port = server.server_address[:2]
+    username, password = SIMULATOR_SETTINGS["username"], SIMULATOR_SETTINGS["password"]
+    config.update_config(camera_ip, username, password, "sim", "SIM", camera_ip)
+    config.RUN_SETTINGS.update({"interactive": False, "assume_yes": True, "operator_delay": 0})
+    config.RUN_INPUTS.update(BENCHMARK_INPUTS)
+    register_api_client(CameraApiClient(None, camera_ip, str(port), "http"))
+
+    results = {}
+    try:
+        for test_id in test_ids:
+            module_name, func_name = BENCHMARK_TESTS[test_id]
+            func = getattr(importlib.import_module(module_name), func_name)
+            runs = [run_once(test_id, func, camera_ip, camera) for _ in range(repeat)]
+            best = dict(runs[-1])
+            for key in ("wall", "sleep", "overhead", "cpu"):
+                best[key] = min(r[key] for r in runs)
+            results[test_id] = best
+            print(f"   {'✅' if best['success'] else '❌'} {test_id:<14} wall {best['wall']:7.2f}s  "
+                  f"overhead {best['overhead']:6.3f}s  API {best['api_calls']:4d}")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return results
+
+
+def print_results(results):
+    print(f"\n{'='*78}")
+    print("⏱️  하네스 오버헤드 벤치마크 (시뮬레이터, 지연 0)")
+    print(f"{'='*78}")
+    print(f"{'Test':<15}{'Wall(s)':>9}{'Sleep(s)':>10}{'Overhead':>10}{'CPU(s)':>8}{'API':>6}{'KB':>9}  Result")
+    for test_id, r in results.items():
+        print(f"{test_id:<15}{r['wall']:>9.2f}{r['sleep']:>10.2f}{r['overhead']:>10.3f}{r['cpu']:>8.3f}"
+              f"{r['api_calls']:>6}{r['bytes'] / 1024:>9.1f}  {'PASS' if r['success'] else 'FAIL'}")
+    total = {k: sum(r[k] for r in results.values()) for k in ("wall", "sleep", "overhead", "cpu", "api_calls")}
+    print(f"{'-'*78}")
+    print(f"{'TOTAL':<15}{total['wall']:>9.2f}{total['sleep']:>10.2f}{total['overhead']:>10.3f}"
+          f"{total['cpu']:>8.3f}{total['api_calls']:>6}")
+
+
+def compare_baseline(results, baseline) -> list:
+    """기준값 대비 회귀 목록 반환"""
+    settings = BENCHMARK_SETTINGS
+    regressions = []
+    for test_id, r in results.items():
+        base = baseline.get("tests", {}).get(test_id)
+        if not base:
+            continue
+        call_limit = base["api_calls"] * (1 + settings["max_call_increase"])
+        if r["api_calls"] > call_limit:
+            regressions.append(f"{test_id}: API 호출 {base['api_calls']} → {r['api_calls']}")
+        overhead_limit = max(base["overhead"] * (1 + settings["max_overhead_increase"]),
+                             base["overhead"] + settings["min_overhead_delta"])
+        if r["overhead"] > overhead_limit:
+            regressions.append(f"{test_id}: overhead {base['overhead']:.3f}s → {r['overhead']:.3f}s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="하네스 오버헤드 벤치마크 (카메라 시뮬레이터 대상)")
+    parser.add_argument("--tests", default=",".join(BENCHMARK_TESTS), help="실행할 test_id (쉼표 구분)")
+    parser.add_argument("--repeat", type=int, default=BENCHMARK_SETTINGS["repeat"], help="테스트별 반복 횟수")
+    parser.add_argument("--baseline", default=BENCHMARK_SETTINGS["baseline_path"], help="기준값 JSON 경로")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값으로 저장")
+    parser.add_argument("--json", help="이번 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    test_ids = [t.strip() for t in args.tests.split(",") if t.strip()]
+    unknown = [t for t in test_ids if t not in BENCHMARK_TESTS]
+    if unknown:
+        print(f"❌ 벤치마크 대상이 아닌 테스트: {', '.join(unknown)} (사용 가능: {', '.join(BENCHMARK_TESTS)})")
+        sys.exit(2)
+
+    print(f"\n🏁 벤치마크 시작: {len(test_ids)}개 테스트 x {args.repeat}회")
+    results = run_benchmark(test_ids, max(1, args.repeat))
+    print_results(results)
+
+    report = {"generated": time.strftime("%Y-%m-%dT%H:%M:%S"), "python": sys.version.split()[0], "tests": results}
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 결과 저장: {args.json}")
+
+    if args.save_baseline:
+        folder = os.path.dirname(args.baseline)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"💾 기준값 저장: {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️  기준값 파일이 없습니다 ({args.baseline}). --save-baseline으로 먼저 저장하세요.")
+        return
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare_baseline(results, baseline)
+    if regressions:
+        print(f"\n❌ 성능 회귀 {len(regressions)}건 (기준: {args.baseline})")
+        for item in regressions:
+            print(f"   - {item}")
+        sys.exit(1)
+    print(f"\n✅ 기준값 대비 회귀 없음 ({args.baseline})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,479 @@
+"""
+IDIS 카메라 시뮬레이터 (webSetup.cgi)
+
+실제 카메라 없이 하네스를 실행/벤치마크하기 위한 로컬 HTTP 서버입니다.
+표준 라이브러리만 사용하므로 Linux에서도 바로 실행할 수 있습니다.
+
+- Digest 인증 (requests HTTPDigestAuth / 브라우저 http_credentials 호환)
+- /cgi-bin/webSetup.cgi?action=X&mode=1 → "returnCode=0&key=value&..." (parse_api_response 형식)
+- mode=0 쓰기는 액션별 상태에 병합 (channel 파라미터는 채널별 상태로 분리)
+- apply_latency: 쓰기 값이 조회에 반영되기까지의 지연 (wait_for_values 폴링 검증용)
+- 재부팅 액션(networkPort/networkIp 등) 쓰기 시 returnCode=301 후 reboot_time 동안 연결 끊김
+- 장애 주입: HTTP 500 / 연결 끊김 비율, 액션별 강제 장애
+- videoSnapshot: 현재 영상 설정(미러링/피벗/주야간/노출/WB/프라이버시 마스크)을 반영한 BMP 이미지
+
+사용 예:
+    python camera_simulator.py --port 8080 --apply-latency 0.5 --error-rate 0.05
+    (코드에서) server, camera = start_simulator(port=0); ... ; server.shutdown()
+"""
+import argparse
+import copy
+import hashlib
+import os
+import random
+import struct
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from config import SIMULATOR_SETTINGS
+
+# ===========================================================
+# 📋 기본 상태 (액션별 설정값)
+# ===========================================================
+DEFAULT_STATE = {
+    "systemInfo": {
+        "name": "SIM-CAMERA", "note": "", "language": "english", "model": "DC-T6631-SIM",
+        "firmwareVersion": "2.0.0-sim", "macAddress": "00:1C:90:00:00:01",
+    },
+    "dateTime": {
+        "dateFormat": "YYYY/MM/DD", "timeFormat": "HH:MM:SS", "timeZone": "Asia/Seoul",
+        "useNtp": "off", "ntpServer": "time.windows.com",
+    },
+    "videoEasySetting": {
+        "easyDayType": "1", "easyNightType": "1",
+        "easyDaySharpness": "1", "easyDayContrast": "1", "easyDayBrightness": "1", "easyDayColors": "1",
+        "easyNightSharpness": "1", "easyNightGamma": "1", "easyNightBrightness": "1",
+    },
+    "videoImage": {"mirroring": "off", "pivot": "off"},
+    "videoWb": {"mode": "auto", "redGain": "250", "blueGain": "250"},
+    "videoExposure": {
+        "manualAeControl": "off", "targetGain": "0", "slowShutter": "off", "wdr": "off",
+        "antiFlicker": "off", "irisControlMode": "auto",
+        "lowerGainLimit": "0", "upperGainLimit": "30", "lowerShutterLimit": "30", "upperShutterLimit": "8000",
+    },
+    "videoDaynight": {"mode": "auto", "icrMode": "auto", "bwMode": "off", "schedule": "_".join(["0" * 48] * 7)},
+    "videoMisc": {"imageStabilizer": "off"},
+    "videoStreaming": {
+        "codec": "h265", "resolution": "1920x1080", "framerateStream1": "30", "quality": "veryHigh",
+        "bitrateControl": "vbr", "maxWidth": "3328", "maxHeight": "1872",
+        **{f"{key}Stream{n}": value for n in (2, 3, 4) for key, value in (
+            ("use", "off"), ("codec", "h264"), ("resolution", "1280x720"),
+            ("quality", "standard"), ("bitrateControl", "vbr"), ("framerate", "15"))},
+    },
+    "videoMat": {"useMat": "off", "sensitivity": "3", "inactivityPeriod": "10", "targetFramerate": "5"},
+    "videoPrivacy": {"usePrivacy": "off", "name": "", "positionX": "0", "positionY": "0", "width": "0", "height": "0"},
+    "videoOsdText": {"useOsd": "off", "text": "", "textSize": "2", "textColor": "ffffff",
+                     "textTransparency": "255", "positionX": "50", "positionY": "10"},
+    "videoOsdDateTime": {"useOsd": "off", "dateFormat": "YYYY/MM/DD", "timeFormat": "HH:MM:SS",
+                         "textSize": "2", "textColor": "ffffff", "textTransparency": "255",
+                         "positionX": "5", "positionY": "5"},
+    "eventAlarmin": {"useAlarmIn": "off", "alarmType": "no", "actionAlarmOut": "off",
+                     "actionEmail": "off", "actionFTPupload": "off", "actionRecord": "off"},
+    "actionAlarmout": {"useAlarmOut": "off", "dwellTime": "5", "scheduleStart": "00:00", "scheduleEnd": "24:00"},
+    "actionEmail": {"useEmail": "off", "smtpServer": "", "smtpPort": "25", "useSSLTLS": "off",
+                    "sender": "", "recipientList": "", "actionEmailAttachImage": "off"},
+    "actionFtp": {"useFTP": "off", "ftpServer1": "", "port1": "21", "uploadPath1": "", "userID1": "",
+                  "password1": "", "uploadType": "event", "uploadFrequency": "1", "duration": "5"},
+    "actionRecord": {"useRecord": "off", "eventRecordingStream": "1", "timelapseRecordingStream": "1",
+                     "preEventDuration": "10", "postEventDuration": "10", "recordAudio": "off",
+                     "networkRecordingFailover": "off", "recordingPreference": "event"},
+    "networkIp": {"type": "manual", "ipAddress": "127.0.0.1", "subnetMask": "255.255.0.0",
+                  "gateway": "10.0.0.1", "dnsServer": "8.8.8.8", "linkLocalOnly": "off",
+                  "macAddress": "00:1C:90:00:00:01"},
+    "networkPort": {"useUPNP": "off", "useHTTPS": "off", "webPort": "80", "adminPort": "8016",
+                    "watchPort": "8016", "rtspPort": "554", "recordPort": "8017", "useRtsp": "on", "useWeb": "on"},
+    "networkDDNS": {"useDDNS": "off", "serverAddress": "", "namingType": "mac"},
+    "networkBandwidth": {"useNetworkBandwidth": "off", "networkBandwidth": "102400"},
+    "networkSecurity": {"useSSL": "off", "sslType": "standard", "filterType": "off"},
+    "groupSetup": {"groupCount": "1", "groupName1": "Administrator"},
+    "userSetup": {"userCount": "1", "userName1": "admin", "userGroup1": "Administrator"},
+}
+
+# 쓰기 시 재부팅(returnCode=301)하는 액션
+REBOOT_ACTIONS = {"networkPort", "networkIp", "systemDefault", "systemReboot"}
+
+# 요청 파라미터 중 상태로 저장하지 않는 키
+CONTROL_KEYS = {"action", "mode", "channel", "_"}
+
+
+# ===========================================================
+# 🎥 시뮬레이션 카메라 상태
+# ===========================================================
+class SimulatedCamera:
+    """
+    액션별 설정 상태 + 지연/재부팅/장애 주입 + 요청 통계
+
+    Args:
+        apply_latency: 쓰기 후 조회에 반영되기까지 지연 (초)
+        response_latency: 요청당 응답 지연 (초)
+        reboot_time: 301 응답 후 재부팅 시간 (초)
+        error_rate / disconnect_rate: 전체 요청 장애 비율
+        faults: 액션별 장애 {"videoMat": {"error_rate": 1.0}, ...}
+    """
+
+    def __init__(self, apply_latency=None, response_latency=None, reboot_time=None,
+                 error_rate=None, disconnect_rate=None, faults=None, seed=None):
+        settings = SIMULATOR_SETTINGS
+        self.apply_latency = settings["apply_latency"] if apply_latency is None else apply_latency
+        self.response_latency = settings["response_latency"] if response_latency is None else response_latency
+        self.reboot_time = settings["reboot_time"] if reboot_time is None else reboot_time
+        self.error_rate = settings["error_rate"] if error_rate is None else error_rate
+        self.disconnect_rate = settings["disconnect_rate"] if disconnect_rate is None else disconnect_rate
+        self.faults = faults or {}
+        self._random = random.Random(settings["seed"] if seed is None else seed)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """상태/통계 초기화"""
+        with self._lock:
+            self._state = copy.deepcopy(DEFAULT_STATE)
+            self._channels = {}
+            self._pending = []  # (반영 시각, 상태 키, 변경값)
+            self._rebooting_until = 0.0
+            self.stats = {"requests": 0, "reads": 0, "writes": 0, "errors": 0, "challenges": 0,
+                          "bytes_in": 0, "bytes_out": 0, "actions": {}}
+
+    # --- 상태 ---
+    def _section(self, action, channel):
+        """액션(채널) 상태 딕셔너리 (없으면 생성)"""
+        if channel is None:
+            return self._state.setdefault(action, {})
+        key = (action, channel)
+        if key not in self._channels:
+            self._channels[key] = copy.deepcopy(self._state.get(action, {}))
+        return self._channels[key]
+
+    def _apply_pending(self, now):
+        due = [p for p in self._pending if p[0] <= now]
+        self._pending = [p for p in self._pending if p[0] > now]
+        for _, (action, channel), changes in due:
+            self._section(action, channel).update(changes)
+
+    def read(self, action, channel=None) -> dict:
+        with self._lock:
+            self._apply_pending(time.monotonic())
+            if channel is None and action not in self._state:
+                return None
+            return dict(self._section(action, channel))
+
+    def write(self, action, params, channel=None) -> str:
+        """쓰기 처리 후 returnCode 반환"""
+        changes = {k: v for k, v in params.items() if k not in CONTROL_KEYS}
+        with self._lock:
+            now = time.monotonic()
+            self._apply_pending(now)
+            if self.apply_latency > 0:
+                self._pending.append((now + self.apply_latency, (action, channel), changes))
+            else:
+                self._section(action, channel).update(changes)
+            if action in REBOOT_ACTIONS:
+                self._rebooting_until = now + self.reboot_time
+                return "301"
+        return "0"
+
+    def is_rebooting(self) -> bool:
+        return time.monotonic() < self._rebooting_until
+
+    # --- 장애 주입 ---
+    def pick_fault(self, action):
+        """이번 요청에 주입할 장애 (None / "error" / "disconnect")"""
+        rules = self.faults.get(action, {})
+        error_rate = rules.get("error_rate", self.error_rate)
+        disconnect_rate = rules.get("disconnect_rate", self.disconnect_rate)
+        with self._lock:
+            roll = self._random.random()
+        if roll < disconnect_rate:
+            return "disconnect"
+        if roll < disconnect_rate + error_rate:
+            return "error"
+        return None
+
+    # --- 통계 ---
+    def count(self, action, is_write, bytes_in, bytes_out, error=False, challenge=False):
+        with self._lock:
+            s = self.stats
+            if challenge:
+                # Digest 인증 요구(401)는 요청 수에서 분리하여 집계
+                s["challenges"] += 1
+                s["bytes_in"] += bytes_in
+                return
+            s["requests"] += 1
+            s["writes" if is_write else "reads"] += 1
+            s["errors"] += int(error)
+            s["bytes_in"] += bytes_in
+            s["bytes_out"] += bytes_out
+            s["actions"][action] = s["actions"].get(action, 0) + 1
+
+    def snapshot_stats(self) -> dict:
+        with self._lock:
+            return copy.deepcopy(self.stats)
+
+    # --- 스냅샷 이미지 ---
+    def render_snapshot(self, width=64, height=48) -> bytes:
+        """
+        현재 영상 설정을 반영한 24bit BMP
+        (미러링/피벗 회전/주야간 흑백/목표 게인 밝기/WB 색조/프라이버시 마스크 영역)
+        """
+        image = self.read("videoImage") or {}
+        daynight = self.read("videoDaynight") or {}
+        exposure = self.read("videoExposure") or {}
+        wb = self.read("videoWb") or {}
+        privacy = self.read("videoPrivacy", channel=1) or {}
+        mirroring = image.get("mirroring", "off")
+        pivot = image.get("pivot", "off")
+        gray = daynight.get("bwMode") == "on" or daynight.get("mode") == "night"
+        try:
+            gain = int(exposure.get("targetGain", "0"))
+        except ValueError:
+            gain = 0
+        offset = gain * 4
+        # WB: 색온도 프리셋은 고정 색조, manual은 red/blue 게인 비율 (기본 250)
+        wb_mode = wb.get("wbMode", wb.get("mode", "auto"))
+        tint = {"incandescent": (1.25, 0.75), "4000k": (1.1, 0.9)}.get(wb_mode, (1.0, 1.0))
+        if wb_mode == "manual":
+            try:
+                tint = (0.5 + int(wb.get("redGain", "250")) / 500, 0.5 + int(wb.get("blueGain", "250")) / 500)
+            except ValueError:
+                pass
+
+        out_w, out_h = (height, width) if pivot != "off" else (width, height)
+        max_w, max_h = int(privacy.get("maxWidth", 80)), int(privacy.get("maxHeight", 45))
+        zones = []
+        if privacy.get("usePrivacy") == "on":
+            for i in range(1, 17):
+                if privacy.get(f"useZone{i}") == "on":
+                    zones.append(tuple(int(privacy.get(f"{k}Zone{i}", 0)) for k in ("left", "top", "right", "bottom")))
+
+        def base_pixel(bx, by):
+            sx = width - 1 - bx if mirroring in ("horizontal", "both") else bx
+            sy = height - 1 - by if mirroring in ("vertical", "both") else by
+            r = 40 + 200 * sx // max(width - 1, 1)
+            g = 40 + 200 * sy // max(height - 1, 1)
+            b = 120
+            r, b = int(r * tint[0]), int(b * tint[1])
+            if gray:
+                r = g = b = (r * 299 + g * 587 + b * 114) // 1000
+            return b, g, r
+
+        row_size = (out_w * 3 + 3) & ~3
+        rows = []
+        for y in range(out_h):
+            row = bytearray()
+            for x in range(out_w):
+                zx, zy = x * max_w // out_w, y * max_h // out_h
+                if any(left <= zx < right and top <= zy < bottom for left, top, right, bottom in zones):
+                    row += bytes((128, 128, 128))
+                    continue
+                if pivot == "clockwise":
+                    pixel = base_pixel(y, height - 1 - x)
+                elif pivot == "counterclockwise":
+                    pixel = base_pixel(width - 1 - y, x)
+                else:
+                    pixel = base_pixel(x, y)
+                row += bytes(max(0, min(255, c + offset)) for c in pixel)
+            row += b"\0" * (row_size - len(row))
+            rows.append(bytes(row))
+        pixels = b"".join(reversed(rows))  # BMP는 아래쪽 행부터 저장
+        header = struct.pack("<2sIHHI", b"BM", 54 + len(pixels), 0, 0, 54)
+        info = struct.pack("<IiiHHIIiiII", 40, out_w, out_h, 1, 24, 0, len(pixels), 2835, 2835, 0, 0)
+        return header + info + pixels
+
+
+# ===========================================================
+# 🔐 Digest 인증
+# ===========================================================
+def _md5(text: str) -> str:
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+def _parse_digest(header: str) -> dict:
+    """Authorization: Digest k="v", k=v, ... 파싱"""
+    fields = {}
+    for part in header[len("Digest "):].split(","):
+        key, _, value = part.strip().partition("=")
+        fields[key.strip()] = value.strip().strip('"')
+    return fields
+
+
+# ===========================================================
+# 🌐 HTTP 핸들러
+# ===========================================================
+class CameraRequestHandler(BaseHTTPRequestHandler):
+    """webSetup.cgi / 로그인 페이지 / Digest 인증 처리"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "IDIS-Simulator/1.0"
+    realm = "IDIS Camera"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def do_GET(self):
+        self._handle(b"")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self._handle(self.rfile.read(length) if length else b"")
+
+    # --- 처리 ---
+    def _handle(self, body: bytes):
+        camera = self.server.camera
+        url = urlsplit(self.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        if body:
+            params.update(parse_qsl(body.decode("utf-8", errors="ignore"), keep_blank_values=True))
+        action = params.get("action", "")
+        is_write = params.get("mode") == "0"
+        bytes_in = len(self.requestline) + sum(len(k) + len(v) + 4 for k, v in self.headers.items()) + len(body)
+
+        if camera.is_rebooting():
+            camera.count(action, is_write, bytes_in, 0, error=True)
+            self.close_connection = True
+            self.connection.close()
+            return
+
+        if not self._check_auth():
+            camera.count(action or url.path, is_write, bytes_in, 0, challenge=True)
+            return
+
+        if camera.response_latency:
+            time.sleep(camera.response_latency)
+
+        if url.path.endswith("webSetup.cgi"):
+            fault = camera.pick_fault(action)
+            if fault == "disconnect":
+                camera.count(action, is_write, bytes_in, 0, error=True)
+                self.close_connection = True
+                self.connection.close()
+                return
+            if fault == "error":
+                sent = self._send(500, b"Internal Server Error")
+                camera.count(action, is_write, bytes_in, sent, error=True)
+                return
+            if action == "videoSnapshot":
+                sent = self._send(200, camera.render_snapshot(), "image/bmp")
+            else:
+                sent = self._send(200, self._web_setup(camera, action, params, is_write).encode("utf-8"))
+            camera.count(action, is_write, bytes_in, sent)
+            return
+
+        # 로그인 후 대기하는 메인 페이지 요소 (#Page200_id)
+        page = b'<html><body><div id="Page200_id">IDIS Camera Simulator</div></body></html>'
+        sent = self._send(200, page, "text/html; charset=utf-8")
+        camera.count(url.path, False, bytes_in, sent)
+
+    def _web_setup(self, camera, action, params, is_write) -> str:
+        channel = params.get("channel")
+        if is_write:
+            code = camera.write(action, params, channel)
+            return f"returnCode={code}"
+        data = camera.read(action, channel)
+        if data is None:
+            return "returnCode=-1"
+        return urlencode({"returnCode": "0", **data})
+
+    def _send(self, status, payload: bytes, content_type="text/plain; charset=utf-8") -> int:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        return len(payload)
+
+    # --- 인증 ---
+    def _check_auth(self) -> bool:
+        header = self.headers.get("Authorization", "")
+        if header.startswith("Digest "):
+            d = _parse_digest(header)
+            ha1 = _md5(f"{self.server.username}:{self.realm}:{self.server.password}")
+            ha2 = _md5(f"{self.command}:{d.get('uri', '')}")
+            if d.get("qop"):
+                expected = _md5(f"{ha1}:{d.get('nonce')}:{d.get('nc')}:{d.get('cnonce')}:{d.get('qop')}:{ha2}")
+            else:
+                expected = _md5(f"{ha1}:{d.get('nonce')}:{ha2}")
+            if (d.get("username") == self.server.username and d.get("nonce") in self.server.nonces
+                    and d.get("response") == expected):
+                return True
+
+        nonce = hashlib.md5(os.urandom(16)).hexdigest()
+        self.server.nonces.add(nonce)
+        self.send_response(401)
+        self.send_header("WWW-Authenticate",
+                         f'Digest realm="{self.realm}", qop="auth", nonce="{nonce}", algorithm=MD5')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+        return False
+
+
+class CameraSimulatorServer(ThreadingHTTPServer):
+    """카메라 1대를 흉내내는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, camera, host=None, port=None, username=None, password=None, verbose=False):
+        settings = SIMULATOR_SETTINGS
+        super().__init__((host or settings["host"], settings["port"] if port is None else port),
+                         CameraRequestHandler)
+        self.camera = camera
+        self.username = username or settings["username"]
+        self.password = password or settings["password"]
+        self.nonces = set()
+        self.verbose = verbose
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+def start_simulator(port=0, host=None, username=None, password=None, **camera_options):
+    """
+    백그라운드 스레드로 시뮬레이터 시작 (port=0이면 빈 포트 자동 선택)
+
+    Returns:
+        (server, camera) - 종료 시 server.shutdown(); server.server_close()
+    """
+    camera = SimulatedCamera(**camera_options)
+    server = CameraSimulatorServer(camera, host, port, username, password)
+    threading.Thread(target=server.serve_forever, name="camera-simulator", daemon=True).start()
+    return server, camera
+
+
+# ===========================================================
+# 🚀 단독 실행
+# ===========================================================
+if __name__ == "__main__":
+    settings = SIMULATOR_SETTINGS
+    parser = argparse.ArgumentParser(description="IDIS 카메라 시뮬레이터 (webSetup.cgi)")
+    parser.add_argument("--host", default=settings["host"])
+    parser.add_argument("--port", type=int, default=settings["port"])
+    parser.add_argument("--username", default=settings["username"])
+    parser.add_argument("--password", default=settings["password"])
+    parser.add_argument("--response-latency", type=float, default=settings["response_latency"], help="요청당 응답 지연 (초)")
+    parser.add_argument("--apply-latency", type=float, default=settings["apply_latency"], help="설정 반영 지연 (초)")
+    parser.add_argument("--reboot-time", type=float, default=settings["reboot_time"], help="301 이후 재부팅 시간 (초)")
+    parser.add_argument("--error-rate", type=float, default=settings["error_rate"], help="HTTP 500 비율 (0~1)")
+    parser.add_argument("--disconnect-rate", type=float, default=settings["disconnect_rate"], help="연결 끊김 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=settings["seed"], help="장애 주입 난수 시드")
+    parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    sim_camera = SimulatedCamera(apply_latency=args.apply_latency, response_latency=args.response_latency,
+                                 reboot_time=args.reboot_time, error_rate=args.error_rate,
+                                 disconnect_rate=args.disconnect_rate, seed=args.seed)
+    sim_server = CameraSimulatorServer(sim_camera, args.host, args.port, args.username, args.password, args.verbose)
+    print(f"🎥 카메라 시뮬레이터 실행: {sim_server.url}  (계정: {args.username} / {args.password})")
+    print("   Ctrl+C로 종료")
+    try:
+        sim_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sim_server.server_close()
+        stats = sim_camera.snapshot_stats()
+        print(f"\n📊 요청 {stats['requests']}회 (읽기 {stats['reads']}, 쓰기 {stats['writes']}, "
+              f"오류 {stats['errors']}), 수신 {stats['bytes_in']}B / 송신 {stats['bytes_out']}B")
@@ -1,5 +1,10 @@
+import os
+import threading
+import time
 from urllib.parse import parse_qsl
 from playwright.sync_api import Page
+from config import SETTLE_SETTINGS, RUN_SETTINGS, RUN_INPUTS
+from tracing import TRACER, traced
 
 # 🌍 공통 Selector (다국어 대응)
 VISIBLE_DIALOG = '.ui-dialog:visible'
@@ -15,6 +20,7 @@ def parse_api_response(response_text: str) -> dict:
         # 파싱 실패 시 빈 딕셔너리 반환
         return {}
 
+@traced("ui")
 def handle_popup(page: Page, button_index=0, timeout=5000):
     """
     범용 팝업 처리기 (개선판)
@@ -47,4 +53,159 @@ def handle_popup(page: Page, button_index=0, timeout=5000):
             return True
         except: pass
         
-    return False
\ No newline at end of file
+    return False
+
+
+# ===========================================================
+# ⏳ [Wait] 조건 폴링 대기 (고정 sleep 대체)
+# ===========================================================
+class SettleRecorder:
+    """설정별 실제 반영(settle) 소요 시간 기록 (펌웨어별 적용 지연 확인용)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._records = []
+
+    def record(self, label: str, elapsed: float, ok: bool, polls: int):
+        with self._lock:
+            self._records.append({"label": label, "elapsed": elapsed, "ok": ok, "polls": polls})
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [dict(r) for r in self._records]
+
+    def reset(self):
+        with self._lock:
+            self._records.clear()
+
+    def print_summary(self):
+        """라벨별 반영 시간 통계 출력"""
+        records = self.snapshot()
+        if not records:
+            return
+        stats = {}
+        for r in records:
+            s = stats.setdefault(r["label"], {"count": 0, "timeouts": 0, "total": 0.0, "max": 0.0})
+            s["count"] += 1
+            s["total"] += r["elapsed"]
+            s["max"] = max(s["max"], r["elapsed"])
+            if not r["ok"]:
+                s["timeouts"] += 1
+        print(f"\n{'='*60}")
+        print("⏳ 설정 반영 시간 (Settle Latency)")
+        print(f"{'='*60}")
+        print(f"{'Setting':<36}{'Count':>6}{'T/O':>5}{'Avg(s)':>8}{'Max(s)':>8}")
+        for label, s in sorted(stats.items(), key=lambda kv: -kv[1]["total"]):
+            print(f"{label[:35]:<36}{s['count']:>6}{s['timeouts']:>5}"
+                  f"{s['total']/s['count']:>8.2f}{s['max']:>8.2f}")
+        total_wait = sum(r["elapsed"] for r in records)
+        print(f"총 대기 시간: {total_wait:.1f}s ({len(records)}회)")
+
+
+# 전역 반영 시간 기록기
+SETTLE_METRICS = SettleRecorder()
+
+
+def wait_until(predicate, timeout=None, interval=None, backoff=None, label=None):
+    """
+    조건이 만족될 때까지 폴링 후 즉시 반환
+    
+    Args:
+        predicate: 인자 없는 함수. 참(truthy) 값을 반환하면 대기 종료
+        timeout: 최대 대기 시간 (초)
+        interval: 첫 폴링 간격 (초)
+        backoff: 폴링 간격 증가 배수 (최대 SETTLE_SETTINGS["max_interval"])
+        label: 반영 시간 기록용 이름 (None이면 기록 안 함)
+    
+    Returns:
+        predicate의 마지막 참 값 (타임아웃 시 None)
+    """
+    with TRACER.span(label or "wait_until", "wait"):
+        return _wait_until(predicate, timeout, interval, backoff, label)
+
+
+def _wait_until(predicate, timeout, interval, backoff, label):
+    timeout = SETTLE_SETTINGS["timeout"] if timeout is None else timeout
+    interval = SETTLE_SETTINGS["interval"] if interval is None else interval
+    backoff = SETTLE_SETTINGS["backoff"] if backoff is None else backoff
+    
+    start = time.monotonic()
+    deadline = start + timeout
+    polls = 0
+    result = None
+    while True:
+        polls += 1
+        try:
+            result = predicate()
+        except Exception:
+            result = None
+        if result:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            result = None
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff, SETTLE_SETTINGS["max_interval"])
+    
+    if label:
+        SETTLE_METRICS.record(label, time.monotonic() - start, bool(result), polls)
+    return result
+
+
+# ===========================================================
+# 🙋 [Operator] 사용자 입력/확인 (무인 실행 시 input() 대체)
+# ===========================================================
+def _preset_value(key):
+    """RUN_INPUTS → 환경 변수(CAMTEST_<KEY>) 순으로 미리 지정된 값 조회"""
+    if not key:
+        return None
+    value = RUN_INPUTS.get(key)
+    if value in (None, ""):
+        value = os.environ.get(f"CAMTEST_{key.upper()}")
+    return None if value in (None, "") else str(value)
+
+
+def prompt_value(key: str, message: str) -> str:
+    """
+    테스트 실행 중 필요한 값 입력 (SMTP/FTP 계정 등)
+
+    미리 지정된 값이 있으면 묻지 않고 사용하며, 무인 모드에서 값이 없으면 빈 문자열 반환
+    """
+    value = _preset_value(key)
+    if value is not None:
+        print(f"{message}{'*' * len(value) if 'pw' in key or 'password' in key else value}")
+        return value
+    if not RUN_SETTINGS["interactive"]:
+        print(f"{message}(무인 모드: '{key}' 값 없음)")
+        return ""
+    with TRACER.span(key, "operator"):
+        return input(message).strip()
+
+
+def confirm(message: str = "   >> (Y/N): ", key: str = None) -> bool:
+    """
+    육안 확인 질문 (Y/N)
+
+    무인 모드에서는 RUN_INPUTS[key] 또는 RUN_SETTINGS["assume_yes"]로 응답
+    """
+    answer = _preset_value(key)
+    if answer is None and not RUN_SETTINGS["interactive"]:
+        answer = "Y" if RUN_SETTINGS["assume_yes"] else "N"
+        print(f"{message}{answer} (무인 모드 자동 응답)")
+    elif answer is None:
+        with TRACER.span("confirm", "operator"):
+            answer = input(message)
+    return answer.strip().upper() == "Y"
+
+
+def wait_for_operator(message: str = ">> 준비되었으면 Enter를 누르세요..."):
+    """작업자 준비 대기 (무인 모드에서는 operator_delay만큼 대기 후 진행)"""
+    with TRACER.span(message.strip(" >.\n"), "operator"):
+        if RUN_SETTINGS["interactive"]:
+            input(message)
+            return
+        delay = RUN_SETTINGS["operator_delay"]
+        print(f"{message} (무인 모드: {delay}초 후 진행)")
+        if delay:
+            time.sleep(delay)
@@ -33,6 +33,9 @@ SCAN_AUTO_NET = "169.254.0.0/16"
 # ===========================================================
 IRAS_DEVICE_NAME = None
 
+# 스냅샷 저장 폴더 (None이면 바탕화면/TestCapture, 다중 카메라 모드에서는 카메라별 폴더)
+CAPTURE_DIR = None
+
 # ===========================================================
 # 🔧 설정 동적 업데이트 함수
 # ===========================================================
@@ -174,11 +177,157 @@ TIMEOUTS = {
     "video_connection": 180, # 영상 연결 대기 (초)
 }
 
+# ===========================================================
+# 🔌 API 클라이언트 설정
+# ===========================================================
+API_CLIENT_SETTINGS = {
+    "transport": "http",     # 기본 전송 방식 ("http"=직접 HTTP, "playwright"=브라우저 세션)
+    "pool_size": 4,          # 카메라당 keep-alive 연결 수
+    "max_concurrency": 4,    # 카메라당 동시 요청 수 (비동기 클라이언트)
+    "backoff": 2.0,          # 재시도 간격 배수 (retry_delay * backoff^n)
+    "max_retry_delay": 8,    # 재시도 간격 상한 (초)
+    "cache_ttl": 3.0,        # 읽기 캐시 유효 시간 (초, cached() 블록/enable_cache() 호출 시 적용)
+}
+
+# 스냅샷 저장 (snapshot_service.py)
+SNAPSHOT_SETTINGS = {
+    "stream_index": 1,       # videoSnapshot streamIndex
+    "chunk_size": 64 * 1024, # 파일 기록 단위 (바이트)
+    "workers": 2,            # 카메라당 백그라운드 다운로드 스레드 수
+    "timeout": 10,           # 스냅샷 1장 다운로드 타임아웃 (초)
+}
+
+# RTSP 스트림 측정 (stream_probe.py, iRAS 화면 정보 복사 대체)
+STREAM_PROBE_SETTINGS = {
+    "source": "rtsp",        # 스트림 정보 출처 ("rtsp"=RTSP 직접 측정, "iras"=iRAS 화면 정보 클립보드)
+    "url_template": "rtsp://{ip}:{port}/trackID={stream}",  # 스트림별 RTSP 주소
+    "window": 3.0,           # IPS/Mbps 측정 구간 (초)
+    "connect_timeout": 5,    # 접속/응답 타임아웃 (초)
+    "keepalive": 20,         # 장시간 측정 시 세션 유지 요청 간격 (초)
+    "ips_tolerance": 1.0,    # 스트림 검증 IPS 허용 오차
+    "verify_timeout": 15,    # 전체 스트림 동시 검증 최대 대기 (초)
+    "sample_window": 1.0,    # IPS 시계열 측정 윈도우 (초, 짧을수록 변화에 빨리 반응)
+    "sample_interval": 0.5,  # IPS 시계열 기록 간격 (초)
+    "sample_hold": 2,        # 변화 확정에 필요한 연속 샘플 수
+    "mat_latency_margin": 3.0,  # MAT IPS 감소 지연 허용 범위 (inactivityPeriod ± 초)
+}
+
+# 실패 분석용 백그라운드 스냅샷 녹화 (메모리 링 버퍼, 실패 시에만 저장)
+RECORDER_SETTINGS = {
+    "interval": 1.0,               # 스냅샷 주기 (초)
+    "max_frames": 120,             # 버퍼 최대 프레임 수
+    "max_bytes": 64 * 1024 * 1024, # 버퍼 최대 크기 (바이트)
+    "dump_seconds": 15,            # 실패 시 저장할 최근 구간 (초)
+    "folder": "failures",          # 저장 폴더 (스냅샷 저장 폴더 하위)
+}
+
+# ===========================================================
+# 🗂️ 다중 카메라 모드 설정 (main.py --inventory)
+# ===========================================================
+MULTI_DEVICE_SETTINGS = {
+    "max_workers": 4,              # 동시에 테스트할 카메라 수 (카메라별 별도 프로세스)
+    "log_dir": "logs",             # 카메라별 로그 폴더
+    "result_dir": "results",       # 결과 매트릭스(JSON) 저장 폴더
+    "default_interface": "이더넷",  # 인벤토리에 interface_name이 없을 때
+}
+
+# ===========================================================
+# 🤖 무인 실행 설정 (main.py --tests / --config, 야간 CI 실행용)
+# ===========================================================
+RUN_SETTINGS = {
+    "interactive": True,     # False면 input()으로 묻지 않음 (무인 모드)
+    "assume_yes": False,     # 무인 모드에서 육안 확인(Y/N) 질문의 응답 (False면 실패 처리)
+    "operator_delay": 0,     # 무인 모드에서 "준비되면 Enter" 대신 대기할 시간 (초)
+    "record": False,         # 실패 분석용 스냅샷 녹화 (RECORDER_SETTINGS, main.py --record)
+}
+
+# ===========================================================
+# 🧪 카메라 시뮬레이터 설정 (camera_simulator.py, 오프라인 실행/벤치마크용)
+# ===========================================================
+SIMULATOR_SETTINGS = {
+    "host": "127.0.0.1",
+    "port": 8080,
+    "username": "admin",
+    "password": "admin1234",
+    "response_latency": 0.0,  # 요청당 응답 지연 (초)
+    "apply_latency": 0.0,     # 쓰기 후 조회 값에 반영되기까지 지연 (초)
+    "reboot_time": 3.0,       # returnCode=301 이후 재부팅(응답 없음) 시간 (초)
+    "error_rate": 0.0,        # HTTP 500 응답 비율 (0~1)
+    "disconnect_rate": 0.0,   # 응답 없이 연결 끊기 비율 (0~1)
+    "seed": None,             # 장애 주입 난수 시드 (재현용)
+}
+
+# 하네스 자체 오버헤드 벤치마크 (benchmark.py, 시뮬레이터 대상)
+BENCHMARK_SETTINGS = {
+    "baseline_path": "benchmarks/baseline.json",  # 기준값 파일
+    "repeat": 3,                  # 테스트별 반복 횟수 (최소값 사용)
+    "max_call_increase": 0.10,    # API 호출 수 허용 증가율 (10%)
+    "max_overhead_increase": 0.25,  # sleep 제외 소요 시간 허용 증가율 (25%)
+    "min_overhead_delta": 0.05,   # 이보다 작은 증가(초)는 측정 오차로 무시
+}
+
+# 테스트가 실행 중에 묻는 값 (SMTP/FTP 계정 등)
+# 무인 모드에서는 여기 → 환경 변수 CAMTEST_<KEY 대문자> 순으로 찾음 (main.py --set key=value)
+RUN_INPUTS = {}
+
 # ===========================================================
 # 🎬 비디오 테스트 설정
 # ===========================================================
 VIDEO_WAIT_TIME = 5  # iRAS 영상 변화 관찰 대기 시간 (초)
 
+# 설정 반영 폴링 (VIDEO_WAIT_TIME 고정 대기 대신 반영 확인 즉시 진행)
+SETTLE_SETTINGS = {
+    "timeout": 15,        # 최대 대기 시간 (초)
+    "interval": 0.3,      # 첫 폴링 간격 (초)
+    "backoff": 1.5,       # 폴링 간격 증가 배수
+    "max_interval": 2.0,  # 최대 폴링 간격 (초)
+    "dwell": 1.0,         # 반영 확인 후 스냅샷 전 영상 안정화 여유 (초)
+}
+
+# 스냅샷 이미지 자동 검증 (image_verify.py, NumPy 필요 / JPEG 디코딩은 Pillow 필요)
+IMAGE_VERIFY_SETTINGS = {
+    "enabled": True,              # False면 이미지 검증 생략 (설정값 검증만)
+    "size": 64,                   # 비교용 축소 해상도 (정사각형 한 변, 픽셀)
+    "min_correlation": 0.6,       # 미러링/피벗: 기대 변환과의 최소 상관계수
+    "min_margin": 0.1,            # 미러링/피벗: 다른 후보 변환 대비 최소 상관계수 차이
+    "mask_fill_ratio": 0.9,       # 프라이버시 마스크: 영역 내 균일 픽셀 최소 비율
+    "mask_tolerance": 12,         # 프라이버시 마스크: 영역 중앙값과의 허용 편차 (0~255)
+    "min_luma_shift": 3.0,        # 노출: 의미 있는 평균 밝기 변화 (0~255)
+    "min_chroma_shift": 0.02,     # WB: 의미 있는 R/G, B/G 비율 변화
+    "strict": False,              # True면 밝기/색조 변화 부족도 실패 처리 (환경 영향이 커서 기본은 경고)
+    # 영상 안정화 판정 (연속 스냅샷 프레임 차이, SETTLE_SETTINGS["dwell"] 고정 대기 대체)
+    "settle_threshold": 2.0,      # 안정으로 보는 프레임 간 평균 밝기 차이 (0~255)
+    "settle_frames": 2,           # 기준 이하 차이가 연속으로 나와야 하는 횟수
+    "settle_interval": 0.2,       # 스냅샷 간격 (초)
+    "settle_timeout": 10,         # 최대 대기 시간 (초)
+}
+
+# 카메라 재탐색 (discovery.py, MAC → IP)
+DISCOVERY_SETTINGS = {
+    "arp_timeout": 0.5,       # ARP 응답 대기 (초)
+    "interval": 1.0,          # 후보 확인/ARP 스윕 반복 간격 (초)
+    "onvif_interval": 3.0,    # ONVIF WS-Discovery 반복 간격 (초)
+    "lease_window": 16,       # PC DHCP 주소 앞뒤로 우선 확인할 주소 수
+    "sweep_max_hosts": 65536, # 전체 ARP 스윕을 수행할 최대 대역 크기 (/16)
+    "sweep_pps": 20000,       # ARP 스윕 초당 요청 수 (/16 약 3초)
+    "sweep_batch": 256,       # ARP 스윕 배치 크기 (배치 사이에 응답 수신)
+    "cache_path": "results/discovery_cache.json",  # MAC → IP 탐색 기록 (실행 간 유지)
+    "cache_max_age": 30 * 24 * 3600,  # 이보다 오래된 기록은 무시 (초)
+}
+
+# 도달성 검사 (reachability.py, ping 서브프로세스 대체)
+REACHABILITY_SETTINGS = {
+    "method": "auto",         # "auto"=ICMP(raw 소켓 권한 없으면 TCP), "tcp"=웹 포트 연결만
+    "timeout": 0.5,           # 1회 검사 응답 대기 (초)
+    "interval": 0.5,          # 반복 검사 간격 (초)
+    "max_concurrency": 256,   # TCP 동시 연결 수
+}
+
+# 선언형 설정 매트릭스 (test_matrix.py)
+MATRIX_SETTINGS = {
+    "cameras": [],  # 매트릭스를 나눠 실행할 같은 모델의 추가 카메라 IP (계정은 기준 카메라와 동일, 테스트 전용 장비만)
+}
+
 # 1. Easy Video Setting (Self Adjust)
 VIDEO_PRESET_MODES = {
     "1": "Natural (자연스러운)",
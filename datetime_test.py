@@ -12,30 +12,8 @@ from playwright.sync_api import Page
 from common_actions import handle_popup
 from config import TIMEOUTS
 from api_client import CameraApiClient
-
-# ===========================================================
-# 🎨 출력 헬퍼 함수
-# ===========================================================
-
-def print_step(current: int, total: int, message: str):
-    """단계별 진행 상황 출력"""
-    print(f"\n[{current}/{total}] {message}")
-
-def print_action(message: str):
-    """액션 진행 중 메시지"""
-    print(f"   → {message}")
-
-def print_success(message: str):
-    """성공 메시지"""
-    print(f"   ✅ {message}")
-
-def print_warning(message: str):
-    """경고 메시지"""
-    print(f"   ⚠️  {message}")
-
-def print_error(message: str):
-    """에러 메시지"""
-    print(f"   ❌ {message}")
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
 
 # ===========================================================
 # ⚙️ [공통 헬퍼 함수] UI 네비게이션
@@ -103,12 +81,12 @@ def api_get_datetime(api_client: CameraApiClient, max_retries: int = None, silen
             if attempt < max_retries - 1:
                 if not silent:
                     print_warning(f"날짜/시간 조회 실패 ({attempt + 1}/{max_retries}), 재시도 중...")
-                time.sleep(TIMEOUTS.get("retry_delay", 2))
+                tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         except Exception as e:
             if attempt < max_retries - 1:
                 if not silent:
                     print_warning(f"날짜/시간 조회 에러 ({attempt + 1}/{max_retries}): {e}")
-                time.sleep(TIMEOUTS.get("retry_delay", 2))
+                tracing.sleep(TIMEOUTS.get("retry_delay", 2))
     
     if not silent:
         print_error("날짜/시간 조회 최종 실패")
@@ -142,16 +120,18 @@ def verify_datetime_value(api_client: CameraApiClient, field: str, expected_valu
                     print_success("검증 성공")
                 return True
             
+            # 불일치 값은 캐시에 남기지 않음 (다음 시도는 카메라에서 다시 조회)
+            api_client.invalidate("dateTime")
             if attempt < max_retries - 1:
                 if not silent:
                     print_warning(f"불일치 (실제: '{current_value}'), 재시도 {attempt + 1}/{max_retries}")
-                time.sleep(TIMEOUTS.get("retry_delay", 2))
+                tracing.sleep(TIMEOUTS.get("retry_delay", 2))
             else:
                 if not silent:
                     print_error(f"검증 실패: 기대='{expected_value}', 실제='{current_value}'")
         else:
             if attempt < max_retries - 1:
-                time.sleep(TIMEOUTS.get("retry_delay", 2))
+                tracing.sleep(TIMEOUTS.get("retry_delay", 2))
     
     return False
 
@@ -240,14 +220,15 @@ def run_datetime_tests(page: Page, api_client: CameraApiClient) -> Tuple[bool, s
         if not ui_save(page):
             raise Exception("저장 실패")
         
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
-        # NTP 검증
-        if not verify_datetime_value(api_client, "timeSync", "on", max_retries=3):
-            raise Exception("NTP timeSync 검증 실패")
-        
-        if not verify_datetime_value(api_client, "timeServer", TEST_SERVER, max_retries=3):
-            raise Exception("NTP timeServer 검증 실패")
+        # NTP 검증 (저장 1회에 대한 연속 조회 → 두 번째 항목은 캐시된 dateTime 응답으로 확인)
+        with api_client.cached():
+            if not verify_datetime_value(api_client, "timeSync", "on", max_retries=3):
+                raise Exception("NTP timeSync 검증 실패")
+            
+            if not verify_datetime_value(api_client, "timeServer", TEST_SERVER, max_retries=3):
+                raise Exception("NTP timeServer 검증 실패")
 
         # Step 2: Timezone 변경
         TARGET_TZ_KEYWORD = "Dublin"
@@ -262,7 +243,7 @@ def run_datetime_tests(page: Page, api_client: CameraApiClient) -> Tuple[bool, s
         if not ui_save(page):
             raise Exception("저장 실패")
         
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         if not verify_datetime_value(api_client, "timeZone", TARGET_TZ_API, max_retries=5):
             raise Exception("Timezone 검증 실패")
@@ -273,7 +254,7 @@ def run_datetime_tests(page: Page, api_client: CameraApiClient) -> Tuple[bool, s
         print(f"{'='*60}")
         if select_jquery_dropdown(page, "#timezone-button", "Seoul", silent=True):
             ui_save(page, silent=True)
-            time.sleep(TIMEOUTS.get("retry_delay", 2))
+            tracing.sleep(TIMEOUTS.get("retry_delay", 2))
             verify_datetime_value(api_client, "timeZone", "Asia_Seoul", max_retries=3, silent=True)
             print_success("복구 완료")
 
@@ -290,7 +271,7 @@ def run_datetime_tests(page: Page, api_client: CameraApiClient) -> Tuple[bool, s
         if not ui_save(page):
             raise Exception("저장 실패")
         
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         if not verify_datetime_value(api_client, "dateFormat", TARGET_DATE_API, max_retries=5):
             raise Exception("Date Format 검증 실패")
@@ -301,7 +282,7 @@ def run_datetime_tests(page: Page, api_client: CameraApiClient) -> Tuple[bool, s
         print(f"{'='*60}")
         if select_jquery_dropdown(page, "#date-format-button", "(YYYY/MM/DD)", silent=True):
             ui_save(page, silent=True)
-            time.sleep(TIMEOUTS.get("retry_delay", 2))
+            tracing.sleep(TIMEOUTS.get("retry_delay", 2))
             verify_datetime_value(api_client, "dateFormat", "YYYY/MM/DD", max_retries=3, silent=True)
             print_success("복구 완료")
 
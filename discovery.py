@@ -0,0 +1,445 @@
+"""
+카메라 재탐색 엔진 (MAC → IP)
+
+find_ip_combined의 직렬 루프(arp -a → 후보별 ping → ONVIF → ARP 스윕/스니핑)를 대체합니다.
+탐색 전략을 각각 스레드로 동시에 실행하고, 어느 하나라도 대상 MAC을 찾으면 모든 전략을 즉시 중단합니다.
+
+- candidates: 유력 주소를 유니캐스트 ARP로 매 라운드 우선 확인
+  (마지막으로 알려진 IP → ARP 캐시/ONVIF 응답 주소 → PC DHCP 주소 주변 임대 범위 → MAC 기반 Link-Local 주소)
+- onvif: WS-Discovery 응답 주소를 후보에 추가
+- sweep: scan_range 전체에 초당 sweep_pps개로 제한한 배치 ARP (Link-Local /16도 수 초 내)
+- sniff: 대상 MAC이 보내는 패킷 수동 감시
+
+IP가 바뀐 직후에도 카메라가 유력 주소에 있으면 보통 1초 안에 찾습니다.
+
+DiscoveryCache는 MAC별로 주소 체계(static/dhcp/link_local)마다 마지막으로 확인한 IP를 파일에 남겨
+다음 실행에서 유력 주소로 먼저 확인하고, 카메라 IP로 MAC을 찾을 때 브라우저 조회를 생략합니다.
+"""
+import ipaddress
+import json
+import os
+import re
+import socket
+import subprocess
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from scapy.all import ARP, Ether, conf, raw, srp, sniff
+
+import config
+from config import DISCOVERY_SETTINGS
+
+_LINK_LOCAL = ipaddress.ip_network("169.254.0.0/16")
+_INVALID_IPS = ("0.0.0.0", "255.255.255.255")
+
+_ONVIF_PROBE = (
+    b'<?xml version="1.0" encoding="UTF-8"?>'
+    b'<e:Envelope xmlns:e="http://www.w3.org/2003/05/soap-envelope" '
+    b'xmlns:w="http://schemas.xmlsoap.org/ws/2004/08/addressing" '
+    b'xmlns:d="http://schemas.xmlsoap.org/ws/2005/04/discovery" '
+    b'xmlns:dn="http://www.onvif.org/ver10/network/wsdl">'
+    b'<e:Header>'
+    b'<w:MessageID>uuid:84ede3de-7dec-11d0-c360-f01234567890</w:MessageID>'
+    b'<w:To e:mustUnderstand="true">urn:schemas-xmlsoap-org:ws:2005:04:discovery</w:To>'
+    b'<w:Action a:mustUnderstand="true">http://schemas.xmlsoap.org/ws/2005/04/discovery/Probe</w:Action>'
+    b'</e:Header>'
+    b'<e:Body><d:Probe><d:Types>dn:NetworkVideoTransmitter</d:Types></d:Probe></e:Body>'
+    b'</e:Envelope>'
+)
+
+
+def normalize_mac(mac: str) -> str:
+    if not mac: return ""
+    return mac.lower().replace("-", ":").replace(".", "")
+
+
+def link_local_hint(mac: str) -> Optional[str]:
+    """MAC 하위 2바이트로 만든 Link-Local 주소 (169.254.<b4>.<b5>, RFC 3927 범위로 보정)"""
+    parts = normalize_mac(mac).split(":")
+    if len(parts) != 6:
+        return None
+    third, fourth = int(parts[4], 16), int(parts[5], 16)
+    return f"169.254.{min(max(third, 1), 254)}.{fourth}"
+
+
+def lease_range(local_ip: Optional[str], window: int) -> List[str]:
+    """PC DHCP 주소 앞뒤 window개 (같은 /24, 가까운 순)"""
+    try:
+        local = ipaddress.ip_address(local_ip)
+    except ValueError:
+        return []
+    block = ipaddress.ip_network(f"{local_ip}/24", strict=False)
+    result = []
+    for offset in range(1, window + 1):
+        for ip in (local + offset, local - offset):
+            if ip in block and ip not in (block.network_address, block.broadcast_address):
+                result.append(str(ip))
+    return result
+
+
+def local_ip() -> Optional[str]:
+    """기본 경로 인터페이스의 PC IP (없으면 None)"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("8.8.8.8", 80))
+            return s.getsockname()[0]
+    except OSError:
+        return None
+
+
+def arp_cache(target_mac: str) -> List[str]:
+    """Windows ARP 캐시(arp -a)에서 대상 MAC의 IP 목록"""
+    target_mac_dash = normalize_mac(target_mac).replace(":", "-")
+    try:
+        out = subprocess.check_output("arp -a", shell=True).decode('cp949', errors='ignore')
+    except (OSError, subprocess.CalledProcessError):
+        return []
+    return [line.split()[0] for line in out.splitlines() if target_mac_dash in line.lower() and line.split()]
+
+
+def onvif_probe(timeout: float = 2, stop: threading.Event = None) -> List[str]:
+    """WS-Discovery Probe 응답 주소 목록 (stop이 설정되면 즉시 반환)"""
+    found_ips = set()
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
+            sock.settimeout(min(timeout, 0.2))
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.sendto(_ONVIF_PROBE, ('239.255.255.250', 3702))
+            deadline = time.monotonic() + timeout
+            while time.monotonic() < deadline and not (stop and stop.is_set()):
+                try:
+                    data, addr = sock.recvfrom(65536)
+                except socket.timeout:
+                    continue
+                resp_str = data.decode('utf-8', errors='ignore')
+                found_ips.update(re.findall(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', resp_str))
+                found_ips.add(addr[0])
+    except OSError:
+        pass
+    found_ips.discard("239.255.255.250")
+    found_ips.difference_update(_INVALID_IPS)
+    return list(found_ips)
+
+
+def arp_lookup(ip: str) -> Optional[str]:
+    """IP 1개의 MAC (ARP 응답 없으면 None)"""
+    try:
+        ans, _ = srp(Ether(dst="ff:ff:ff:ff:ff:ff")/ARP(pdst=ip), timeout=DISCOVERY_SETTINGS["arp_timeout"],
+                     verbose=0, iface=config.INTERFACE_NAME)
+    except Exception:
+        return None
+    for _, rcv in ans:
+        return normalize_mac(rcv.hwsrc)
+    return None
+
+
+def address_mode(ip: str) -> str:
+    """주소 체계 추정 (Link-Local 대역이면 link_local, 나머지는 dhcp)"""
+    return "link_local" if ipaddress.ip_address(ip) in _LINK_LOCAL else "dhcp"
+
+
+# ===========================================================
+# 💾 [Cache] MAC → IP 기록 (실행 간 유지)
+# ===========================================================
+class DiscoveryCache:
+    """
+    MAC별 마지막 주소 기록 (JSON 파일)
+        {"cameras": {"00:1c:...": {"ips": {"static": {"ip": ..., "seen": ...}, "dhcp": {...}},
+                                   "port": "80", "updated": ...}}}
+    """
+
+    MODES = ("static", "dhcp", "link_local")
+
+    def __init__(self, path: str = None):
+        self.path = path or DISCOVERY_SETTINGS["cache_path"]
+        self._lock = threading.Lock()
+        self._data = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {"cameras": {}}
+        return data if isinstance(data.get("cameras"), dict) else {"cameras": {}}
+
+    def _save(self):
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record(self, mac: str, ip: str, mode: str = None, port=None):
+        """주소 확인 기록 (mode 미지정 시 주소로 추정)"""
+        mac = normalize_mac(mac)
+        if not mac or not ip:
+            return
+        mode = mode or address_mode(ip)
+        now = time.time()
+        with self._lock:
+            entry = self._data["cameras"].setdefault(mac, {"ips": {}})
+            entry["ips"][mode] = {"ip": ip, "seen": now}
+            if port:
+                entry["port"] = str(port)
+            entry["updated"] = now
+            try:
+                self._save()
+            except OSError as e:
+                print(f"   ⚠️ 탐색 캐시 저장 실패: {e}")
+
+    def _fresh(self, item: dict) -> bool:
+        return time.time() - item.get("seen", 0) <= DISCOVERY_SETTINGS["cache_max_age"]
+
+    def candidates(self, mac: str, link_local: bool = False) -> List[str]:
+        """대역 종류에 맞는 기록 주소 (최근 확인 순)"""
+        entry = self._data["cameras"].get(normalize_mac(mac), {})
+        modes = ("link_local",) if link_local else ("dhcp", "static")
+        items = [entry.get("ips", {}).get(m) for m in modes]
+        items = sorted((i for i in items if i and self._fresh(i)), key=lambda i: -i["seen"])
+        return [i["ip"] for i in items]
+
+    def mac_for(self, ip: str) -> Optional[str]:
+        """해당 IP를 마지막으로 쓴 카메라의 MAC"""
+        best = None
+        for mac, entry in self._data["cameras"].items():
+            for item in entry.get("ips", {}).values():
+                if item.get("ip") == ip and self._fresh(item) and (best is None or item["seen"] > best[1]):
+                    best = (mac, item["seen"])
+        return best[0] if best else None
+
+
+_CACHE: Dict[str, DiscoveryCache] = {}
+
+
+def get_cache() -> DiscoveryCache:
+    """프로세스 공유 탐색 캐시 (cache_path별 1개)"""
+    path = DISCOVERY_SETTINGS["cache_path"]
+    if path not in _CACHE:
+        _CACHE[path] = DiscoveryCache(path)
+    return _CACHE[path]
+
+
+def cached_mac(ip: str) -> Optional[str]:
+    """
+    캐시에 기록된 IP의 MAC (ARP 응답 MAC과 다르면 다른 장치이므로 None)
+    ARP 응답이 없으면 캐시 값을 그대로 사용합니다.
+    """
+    mac = get_cache().mac_for(ip)
+    if not mac:
+        return None
+    actual = arp_lookup(ip)
+    return mac if actual in (None, mac) else None
+
+
+class HostBitmap:
+    """대역 내 호스트별 1비트 (이미 응답한 호스트를 다음 스윕에서 제외, /16 = 8KB)"""
+
+    def __init__(self, network):
+        self.base = int(network.network_address)
+        self.size = network.num_addresses
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def offset(self, ip: str) -> int:
+        """대역 내 위치 (대역 밖이면 -1)"""
+        offset = int(ipaddress.ip_address(ip)) - self.base
+        return offset if 0 <= offset < self.size else -1
+
+    def add(self, offset: int):
+        self._bits[offset >> 3] |= 1 << (offset & 7)
+
+    def __contains__(self, offset: int) -> bool:
+        return bool(self._bits[offset >> 3] & (1 << (offset & 7)))
+
+    def __len__(self) -> int:
+        return sum(bin(b).count("1") for b in self._bits)
+
+
+def arp_sweep(target_mac: str, network, answered: HostBitmap = None, stop: threading.Event = None,
+              pps: int = None, batch: int = None) -> Optional[str]:
+    """
+    대역 전체 ARP 스윕 (초당 pps개, batch개씩 전송 후 다음 배치까지 응답 수신)
+
+    ARP 요청은 템플릿 패킷 1개의 대상 IP 4바이트만 바꿔 보내므로 패킷 생성 비용이 없고,
+    응답한 호스트는 answered에 기록해 다음 스윕에서 건너뜁니다. 대상 MAC 응답 즉시 반환합니다.
+
+    Returns:
+        대상 MAC의 IP (못 찾았거나 stop 설정 시 None)
+    """
+    target_mac = normalize_mac(target_mac)
+    pps = pps or DISCOVERY_SETTINGS["sweep_pps"]
+    batch = batch or DISCOVERY_SETTINGS["sweep_batch"]
+    answered = answered or HostBitmap(network)
+    hosts = range(1, network.num_addresses - 1) if network.num_addresses > 2 else range(network.num_addresses)
+
+    # 첫 호스트 기준으로 출발지 MAC/IP가 채워진 템플릿 (ARP 대상 IP: 38~41번째 바이트)
+    template = bytearray(raw(Ether(dst="ff:ff:ff:ff:ff:ff")/ARP(pdst=str(network.network_address + hosts[0]))))
+    sock = conf.L2socket(iface=config.INTERFACE_NAME, filter="arp")
+
+    def _receive(until: float) -> Optional[str]:
+        while not (stop and stop.is_set()):
+            remain = until - time.monotonic()
+            if remain <= 0:
+                return None
+            if not sock.select([sock], remain):
+                continue
+            pkt = sock.recv()
+            if pkt is None or not pkt.haslayer(ARP) or pkt[ARP].op != 2:
+                continue
+            offset = answered.offset(pkt[ARP].psrc)
+            if offset >= 0:
+                answered.add(offset)
+            if normalize_mac(pkt[ARP].hwsrc) == target_mac:
+                return pkt[ARP].psrc
+        return None
+
+    try:
+        next_batch = time.monotonic()
+        for start in range(0, len(hosts), batch):
+            if stop and stop.is_set():
+                return None
+            for offset in hosts[start:start + batch]:
+                if offset in answered:
+                    continue
+                template[38:42] = (answered.base + offset).to_bytes(4, "big")
+                sock.send(bytes(template))
+            next_batch += batch / pps
+            found = _receive(next_batch)
+            if found:
+                return found
+        return _receive(time.monotonic() + DISCOVERY_SETTINGS["arp_timeout"])
+    finally:
+        sock.close()
+
+
+class DiscoveryEngine:
+    """
+    대상 MAC 1개에 대한 동시 탐색
+
+    사용 예:
+        ip = DiscoveryEngine(mac, config.SCAN_NET, hints=[last_ip]).run(timeout=20)
+    """
+
+    def __init__(self, target_mac: str, scan_range: str, hints: Iterable[str] = None):
+        self.target_mac = normalize_mac(target_mac)
+        self.network = ipaddress.ip_network(scan_range, strict=False)
+        self.link_local = self.network.overlaps(_LINK_LOCAL)
+        self.found: Optional[Tuple[str, str]] = None  # (IP, 찾은 전략)
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._extra: Dict[str, str] = {}  # 실행 중 추가된 후보 {IP: 출처}
+        self._hints = [ip for ip in (hints or []) if ip]
+
+    # --- 후보 ---
+    def _valid(self, ip: str) -> bool:
+        """탐색 대역 종류(Link-Local 여부)가 맞는 주소만 인정 (이전 주소 체계의 캐시 항목 제외)"""
+        try:
+            addr = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        if ip in _INVALID_IPS:
+            return False
+        return (addr in _LINK_LOCAL) == self.link_local
+
+    def add_candidates(self, ips: Iterable[str], source: str):
+        with self._lock:
+            for ip in ips:
+                if self._valid(ip):
+                    self._extra.setdefault(ip, source)
+
+    def candidates(self) -> List[str]:
+        """우선순위 순 후보 주소 (중복 제거)"""
+        ordered = list(self._hints)
+        with self._lock:
+            ordered.extend(self._extra)
+        if self.link_local:
+            ordered.append(link_local_hint(self.target_mac))
+        else:
+            ordered.extend(lease_range(local_ip(), DISCOVERY_SETTINGS["lease_window"]))
+        result = []
+        for ip in ordered:
+            if ip and ip not in result and self._valid(ip):
+                result.append(ip)
+        return result
+
+    def _report(self, ip: Optional[str], source: str) -> bool:
+        """발견 보고 (첫 보고만 채택, 모든 전략 중단)"""
+        if not ip or not self._valid(ip):
+            return False
+        with self._lock:
+            if self.found is None:
+                self.found = (ip, source)
+        self._stop.set()
+        return True
+
+    def _arp(self, pdst) -> Optional[str]:
+        """ARP 요청 후 대상 MAC의 응답 주소"""
+        try:
+            ans, _ = srp(Ether(dst="ff:ff:ff:ff:ff:ff")/ARP(pdst=pdst), timeout=DISCOVERY_SETTINGS["arp_timeout"],
+                         verbose=0, iface=config.INTERFACE_NAME)
+        except Exception:
+            return None
+        for _, rcv in ans:
+            if normalize_mac(rcv.hwsrc) == self.target_mac:
+                return rcv.psrc
+        return None
+
+    # --- 전략 ---
+    def _run_candidates(self):
+        while not self._stop.is_set():
+            self.add_candidates(arp_cache(self.target_mac), "arp-cache")
+            candidates = self.candidates()
+            if candidates and self._report(self._arp(candidates), "candidates"):
+                return
+            self._stop.wait(DISCOVERY_SETTINGS["interval"])
+
+    def _run_onvif(self):
+        while not self._stop.is_set():
+            self.add_candidates(onvif_probe(timeout=1, stop=self._stop), "onvif")
+            self._stop.wait(DISCOVERY_SETTINGS["onvif_interval"])
+
+    def _run_sweep(self):
+        if self.network.num_addresses > DISCOVERY_SETTINGS["sweep_max_hosts"]:
+            return
+        answered = HostBitmap(self.network)
+        while not self._stop.is_set():
+            try:
+                found = arp_sweep(self.target_mac, self.network, answered, self._stop)
+            except Exception:
+                found = None
+            if self._report(found, "arp-sweep"):
+                return
+            self._stop.wait(DISCOVERY_SETTINGS["interval"])
+
+    def _run_sniff(self):
+        def packet_handler(pkt):
+            if self._stop.is_set():
+                return True
+            if pkt.haslayer(Ether) and normalize_mac(pkt[Ether].src) == self.target_mac:
+                if pkt.haslayer(ARP):
+                    return self._report(pkt[ARP].psrc, "sniff")
+                if pkt.haslayer("IP"):
+                    return self._report(pkt["IP"].src, "sniff")
+            return False
+
+        while not self._stop.is_set():
+            try:
+                sniff(iface=config.INTERFACE_NAME, stop_filter=packet_handler, timeout=1, store=0)
+            except Exception:
+                self._stop.wait(DISCOVERY_SETTINGS["interval"])
+
+    def run(self, timeout: float) -> Optional[str]:
+        """모든 전략을 동시에 시작해 첫 발견 주소 반환 (timeout 내 미발견 시 None)"""
+        strategies = [self._run_candidates, self._run_onvif, self._run_sweep, self._run_sniff]
+        threads = [threading.Thread(target=s, daemon=True, name=f"discovery-{s.__name__[5:]}") for s in strategies]
+        for t in threads:
+            t.start()
+        self._stop.wait(timeout)
+        self._stop.set()
+        # ARP/스니핑 1회 분량만 기다리고 나머지는 백그라운드에서 종료
+        for t in threads:
+            t.join(timeout=DISCOVERY_SETTINGS["arp_timeout"])
+        return self.found[0] if self.found else None
@@ -1,78 +1,25 @@
-import time
 from playwright.sync_api import Page
-from common_actions import parse_api_response
-from iRAS_test import IRASController
-
-# ===========================================================
-# 🖨️ [출력] 표준 출력 함수
-# ===========================================================
-def print_step(step_num: int, total_steps: int, msg: str):
-    """단계 표시"""
-    print(f"\n[{step_num}/{total_steps}] {msg}")
-
-def print_action(msg: str):
-    """작업 진행 표시"""
-    print(f"   → {msg}")
-
-def print_success(msg: str = None):
-    """성공 표시"""
-    if msg:
-        print(f"   ✅ {msg}")
-    else:
-        print(f"   ✅ 완료")
-
-def print_warning(msg: str):
-    """경고 표시"""
-    print(f"   ⚠️ {msg}")
-
-def print_error(msg: str):
-    """에러 표시"""
-    print(f"   ❌ {msg}")
+from api_client import get_api_client
+from common_actions import prompt_value, confirm, wait_for_operator
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
+try:
+    from iRAS_test import IRASController
+except ImportError:
+    # iRAS 제어(pywin32/uiautomation)가 없는 환경 (Linux 시뮬레이터/벤치마크 실행)
+    IRASController = None
 
 # ===========================================================
 # ⚙️ [API] 공통 제어 함수 (GET/SET)
 # ===========================================================
 
 def _api_get(page, ip, action):
-    """API GET 요청"""
-    api_url = f"http://{ip}/cgi-bin/webSetup.cgi?action={action}&mode=1"
-    
-    try:
-        response_text = page.evaluate("""async (url) => {
-            try {
-                const response = await fetch(url);
-                if (!response.ok) return `Error: ${response.status}`;
-                return await response.text();
-            } catch (e) { return `Error: ${e.message}`; }
-        }""", api_url)
-
-        if response_text and not response_text.startswith("Error"):
-            return parse_api_response(response_text)
-        else:
-            return None
-    except Exception:
-        return None
+    """API GET 요청 (공통 API 엔진 사용)"""
+    return get_api_client(ip, page=page).get(action)
 
 def _api_set(page, ip, action, params):
-    """API SET 요청"""
-    query_str = "&".join([f"{k}={v}" for k, v in params.items()])
-    api_url = f"http://{ip}/cgi-bin/webSetup.cgi?action={action}&mode=0&{query_str}"
-    
-    try:
-        response_text = page.evaluate("""async (url) => {
-            try {
-                const response = await fetch(url, { method: 'POST' });
-                if (!response.ok) return `Error: ${response.status}`;
-                return await response.text();
-            } catch (e) { return `Error: ${e.message}`; }
-        }""", api_url)
-
-        if "returnCode=0" in response_text:
-            return True
-        else:
-            return False
-    except Exception:
-        return False
+    """API SET 요청 (공통 API 엔진 사용)"""
+    return get_api_client(ip, page=page).set(action, params)
 
 # 래퍼 함수들
 def api_get_action_alarmout(page, ip): 
@@ -154,7 +101,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
         print_error("Alarm In 이벤트 연동 실패")
         return False, "Alarm In 이벤트 연동 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     alarmout_initial_set = api_get_action_alarmout(page, camera_ip)
     if not alarmout_initial_set:
@@ -169,7 +116,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
     print("⚠️  [iRAS Status 창으로 이동]")
     print("    준비되었으면 Enter를 누르세요.")
     print("="*60)
-    input(">> 준비되었으면 Enter를 누르세요...")
+    wait_for_operator()
     
     payload = alarmout_initial_set.copy()
     payload['useAlarmOut'] = 'on'
@@ -191,7 +138,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "Alarm Out 설정 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_action("Alarm In을 NC로 변경 (이벤트 발생)")
     alarmin_payload = alarmin_initial_set.copy()
@@ -204,14 +151,14 @@ def run_alarm_out_test(page: Page, camera_ip: str):
         print("   ℹ️  Status 창에서 'Alarm Out' 표시등이 5초간 켜지는지 확인하세요")
         
         print_action("Alarm Out 동작 대기 중 (5초)...")
-        time.sleep(5)
+        tracing.sleep(5)
         
         print("\n   ℹ️  Alarm Out이 5초 동안 켜졌다가 꺼졌나요?")
         print("      - 예 (Y): 정상 동작")
         print("      - 아니오 (N): 비정상 동작")
-        user_confirm = input("   >> (Y/N): ").strip().upper()
+        user_confirm = confirm(key="confirm_alarm_out_dwell")
         
-        if user_confirm == 'Y':
+        if user_confirm:
             print_success("Dwell Time 5초 동작 확인됨")
         else:
             print_error("Dwell Time 5초 동작 확인 실패")
@@ -224,7 +171,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
     alarmin_payload['alarmType'] = 'no'
     if api_set_event_alarmin(page, camera_ip, alarmin_payload):
         print_success("Alarm In NO 복구 완료")
-        time.sleep(2)
+        tracing.sleep(2)
     else:
         print_warning("Alarm In NO 복구 실패")
     
@@ -272,7 +219,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
         
         if api_set_system_datetime(page, camera_ip, datetime_payload):
             print_success("시스템 시간 변경 완료 (11:50)")
-            time.sleep(2)
+            tracing.sleep(2)
             
             print_action("Alarm In을 NC로 변경 (이벤트 발생 시도)")
             alarmin_payload = alarmin_initial_set.copy()
@@ -284,14 +231,14 @@ def run_alarm_out_test(page: Page, camera_ip: str):
                 print_success("Alarm In NC 변경 완료")
                 print("   ℹ️  Status 창에서 Alarm Out이 켜지지 않는지 확인하세요 (비활성 시간대)")
                 
-                time.sleep(3)
+                tracing.sleep(3)
                 
                 print("\n   ℹ️  Alarm Out이 동작하지 않았나요?")
                 print("      - 예 (Y): 정상 동작 (비활성 시간대)")
                 print("      - 아니오 (N): 비정상 동작 (켜졌음)")
-                user_confirm = input("   >> (Y/N): ").strip().upper()
+                user_confirm = confirm(key="confirm_alarm_out_schedule")
                 
-                if user_confirm == 'Y':
+                if user_confirm:
                     print_success("비활성 시간대에서 Alarm Out 동작하지 않음")
                 else:
                     print_error("비활성 시간대에서 Alarm Out이 동작함")
@@ -304,7 +251,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
             alarmin_payload['alarmType'] = 'no'
             if api_set_event_alarmin(page, camera_ip, alarmin_payload):
                 print_success("Alarm In NO 복구 완료")
-                time.sleep(2)
+                tracing.sleep(2)
             else:
                 print_warning("Alarm In NO 복구 실패")
         else:
@@ -314,7 +261,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
         print_action("시스템 시간 복구 중...")
         if api_set_system_datetime(page, camera_ip, datetime_initial_set):
             print_success("시스템 시간 복구 완료")
-            time.sleep(2)
+            tracing.sleep(2)
         else:
             print_warning("시스템 시간 복구 실패 (수동으로 확인 필요)")
     
@@ -330,7 +277,7 @@ def run_alarm_out_test(page: Page, camera_ip: str):
     else:
         print_warning("Alarm In 이벤트 설정 복구 실패")
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     if failed_count == 0: 
         return True, "Alarm Out Test 성공"
@@ -351,10 +298,10 @@ def run_email_test(page: Page, camera_ip: str):
     print("   ℹ️  SMTP 서버: gw.idis.co.kr, 포트: 25, SSL/STARTTLS: 사용 안 함")
     print("")
     
-    smtp_id = input("   👉 SMTP 인증 ID를 입력하세요: ").strip()
-    smtp_pw = input("   👉 SMTP 인증 PW를 입력하세요: ").strip()
-    sender = input("   👉 보내는 사람을 입력하세요: ").strip()
-    recipient_email = input("   👉 받는 사람 이메일을 입력하세요: ").strip()
+    smtp_id = prompt_value("smtp_id", "   👉 SMTP 인증 ID를 입력하세요: ")
+    smtp_pw = prompt_value("smtp_pw", "   👉 SMTP 인증 PW를 입력하세요: ")
+    sender = prompt_value("email_sender", "   👉 보내는 사람을 입력하세요: ")
+    recipient_email = prompt_value("email_recipient", "   👉 받는 사람 이메일을 입력하세요: ")
     
     if not smtp_id or not smtp_pw or not sender or not recipient_email:
         print_error("필수 정보가 입력되지 않았습니다")
@@ -397,7 +344,7 @@ def run_email_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "Email 설정 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_step(2, 3, "Alarm In 이벤트와 Email 액션 연동")
     
@@ -422,7 +369,7 @@ def run_email_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "Alarm In 이벤트 연동 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_step(3, 3, "Email 전송 테스트")
     
@@ -434,14 +381,14 @@ def run_email_test(page: Page, camera_ip: str):
         print(f"   ℹ️  이메일이 {recipient_email}로 전송되었을 것입니다")
         
         print_action("이메일 전송 대기 중 (5초)...")
-        time.sleep(5)
+        tracing.sleep(5)
         
         print(f"\n   ℹ️  이메일을 받으셨나요? (받는 사람: {recipient_email}, 보낸 사람: {sender})")
         print("      - 예 (Y): 정상 동작")
         print("      - 아니오 (N): 비정상 동작")
-        user_confirm = input("   >> (Y/N): ").strip().upper()
+        user_confirm = confirm(key="confirm_email")
         
-        if user_confirm == 'Y':
+        if user_confirm:
             print_success("Email 전송 성공")
         else:
             print_error("Email 전송 실패 (Tip: SMTP 설정/스팸 폴더 확인)")
@@ -454,7 +401,7 @@ def run_email_test(page: Page, camera_ip: str):
     alarmin_payload['alarmType'] = 'no'
     if api_set_event_alarmin(page, camera_ip, alarmin_payload):
         print_success("Alarm In NO 복구 완료")
-        time.sleep(2)
+        tracing.sleep(2)
     else:
         print_warning("Alarm In NO 복구 실패")
     
@@ -470,7 +417,7 @@ def run_email_test(page: Page, camera_ip: str):
     else:
         print_warning("Alarm In 이벤트 설정 복구 실패")
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     if failed_count == 0: 
         return True, "Email Test 성공"
@@ -491,10 +438,10 @@ def run_ftp_test(page: Page, camera_ip: str):
     print("   ℹ️  포트: 21, 업로드 타입: event")
     print("")
     
-    ftp_server = input("   👉 FTP 서버 주소를 입력하세요: ").strip()
-    ftp_path = input("   👉 업로드 경로를 입력하세요 (예: /upload/camera1): ").strip()
-    ftp_user = input("   👉 FTP 사용자 ID를 입력하세요: ").strip()
-    ftp_password = input("   👉 FTP 비밀번호를 입력하세요: ").strip()
+    ftp_server = prompt_value("ftp_server", "   👉 FTP 서버 주소를 입력하세요: ")
+    ftp_path = prompt_value("ftp_path", "   👉 업로드 경로를 입력하세요 (예: /upload/camera1): ")
+    ftp_user = prompt_value("ftp_user", "   👉 FTP 사용자 ID를 입력하세요: ")
+    ftp_password = prompt_value("ftp_password", "   👉 FTP 비밀번호를 입력하세요: ")
     
     if not ftp_server or not ftp_path or not ftp_user or not ftp_password:
         print_error("필수 정보가 입력되지 않았습니다")
@@ -552,7 +499,7 @@ def run_ftp_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "FTP 설정 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_step(2, 3, "Alarm In 이벤트와 FTP 액션 연동")
     
@@ -578,7 +525,7 @@ def run_ftp_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "Alarm In 이벤트 연동 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_step(3, 3, "FTP 업로드 테스트")
     print("   ℹ️  Alarm In을 NC로 변경하여 이벤트를 발생시키고 FTP 업로드를 시작합니다.")
@@ -596,11 +543,11 @@ def run_ftp_test(page: Page, camera_ip: str):
         
         # FTP 업로드 대기 (duration=5sec)
         print("\n   ⏳ FTP 업로드 대기 중 (5초)...")
-        time.sleep(5)
+        tracing.sleep(5)
         
         # 추가 대기 (업로드 완료 확인)
         print("   ⏳ 업로드 완료 대기 중 (2초 추가)...")
-        time.sleep(2)
+        tracing.sleep(2)
         
         print("\n   ℹ️  FTP 서버에서 파일을 확인해주세요.")
         print(f"      - 경로: {ftp_path}")
@@ -608,9 +555,9 @@ def run_ftp_test(page: Page, camera_ip: str):
         print("\n   ℹ️  FTP 서버에 파일이 업로드되었나요?")
         print("      - 예 (Y): 정상 동작")
         print("      - 아니오 (N): 비정상 동작")
-        user_confirm = input("   >> (Y/N): ").strip().upper()
+        user_confirm = confirm(key="confirm_ftp")
         
-        if user_confirm == 'Y':
+        if user_confirm:
             print("   ✅ Pass: FTP 업로드 성공")
         else:
             print("   ❌ Fail: FTP 업로드 실패")
@@ -625,7 +572,7 @@ def run_ftp_test(page: Page, camera_ip: str):
     alarmin_payload['alarmType'] = 'no'
     if api_set_event_alarmin(page, camera_ip, alarmin_payload):
         print("   ✅ Alarm In NO 복구 완료")
-        time.sleep(2)
+        tracing.sleep(2)
     else:
         print("   ⚠️ Alarm In NO 복구 실패")
     
@@ -646,7 +593,7 @@ def run_ftp_test(page: Page, camera_ip: str):
     else:
         print("   ⚠️ Alarm In 이벤트 설정 복구 실패")
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     # ---------------------------------------------------------
     # [최종 결과]
@@ -749,7 +696,7 @@ def run_recording_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "SD Recording 설정 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_step(2, 4, "시스템 시간을 이벤트 녹화 구간으로 변경")
     
@@ -779,7 +726,7 @@ def run_recording_test(page: Page, camera_ip: str):
         
         if api_set_system_datetime(page, camera_ip, datetime_payload):
             print("   ✅ 시스템 시간 변경 완료 (14:30) - 이벤트 녹화 구간 내")
-            time.sleep(2)
+            tracing.sleep(2)
         else:
             print("   ❌ 시스템 시간 변경 실패")
             failed_count += 1
@@ -808,7 +755,7 @@ def run_recording_test(page: Page, camera_ip: str):
         failed_count += 1
         return False, "Alarm In 이벤트 연동 실패"
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     print_step(4, 4, "이벤트 녹화 테스트")
     print("   ℹ️  Alarm In을 NC로 변경하여 이벤트를 발생시키고 SD 녹화를 시작합니다.")
@@ -825,7 +772,7 @@ def run_recording_test(page: Page, camera_ip: str):
         
         # 이벤트 녹화 대기 (Pre + Event + Post)
         print("\n   ⏳ 이벤트 녹화 대기 중 (15초)...")
-        time.sleep(15)
+        tracing.sleep(15)
         
         print("\n   ℹ️  SD 카드에서 녹화 파일을 확인해주세요.")
         print(f"      - 녹화 시간: 14:30 경")
@@ -834,9 +781,9 @@ def run_recording_test(page: Page, camera_ip: str):
         print("      (카메라 웹 UI 또는 SD 카드를 직접 확인)")
         print("      - 예 (Y): 정상 동작")
         print("      - 아니오 (N): 비정상 동작")
-        user_confirm = input("   >> (Y/N): ").strip().upper()
+        user_confirm = confirm(key="confirm_recording")
         
-        if user_confirm == 'Y':
+        if user_confirm:
             print("   ✅ Pass: 이벤트 녹화 성공")
         else:
             print("   ❌ Fail: 이벤트 녹화 실패")
@@ -851,7 +798,7 @@ def run_recording_test(page: Page, camera_ip: str):
     alarmin_payload['alarmType'] = 'no'
     if api_set_event_alarmin(page, camera_ip, alarmin_payload):
         print("   ✅ Alarm In NO 복구 완료")
-        time.sleep(2)
+        tracing.sleep(2)
     else:
         print("   ⚠️ Alarm In NO 복구 실패")
     
@@ -865,7 +812,7 @@ def run_recording_test(page: Page, camera_ip: str):
         print("   🔄 시스템 시간 복구")
         if api_set_system_datetime(page, camera_ip, datetime_initial_set):
             print("   ✅ 시스템 시간 복구 완료")
-            time.sleep(2)
+            tracing.sleep(2)
         else:
             print("   ⚠️ 시스템 시간 복구 실패 (수동으로 확인 필요)")
     
@@ -881,7 +828,7 @@ def run_recording_test(page: Page, camera_ip: str):
     else:
         print("   ⚠️ Alarm In 이벤트 설정 복구 실패")
     
-    time.sleep(2)
+    tracing.sleep(2)
     
     # ---------------------------------------------------------
     # [최종 결과]
@@ -1,4 +1,3 @@
-import time
 import ctypes
 import win32gui
 import win32com.client
@@ -8,6 +7,8 @@ import win32clipboard
 import uiautomation as auto
 import re
 import msvcrt
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
 from config import (
     IRAS_TITLES, IRAS_IDS, IRAS_COORDS, IRAS_TABS,
     IRAS_DELAYS, IRAS_SURVEILLANCE_OFFSETS, IRAS_KEYS, TIMEOUTS
@@ -19,32 +20,6 @@ try:
 except: 
     pass
 
-# ===========================================================
-# 🖨️ [출력] 표준 출력 함수
-# ===========================================================
-def print_step(step_num: int, total_steps: int, msg: str):
-    """단계 표시"""
-    print(f"\n[{step_num}/{total_steps}] {msg}")
-
-def print_action(msg: str):
-    """작업 진행 표시"""
-    print(f"   → {msg}")
-
-def print_success(msg: str = None):
-    """성공 표시"""
-    if msg:
-        print(f"   ✅ {msg}")
-    else:
-        print(f"   ✅ 완료")
-
-def print_warning(msg: str):
-    """경고 표시"""
-    print(f"   ⚠️ {msg}")
-
-def print_error(msg: str):
-    """에러 표시"""
-    print(f"   ❌ {msg}")
-
 # ===========================================================
 # 🤖 [Class] iRAS 컨트롤러
 # ===========================================================
@@ -77,7 +52,7 @@ class IRASController:
                     if use_alt:
                         self.shell.SendKeys('%')
                     win32gui.SetForegroundWindow(hwnd)
-                    time.sleep(IRAS_DELAYS["focus"])
+                    tracing.sleep(IRAS_DELAYS["focus"])
                     # UIA를 통한 2차 포커스 시도
                     if not use_alt:
                         rect = win32gui.GetWindowRect(hwnd)
@@ -90,7 +65,7 @@ class IRASController:
                         win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
                         win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
                         win32api.SetCursorPos(current_pos) # 마우스 원위치
-                        time.sleep(IRAS_DELAYS["focus"])
+                        tracing.sleep(IRAS_DELAYS["focus"])
 
                     try: 
                         auto.ControlFromHandle(hwnd).SetFocus()
@@ -114,12 +89,12 @@ class IRASController:
         try:
             if is_ctrl:
                 win32api.keybd_event(IRAS_KEYS["ctrl"], 0, 0, 0)
-                time.sleep(IRAS_DELAYS["key"])
+                tracing.sleep(IRAS_DELAYS["key"])
             
             win32api.keybd_event(key_code, 0, 0, 0)
-            time.sleep(IRAS_DELAYS["key"])
+            tracing.sleep(IRAS_DELAYS["key"])
             win32api.keybd_event(key_code, 0, win32con.KEYEVENTF_KEYUP, 0)
-            time.sleep(IRAS_DELAYS["key"])
+            tracing.sleep(IRAS_DELAYS["key"])
             
             if is_ctrl:
                 win32api.keybd_event(IRAS_KEYS["ctrl"], 0, win32con.KEYEVENTF_KEYUP, 0)
@@ -127,16 +102,18 @@ class IRASController:
         except Exception:
             return False
 
+    @tracing.traced("iras")
     def _copy_debug_info(self, hwnd, y_offset=None):
         """감시 화면에서 디버그 정보 복사 (우클릭 + 마우스 이동 + C)"""
         offset = y_offset or IRAS_SURVEILLANCE_OFFSETS["right_click_top"] 
         if self._click(hwnd, IRAS_IDS["surveillance_pane"], right_click=True, y_offset=offset):
-            time.sleep(IRAS_DELAYS["menu_navigate"])
+            tracing.sleep(IRAS_DELAYS["menu_navigate"])
             self._send_key(IRAS_KEYS["c"])
-            time.sleep(IRAS_DELAYS["clipboard_copy"])
+            tracing.sleep(IRAS_DELAYS["clipboard_copy"])
             return True
         return False
 
+    @tracing.traced("iras")
     def save_snapshot(self):
         """iRAS 스냅샷 저장을 위한 Ctrl+S 키 입력"""
         result = self._send_key(IRAS_KEYS["s"], is_ctrl=True)
@@ -156,20 +133,20 @@ class IRASController:
             cy = int(rect.top + y_offset) if y_offset is not None else int((rect.top + rect.bottom) / 2)
 
             win32api.SetCursorPos((cx, cy))
-            time.sleep(IRAS_DELAYS["click"])
+            tracing.sleep(IRAS_DELAYS["click"])
             
             if right_click:
                 # 우클릭 전 좌클릭으로 포커스 확보
                 win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-                time.sleep(IRAS_DELAYS["key"])
+                tracing.sleep(IRAS_DELAYS["key"])
                 win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
-                time.sleep(IRAS_DELAYS["focus"])
+                tracing.sleep(IRAS_DELAYS["focus"])
                 win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTDOWN, 0, 0, 0, 0)
-                time.sleep(IRAS_DELAYS["key"])
+                tracing.sleep(IRAS_DELAYS["key"])
                 win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTUP, 0, 0, 0, 0)
             else:
                 win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-                time.sleep(IRAS_DELAYS["key"])
+                tracing.sleep(IRAS_DELAYS["key"])
                 win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
             return True
         except: 
@@ -178,9 +155,9 @@ class IRASController:
     def _input(self, hwnd, auto_id, text):
         """입력 필드 값 넣기"""
         if self._click(hwnd, auto_id):
-            time.sleep(IRAS_DELAYS["input"])
+            tracing.sleep(IRAS_DELAYS["input"])
             self.shell.SendKeys("^a{BACKSPACE}")
-            time.sleep(IRAS_DELAYS["key"])
+            tracing.sleep(IRAS_DELAYS["key"])
             try:
                 win32clipboard.OpenClipboard()
                 win32clipboard.EmptyClipboard()
@@ -196,9 +173,9 @@ class IRASController:
         """상대 좌표 클릭"""
         cx, cy = win32api.GetCursorPos()
         win32api.SetCursorPos((cx + dx, cy + dy))
-        time.sleep(IRAS_DELAYS["click"])
+        tracing.sleep(IRAS_DELAYS["click"])
         win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-        time.sleep(IRAS_DELAYS["key"])
+        tracing.sleep(IRAS_DELAYS["key"])
         win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
     
     def _right_click_surveillance(self, main_hwnd, offset=None):
@@ -206,6 +183,7 @@ class IRASController:
         offset = offset or IRAS_SURVEILLANCE_OFFSETS["right_click_top"]
         return self._click(main_hwnd, IRAS_IDS["surveillance_pane"], right_click=True, y_offset=offset)
 
+    @tracing.traced("iras")
     def switch_stream(self, stream_number):
         """iRAS 화면에서 우클릭 메뉴를 통해 스트림 전환 (stream_number: 1~4)"""
         try:
@@ -219,11 +197,11 @@ class IRASController:
                 return False
             
             self._click_relative(*IRAS_COORDS["multi_stream"])
-            time.sleep(IRAS_DELAYS["menu_navigate"])
+            tracing.sleep(IRAS_DELAYS["menu_navigate"])
             
             stream_key = f"multi_stream_{stream_number}"
             self._click_relative(*IRAS_COORDS[stream_key])
-            time.sleep(IRAS_DELAYS["window_open"])
+            tracing.sleep(IRAS_DELAYS["window_open"])
             
             return True
         except Exception as e:
@@ -236,23 +214,24 @@ class IRASController:
             self._click(hwnd, auto_id)
         else:
             self._click(hwnd, IRAS_IDS["ok_btn"])
-        time.sleep(IRAS_DELAYS["window_close"])
+        tracing.sleep(IRAS_DELAYS["window_close"])
 
+    @tracing.traced("iras")
     def _enter_setup(self):
         """메인화면 -> 시스템(S) -> 설정(i) 진입"""
         main_hwnd = self._get_handle(IRAS_TITLES["main"], force_focus=True)
         if not main_hwnd: 
             print_error("iRAS 메인 창을 찾을 수 없습니다")
             return None
-        time.sleep(IRAS_DELAYS["menu_navigate"])
+        tracing.sleep(IRAS_DELAYS["menu_navigate"])
         self.shell.SendKeys("%s")
-        time.sleep(IRAS_DELAYS["menu_navigate"])
+        tracing.sleep(IRAS_DELAYS["menu_navigate"])
         self.shell.SendKeys("i")
-        time.sleep(IRAS_DELAYS["menu_navigate"])
+        tracing.sleep(IRAS_DELAYS["menu_navigate"])
         self.shell.SendKeys("{ENTER}")
-        time.sleep(IRAS_DELAYS["menu_navigate"])
+        tracing.sleep(IRAS_DELAYS["menu_navigate"])
         self.shell.SendKeys("{ENTER}")
-        time.sleep(IRAS_DELAYS["window_open"])
+        tracing.sleep(IRAS_DELAYS["window_open"])
         
         setup_hwnd = self._get_handle(IRAS_TITLES["setup"])
         if setup_hwnd: 
@@ -260,6 +239,7 @@ class IRASController:
         print_error("설정 창이 열리지 않았습니다")
         return None
 
+    @tracing.traced("iras")
     def _return_to_watch(self):
         """감시 탭 복귀"""
         main_hwnd = self._get_handle(IRAS_TITLES["main"])
@@ -283,7 +263,7 @@ class IRASController:
                 network_tab = tab_control.TabItemControl(Name=IRAS_TABS["network_name"])
                 if network_tab.Exists(maxSearchSeconds=1):
                     network_tab.Click()
-                    time.sleep(IRAS_DELAYS["tab_switch"])
+                    tracing.sleep(IRAS_DELAYS["tab_switch"])
                     return True
                 
                 # 2. 오프셋으로 찾기 (두 번째 탭 가정)
@@ -294,12 +274,13 @@ class IRASController:
                 win32api.SetCursorPos((int(click_x), int(click_y)))
                 win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
                 win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
-                time.sleep(IRAS_DELAYS["tab_switch"])
+                tracing.sleep(IRAS_DELAYS["tab_switch"])
                 return True
         except: 
             return False
         return False
     
+    @tracing.traced("iras")
     def wait_for_video_attachment(self, timeout=None, max_retries=3):
         """스킵 가능한 영상 연결 대기 (재시도 지원)"""
         timeout = timeout or TIMEOUTS["video_connection"]
@@ -323,7 +304,7 @@ class IRASController:
                         video_detected = True
                         break
 
-                time.sleep(1)
+                tracing.sleep(1)
                 remaining = timeout - i
                 
                 if remaining % 10 == 0:
@@ -339,7 +320,7 @@ class IRASController:
                 if attempt < max_retries:
                     print(f"\n")
                     print_warning(f"타임아웃 ({timeout}초 경과). 재시도 중...")
-                    time.sleep(3)
+                    tracing.sleep(3)
                 else:
                     print(f"\n")
                     print_error("영상 연결 실패 (최대 재시도 횟수 초과)")
@@ -351,10 +332,11 @@ class IRASController:
         """권한 테스트 액션 공통 처리"""
         self._click_relative(*IRAS_COORDS[coord_key])
         wait = wait_time or IRAS_DELAYS["permission_action"]
-        time.sleep(wait)
+        tracing.sleep(wait)
         self.shell.SendKeys("{ENTER}")
-        time.sleep(IRAS_DELAYS["permission_result"])
+        tracing.sleep(IRAS_DELAYS["permission_result"])
 
+    @tracing.traced("iras")
     def run_permission_phase1(self, device_name):
         """권한 테스트 Phase 1: 기능 차단 테스트"""
         print_action("FW 업그레이드 차단 테스트 중...")
@@ -378,21 +360,21 @@ class IRASController:
         print_action("알람 출력 차단 테스트 중...")
         if self._right_click_surveillance(main_hwnd):
             self._click_relative(*IRAS_COORDS["menu_alarm"])
-            time.sleep(IRAS_DELAYS["menu_navigate"])
+            tracing.sleep(IRAS_DELAYS["menu_navigate"])
             self._click_relative(*IRAS_COORDS["alarm_on"])
             self._handle_permission_action("menu_alarm")
 
         print_action("클립 카피 차단 테스트 중...")
         if self._right_click_surveillance(main_hwnd):
             self._click_relative(*IRAS_COORDS["menu_playback"])
-            time.sleep(IRAS_DELAYS["playback_load"])
+            tracing.sleep(IRAS_DELAYS["playback_load"])
             
             if self._click(main_hwnd, IRAS_IDS["save_clip_btn"]):
-                time.sleep(IRAS_DELAYS["menu_navigate"])
+                tracing.sleep(IRAS_DELAYS["menu_navigate"])
                 self._click_relative(*IRAS_COORDS["clip_copy"])
-                time.sleep(IRAS_DELAYS["test_popup"])
+                tracing.sleep(IRAS_DELAYS["test_popup"])
                 self.shell.SendKeys("{ENTER}")
-                time.sleep(IRAS_DELAYS["permission_result"])
+                tracing.sleep(IRAS_DELAYS["permission_result"])
                 self._return_to_watch()
             
         print_success("Phase 1 완료")
@@ -400,6 +382,7 @@ class IRASController:
     
     
 
+    @tracing.traced("iras")
     def run_permission_phase2(self, device_name):
         """권한 테스트 Phase 2: 설정/검색 차단 테스트"""
         print_action("원격 설정 차단 테스트 중...")
@@ -409,21 +392,22 @@ class IRASController:
             if self._click(setup_hwnd, IRAS_IDS["dev_list"], right_click=True, 
                           y_offset=IRAS_SURVEILLANCE_OFFSETS["device_list"]):
                 self._click_relative(*IRAS_COORDS["menu_remote"])
-                time.sleep(IRAS_DELAYS["block_popup"])
+                tracing.sleep(IRAS_DELAYS["block_popup"])
             self._close_window(setup_hwnd)
 
         print_action("검색(재생) 차단 테스트 중...")
         main_hwnd = self._get_handle(IRAS_TITLES["main"], force_focus=True)
         if main_hwnd and self._right_click_surveillance(main_hwnd):
             self._click_relative(*IRAS_COORDS["menu_playback"])
-            time.sleep(IRAS_DELAYS["test_popup"])
+            tracing.sleep(IRAS_DELAYS["test_popup"])
             self.shell.SendKeys("{ENTER}")
-            time.sleep(IRAS_DELAYS["permission_result"])
+            tracing.sleep(IRAS_DELAYS["permission_result"])
             self._return_to_watch()
 
         print_success("Phase 2 완료")
         return True
 
+    @tracing.traced("iras")
     def setup_fen(self, device_search_key, fen_name):
         """iRAS에서 장치를 검색하고 FEN 정보를 입력하여 연결 테스트를 수행"""
         print_action(f"FEN 설정 시작 (검색어: {device_search_key}, FEN: {fen_name})")
@@ -434,12 +418,12 @@ class IRASController:
 
         print_action("장치 검색 중...")
         self._input(setup_hwnd, IRAS_IDS["dev_search_input"], device_search_key)
-        time.sleep(IRAS_DELAYS["device_search"])
+        tracing.sleep(IRAS_DELAYS["device_search"])
         
         if self._click(setup_hwnd, IRAS_IDS["dev_list"], right_click=True, 
                       y_offset=IRAS_SURVEILLANCE_OFFSETS["device_list"]):
             self._click_relative(*IRAS_COORDS["menu_modify"])
-            time.sleep(IRAS_DELAYS["device_modify"])
+            tracing.sleep(IRAS_DELAYS["device_modify"])
         else:
             print_error("장치 리스트 클릭 실패")
             self._close_window(setup_hwnd)
@@ -458,7 +442,7 @@ class IRASController:
             combo = win.ComboBoxControl(AutomationId=IRAS_IDS["addr_type_combo"])
             if combo.Exists(maxSearchSeconds=2):
                 combo.Click()
-                time.sleep(IRAS_DELAYS["combo_select"])
+                tracing.sleep(IRAS_DELAYS["combo_select"])
                 fen_item = auto.ListItemControl(Name="FEN")
                 if fen_item.Exists(maxSearchSeconds=1): 
                     fen_item.Click()
@@ -476,9 +460,9 @@ class IRASController:
 
         print_action("연결 테스트 실행 중...")
         if self._click(modify_hwnd, IRAS_IDS["test_btn"]):
-            time.sleep(IRAS_DELAYS["test_response"])
+            tracing.sleep(IRAS_DELAYS["test_response"])
             self.shell.SendKeys("{ENTER}")
-            time.sleep(IRAS_DELAYS["test_popup"])
+            tracing.sleep(IRAS_DELAYS["test_popup"])
 
         print_action("저장 및 종료 중...")
         self._close_window(modify_hwnd)
@@ -486,6 +470,7 @@ class IRASController:
         print_success("FEN 설정 완료")
         return True
 
+    @tracing.traced("iras")
     def verify_connection(self, expected_mode="TcpDirectExternal"):
         """감시 화면 우클릭 -> 'c' 입력 -> 클립보드 확인"""
         print_action(f"연결 모드 검증 중: '{expected_mode}'")
@@ -528,6 +513,7 @@ class IRASController:
 
         return False
     
+    @tracing.traced("iras")
     def get_current_ips(self):
         """감시 화면에서 우클릭 + 'c'를 눌러 클립보드 정보 중 IPS 값을 추출"""
         main_hwnd = self._get_handle(IRAS_TITLES["main"], force_focus=True)
@@ -574,6 +560,7 @@ class IRASController:
                 pass
         return -1
     
+    @tracing.traced("iras")
     def get_current_ssl_info(self):
         """감시 화면에서 우클릭 + 'c' -> 클립보드 복사 -> SSL 정보 파싱"""
         main_hwnd = self._get_handle(IRAS_TITLES["main"], force_focus=True)
@@ -620,6 +607,7 @@ class IRASController:
                 pass
         return None
     
+    @tracing.traced("iras")
     def restore_ip_connection(self, device_search_key, target_ip):
         """FEN -> 고정 IP 연결 복구"""
         print_action(f"고정 IP 연결 복구 시작 (Target: {target_ip})")
@@ -628,12 +616,12 @@ class IRASController:
             return False
 
         self._input(setup_hwnd, IRAS_IDS["dev_search_input"], device_search_key)
-        time.sleep(IRAS_DELAYS["device_search"])
+        tracing.sleep(IRAS_DELAYS["device_search"])
         
         if self._click(setup_hwnd, IRAS_IDS["dev_list"], right_click=True, 
                       y_offset=IRAS_SURVEILLANCE_OFFSETS["device_list"]):
             self._click_relative(*IRAS_COORDS["menu_modify"])
-            time.sleep(IRAS_DELAYS["device_modify"])
+            tracing.sleep(IRAS_DELAYS["device_modify"])
         else:
             self._close_window(setup_hwnd)
             return False
@@ -651,11 +639,11 @@ class IRASController:
             combo = win.ComboBoxControl(AutomationId=IRAS_IDS["addr_type_combo"])
             if combo.Exists(maxSearchSeconds=2):
                 combo.Click()
-                time.sleep(IRAS_DELAYS["combo_select"])
+                tracing.sleep(IRAS_DELAYS["combo_select"])
                 ip_item = auto.ListItemControl(Name="IP 주소")
                 if ip_item.Exists(maxSearchSeconds=2): 
                     ip_item.Click()
-                    time.sleep(IRAS_DELAYS["combo_select"])
+                    tracing.sleep(IRAS_DELAYS["combo_select"])
         except: 
             pass
 
@@ -668,21 +656,21 @@ class IRASController:
                 edit = win.EditControl(AutomationId=field_id)
                 if edit.Exists(maxSearchSeconds=1):
                     edit.Click()
-                    time.sleep(IRAS_DELAYS["input"])
+                    tracing.sleep(IRAS_DELAYS["input"])
                     
                     self.shell.SendKeys("^a")
-                    time.sleep(IRAS_DELAYS["key"])
+                    tracing.sleep(IRAS_DELAYS["key"])
                     self.shell.SendKeys("{BACKSPACE}")
-                    time.sleep(IRAS_DELAYS["input"])
+                    tracing.sleep(IRAS_DELAYS["input"])
                     
                     part_str = str(part)
                     for char in part_str:
                         self.shell.SendKeys(char)
-                        time.sleep(IRAS_DELAYS["key"] * 0.5)
+                        tracing.sleep(IRAS_DELAYS["key"] * 0.5)
                     
-                    time.sleep(IRAS_DELAYS["click"])
+                    tracing.sleep(IRAS_DELAYS["click"])
                     self.shell.SendKeys("{TAB}")
-                    time.sleep(IRAS_DELAYS["input"])
+                    tracing.sleep(IRAS_DELAYS["input"])
                 else:
                     print_warning(f"입력칸 {field_id}를 찾을 수 없습니다")
             except Exception as e:
@@ -690,9 +678,9 @@ class IRASController:
 
         print_action("연결 테스트 실행 중...")
         if self._click(modify_hwnd, IRAS_IDS["test_btn"]):
-            time.sleep(IRAS_DELAYS["test_response"])
+            tracing.sleep(IRAS_DELAYS["test_response"])
             self.shell.SendKeys("{ENTER}")
-            time.sleep(IRAS_DELAYS["test_popup"])
+            tracing.sleep(IRAS_DELAYS["test_popup"])
 
         print_action("저장 및 종료 중...")
         self._close_window(modify_hwnd)
@@ -700,20 +688,21 @@ class IRASController:
         print_success("IP 연결 복구 완료")
         return True
     
+    @tracing.traced("iras")
     def update_device_credentials(self, device_name, user_id, user_pw):
         """장치 계정 정보 업데이트"""
         setup_hwnd = self._enter_setup()
         if not setup_hwnd: 
             return False
 
-        time.sleep(IRAS_DELAYS["device_search"])
+        tracing.sleep(IRAS_DELAYS["device_search"])
         self._input(setup_hwnd, IRAS_IDS["dev_search_input"], device_name)
-        time.sleep(IRAS_DELAYS["device_search"])
+        tracing.sleep(IRAS_DELAYS["device_search"])
         
         if self._click(setup_hwnd, IRAS_IDS["dev_list"], right_click=True, 
                       y_offset=IRAS_SURVEILLANCE_OFFSETS["device_list"]):
             self._click_relative(*IRAS_COORDS["menu_modify"])
-            time.sleep(IRAS_DELAYS["device_modify"])
+            tracing.sleep(IRAS_DELAYS["device_modify"])
         else:
             self._close_window(setup_hwnd)
             return False
@@ -728,15 +717,15 @@ class IRASController:
 
             print_action(f"계정 정보 업데이트 중: {user_id}")
             self._input(modify_hwnd, IRAS_IDS["user_id_input"], user_id)
-            time.sleep(IRAS_DELAYS["combo_select"])
+            tracing.sleep(IRAS_DELAYS["combo_select"])
             self._input(modify_hwnd, IRAS_IDS["user_pw_input"], user_pw)
-            time.sleep(IRAS_DELAYS["combo_select"])
+            tracing.sleep(IRAS_DELAYS["combo_select"])
             
             print_action("연결 테스트 실행 중...")
             if self._click(modify_hwnd, IRAS_IDS["test_btn"]):
-                time.sleep(IRAS_DELAYS["test_popup"])
+                tracing.sleep(IRAS_DELAYS["test_popup"])
                 self.shell.SendKeys("{ENTER}")
-                time.sleep(IRAS_DELAYS["permission_result"])
+                tracing.sleep(IRAS_DELAYS["permission_result"])
             
         except Exception as e:
             print_warning(f"계정 변경 중 오류: {e}")
@@ -758,7 +747,7 @@ def run_fen_setup_process(device_name_to_search, fen_name):
         print_error("FEN 설정 중 오류 발생")
         return False
     
-    time.sleep(2.0)
+    tracing.sleep(2.0)
     return True
 
 def run_fen_verification(expected_mode="TcpDirectExternal"):
@@ -784,7 +773,7 @@ def run_port_change_process(device_name, target_port, target_ip="10.0.131.104"):
             return False
         
         setting_window.SetFocus()
-        time.sleep(IRAS_DELAYS["menu_navigate"])
+        tracing.sleep(IRAS_DELAYS["menu_navigate"])
 
         print_action("'+' 버튼 클릭 (장치 검색 진입)...")
         plus_btn = setting_window.ButtonControl(AutomationId=IRAS_IDS["plus_btn"], Name="+")
@@ -792,7 +781,7 @@ def run_port_change_process(device_name, target_port, target_ip="10.0.131.104"):
             print_error("'+' 버튼을 찾을 수 없습니다")
             return False
         plus_btn.Click()
-        time.sleep(IRAS_DELAYS["device_search"])
+        tracing.sleep(IRAS_DELAYS["device_search"])
 
         search_dialog = setting_window.WindowControl(searchDepth=1, Name=IRAS_TITLES["search"])
         if not search_dialog.Exists(3):
@@ -818,12 +807,12 @@ def run_port_change_process(device_name, target_port, target_ip="10.0.131.104"):
                 end_edit.SendKeys('{Ctrl}a{Delete}')
                 end_edit.SendKeys(ip_parts[i])
                 
-        time.sleep(IRAS_DELAYS["combo_select"])
+        tracing.sleep(IRAS_DELAYS["combo_select"])
 
         print_action("포트 설정 대화상자 열기...")
         port_btn = search_dialog.ButtonControl(AutomationId=IRAS_IDS["port_btn"], Name="포트...")
         port_btn.Click()
-        time.sleep(IRAS_DELAYS["device_search"])
+        tracing.sleep(IRAS_DELAYS["device_search"])
 
         port_dialog = search_dialog.WindowControl(searchDepth=1, Name=IRAS_TITLES["port_setting"])
         if not port_dialog.Exists(3):
@@ -839,16 +828,16 @@ def run_port_change_process(device_name, target_port, target_ip="10.0.131.104"):
         else:
             print_warning("포트 입력창을 찾을 수 없습니다")
         
-        time.sleep(IRAS_DELAYS["combo_select"])
+        tracing.sleep(IRAS_DELAYS["combo_select"])
         port_dialog.ButtonControl(AutomationId=IRAS_IDS["ok_btn"], Name="확인").Click()
-        time.sleep(IRAS_DELAYS["combo_select"])
+        tracing.sleep(IRAS_DELAYS["combo_select"])
 
         print_action("검색 시작 및 결과 검증 중...")
         search_dialog.ButtonControl(AutomationId=IRAS_IDS["search_start_btn"], Name="검색 시작").Click()
         
         found_device = False
         for _ in range(IRAS_DELAYS["search_timeout"]):
-            time.sleep(IRAS_DELAYS["search_result"])
+            tracing.sleep(IRAS_DELAYS["search_result"])
             print(".", end="", flush=True)
             result_text_ctrl = search_dialog.TextControl(AutomationId=IRAS_IDS["search_result_text"])
             if result_text_ctrl.Exists(0.5):
@@ -926,7 +915,7 @@ def run_iras_permission_check(device_name_to_search, user_id, user_pw, phase=1):
             return False, "계정 변경 및 로그인 실패"
         
         print_action("설정 적용 대기 (5초)...")
-        time.sleep(5)
+        tracing.sleep(5)
     else:
         print_action(f"계정 변경 스킵 (Phase {phase} - 기존 로그인 유지)")
 
@@ -0,0 +1,279 @@
+"""
+스냅샷 이미지 자동 검증 (NumPy)
+
+육안 확인에 의존하던 영상 설정 변화를 스냅샷 비교로 판정합니다.
+- 미러링/피벗: 기준 프레임에 후보 변환(좌우/상하 반전, 회전)을 적용해 상관계수 비교
+- 프라이버시 마스크: Zone 영역이 균일한 색으로 채워졌는지 (채움 비율)
+- 노출: 평균 밝기(Y) 변화
+- 화이트밸런스: R/G, B/G 비율 변화
+- 영상 안정화: 연속 스냅샷의 프레임 차이가 기준 이하가 되면 대기 종료 (고정 대기 대체)
+
+모든 연산은 프레임 전체를 NumPy 배열로 한 번에 처리하므로 프레임당 수 ms 수준입니다.
+NumPy가 없으면 AVAILABLE=False가 되어 검증을 생략하고, JPEG 디코딩은 Pillow가 있을 때만 가능합니다.
+(Pillow 없이도 BMP는 디코딩 가능: 카메라 시뮬레이터 스냅샷)
+"""
+import io
+import struct
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from config import IMAGE_VERIFY_SETTINGS, SETTLE_SETTINGS
+from common_actions import wait_until
+from snapshot_service import get_snapshot_service
+import tracing
+
+AVAILABLE = np is not None
+
+# 후보 변환 (H x W 배열 기준)
+MIRRORING_TRANSFORMS = {
+    "off": lambda a: a,
+    "horizontal": lambda a: a[:, ::-1],
+    "vertical": lambda a: a[::-1, :],
+    "both": lambda a: a[::-1, ::-1],
+}
+PIVOT_TRANSFORMS = {
+    "off": lambda a: a,
+    "clockwise": lambda a: np.rot90(a, -1),
+    "counterclockwise": lambda a: np.rot90(a, 1),
+}
+
+# Rec.601 휘도 가중치
+_LUMA_WEIGHTS = (0.299, 0.587, 0.114)
+
+
+# ===========================================================
+# 🖼️ [Decode] 스냅샷 → 배열
+# ===========================================================
+def _decode_bmp(data: bytes):
+    """비압축 24/32bit BMP 디코딩 (H x W x 3, RGB)"""
+    offset = struct.unpack_from("<I", data, 10)[0]
+    width, height, _, bpp, compression = struct.unpack_from("<iiHHI", data, 18)
+    if bpp not in (24, 32) or compression not in (0, 3):
+        return None
+    channels = bpp // 8
+    row_size = (width * channels + 3) & ~3
+    rows = np.frombuffer(data, dtype=np.uint8, count=row_size * abs(height), offset=offset)
+    pixels = rows.reshape(abs(height), row_size)[:, :width * channels].reshape(abs(height), width, channels)
+    if height > 0:
+        pixels = pixels[::-1]  # 아래쪽 행부터 저장됨
+    return pixels[:, :, 2::-1]  # BGR(A) → RGB
+
+
+def decode_image(data: bytes):
+    """스냅샷 바이트를 H x W x 3 (RGB, uint8) 배열로 변환 (실패 시 None)"""
+    if not AVAILABLE or not data:
+        return None
+    try:
+        if data[:2] == b"BM":
+            return _decode_bmp(data)
+        if Image is not None:
+            with Image.open(io.BytesIO(data)) as img:
+                return np.asarray(img.convert("RGB"))
+    except (OSError, ValueError, struct.error):
+        return None
+    return None
+
+
+def grab_frame(camera_ip: str, page=None):
+    """
+    현재 영상 스냅샷을 배열로 반환
+    검증 비활성/NumPy 없음/디코딩 불가 시 None (호출 측은 이미지 검증 생략)
+    """
+    if not (AVAILABLE and IMAGE_VERIFY_SETTINGS["enabled"]):
+        _notice("NumPy가 없거나 비활성화되어 이미지 검증을 생략합니다.")
+        return None
+    data = get_snapshot_service(camera_ip, page=page).grab()
+    frame = decode_image(data)
+    if frame is None and data:
+        _notice("스냅샷을 디코딩할 수 없어 이미지 검증을 생략합니다. (JPEG는 Pillow 필요)")
+    return frame
+
+
+_NOTICES = set()
+
+
+def _notice(msg: str):
+    """같은 안내는 프로세스당 1회만 출력"""
+    if msg not in _NOTICES:
+        _NOTICES.add(msg)
+        print(f"   ℹ️  {msg}")
+
+
+# ===========================================================
+# 📐 [Measure] 공통 계산
+# ===========================================================
+def luma(img):
+    """휘도(Y) 평면 (H x W, float32)"""
+    return img[..., :3].astype(np.float32) @ np.asarray(_LUMA_WEIGHTS, dtype=np.float32)
+
+
+def resize(plane, size: int = None):
+    """size x size 최근접 축소 (비율이 달라도 같은 격자로 비교)"""
+    size = size or IMAGE_VERIFY_SETTINGS["size"]
+    h, w = plane.shape[:2]
+    ys = ((np.arange(size) + 0.5) * h / size).astype(np.intp)
+    xs = ((np.arange(size) + 0.5) * w / size).astype(np.intp)
+    return plane[ys[:, None], xs[None, :]]
+
+
+def correlation(a, b) -> float:
+    """정규화 상관계수 (-1 ~ 1, 평탄한 영상이면 0)"""
+    a = a - a.mean()
+    b = b - b.mean()
+    denom = float(np.sqrt((a * a).sum() * (b * b).sum()))
+    return float((a * b).sum() / denom) if denom > 0 else 0.0
+
+
+def frame_difference(a, b) -> float:
+    """축소한 두 프레임의 평균 밝기 차이 (0~255, 해상도가 다르면 최대값)"""
+    if a.shape != b.shape:
+        return 255.0
+    return float(np.abs(resize(luma(a)) - resize(luma(b))).mean())
+
+
+def mean_luma(img) -> float:
+    return float(luma(img).mean())
+
+
+def chroma_ratios(img) -> Tuple[float, float]:
+    """(R/G, B/G) 평균 비율"""
+    means = img[..., :3].reshape(-1, 3).astype(np.float32).mean(axis=0)
+    g = max(float(means[1]), 1e-6)
+    return float(means[0]) / g, float(means[2]) / g
+
+
+# ===========================================================
+# ✅ [Check] 설정별 판정
+# ===========================================================
+def orientation_scores(reference, frame, transforms: Dict[str, object]) -> Dict[str, float]:
+    """기준 프레임에 각 후보 변환을 적용했을 때 현재 프레임과의 상관계수"""
+    target = resize(luma(frame))
+    ref = luma(reference)
+    return {name: correlation(resize(transform(ref)), target) for name, transform in transforms.items()}
+
+
+def check_orientation(reference, frame, expected: str, kind: str = "mirroring") -> Tuple[bool, str]:
+    """
+    미러링/피벗 판정: 기대 변환이 가장 잘 맞고, 다른 후보보다 min_margin 이상 높아야 통과
+
+    Args:
+        reference: 미러링/피벗 off 상태 프레임
+        kind: "mirroring" | "pivot"
+    """
+    settings = IMAGE_VERIFY_SETTINGS
+    transforms = MIRRORING_TRANSFORMS if kind == "mirroring" else PIVOT_TRANSFORMS
+    with tracing.span(f"{kind}:{expected}", "verify"):
+        scores = orientation_scores(reference, frame, transforms)
+    best_other = max((v for k, v in scores.items() if k != expected), default=-1.0)
+    score = scores.get(expected, -1.0)
+    ok = score >= settings["min_correlation"] and score - best_other >= settings["min_margin"]
+    detail = ", ".join(f"{k}={v:.2f}" for k, v in sorted(scores.items(), key=lambda kv: -kv[1]))
+    return ok, detail
+
+
+def zone_fill_ratios(frame, zones: List[dict], max_width: int, max_height: int) -> List[float]:
+    """
+    프라이버시 Zone별 균일 픽셀 비율 (Zone 좌표는 카메라 좌표계 max_width x max_height)
+    경계 보간 영향을 줄이기 위해 영역 가장자리 1픽셀은 제외합니다.
+    """
+    plane = luma(frame)
+    h, w = plane.shape
+    tolerance = IMAGE_VERIFY_SETTINGS["mask_tolerance"]
+    ratios = []
+    for zone in zones:
+        x0 = zone["left"] * w // max_width + 1
+        x1 = zone["right"] * w // max_width - 1
+        y0 = zone["top"] * h // max_height + 1
+        y1 = zone["bottom"] * h // max_height - 1
+        region = plane[y0:max(y1, y0 + 1), x0:max(x1, x0 + 1)]
+        if region.size == 0:
+            ratios.append(0.0)
+            continue
+        ratios.append(float((np.abs(region - np.median(region)) <= tolerance).mean()))
+    return ratios
+
+
+def check_privacy_zones(frame, zones: List[dict], max_width: int, max_height: int) -> Tuple[bool, str]:
+    """모든 Zone이 mask_fill_ratio 이상 균일하게 채워졌는지"""
+    with tracing.span("privacy_zones", "verify"):
+        ratios = zone_fill_ratios(frame, zones, max_width, max_height)
+    ok = bool(ratios) and min(ratios) >= IMAGE_VERIFY_SETTINGS["mask_fill_ratio"]
+    return ok, ", ".join(f"Z{i}={r:.2f}" for i, r in enumerate(ratios, 1))
+
+
+def luma_shift(before, after) -> float:
+    """평균 밝기 변화 (after - before, 0~255 기준)"""
+    return mean_luma(after) - mean_luma(before)
+
+
+def chroma_shift(before, after) -> Tuple[float, float]:
+    """(R/G 변화, B/G 변화)"""
+    (r0, b0), (r1, b1) = chroma_ratios(before), chroma_ratios(after)
+    return r1 - r0, b1 - b0
+
+
+def judge_shift(value: float, minimum: float, label: str, direction: int = 0) -> bool:
+    """
+    밝기/색조 변화 판정 출력 (direction: +1 증가 기대, -1 감소 기대, 0 변화만 기대)
+    환경 영향이 커서 strict 설정일 때만 실패로 반환합니다.
+    """
+    if direction:
+        ok = value * direction >= minimum
+    else:
+        ok = abs(value) >= minimum
+    if ok:
+        print(f"   🖼️ {label}: {value:+.3f} (Pass)")
+        return True
+    print(f"   ⚠️ {label}: {value:+.3f} (기대 변화량 {minimum} 미만)")
+    return not IMAGE_VERIFY_SETTINGS["strict"]
+
+
+# ===========================================================
+# ⏳ [Settle] 영상 안정화 대기
+# ===========================================================
+def wait_for_stable_image(camera_ip: str, page=None, fallback: float = None, label: str = None) -> bool:
+    """
+    연속 스냅샷의 프레임 차이가 settle_threshold 이하로 settle_frames회 이어지면 즉시 반환
+    (설정 변경 후 노출/WB/주야간 전환이 끝날 때까지의 최소 대기)
+
+    이미지 비교가 불가능하면(NumPy 없음, 디코딩 불가) fallback초 고정 대기로 동작합니다.
+
+    Args:
+        fallback: 고정 대기 시간 (None이면 SETTLE_SETTINGS["dwell"])
+        label: 반영 시간 통계(SETTLE_METRICS) 이름
+
+    Returns:
+        안정화 판정 여부 (고정 대기로 대체된 경우 True, 타임아웃 시 False)
+    """
+    settings = IMAGE_VERIFY_SETTINGS
+    fallback = SETTLE_SETTINGS["dwell"] if fallback is None else fallback
+    first = grab_frame(camera_ip, page)
+    if first is None:
+        tracing.sleep(fallback)
+        return True
+
+    state = {"frame": first, "stable": 0}
+
+    def _settled():
+        frame = grab_frame(camera_ip, page)
+        if frame is None:
+            return False
+        diff = frame_difference(state["frame"], frame)
+        state["frame"] = frame
+        state["stable"] = state["stable"] + 1 if diff <= settings["settle_threshold"] else 0
+        return state["stable"] >= settings["settle_frames"]
+
+    settled = wait_until(_settled, timeout=settings["settle_timeout"], interval=settings["settle_interval"],
+                         backoff=1.0, label=f"image:{label}" if label else "image")
+    if not settled:
+        print(f"   ⚠️ 영상 안정화 타임아웃 ({settings['settle_timeout']}s)")
+    return bool(settled)
@@ -10,30 +10,8 @@ from playwright.sync_api import Page
 from common_actions import handle_popup
 from config import TIMEOUTS
 from api_client import CameraApiClient
-
-# ===========================================================
-# 🎨 출력 헬퍼 함수
-# ===========================================================
-
-def print_step(current: int, total: int, message: str):
-    """단계별 진행 상황 출력"""
-    print(f"\n[{current}/{total}] {message}")
-
-def print_action(message: str):
-    """액션 진행 중 메시지"""
-    print(f"   → {message}")
-
-def print_success(message: str):
-    """성공 메시지"""
-    print(f"   ✅ {message}")
-
-def print_warning(message: str):
-    """경고 메시지"""
-    print(f"   ⚠️  {message}")
-
-def print_error(message: str):
-    """에러 메시지"""
-    print(f"   ❌ {message}")
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
 
 # ===========================================================
 # 📚 언어 데이터
@@ -97,12 +75,12 @@ def api_get_language(api_client: CameraApiClient, max_retries: int = None, silen
             if attempt < max_retries - 1:
                 if not silent:
                     print_warning(f"언어 조회 실패 ({attempt + 1}/{max_retries}), 재시도 중...")
-                time.sleep(TIMEOUTS.get("retry_delay", 2))
+                tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         except Exception as e:
             if attempt < max_retries - 1:
                 if not silent:
                     print_warning(f"언어 조회 에러 ({attempt + 1}/{max_retries}): {e}")
-                time.sleep(TIMEOUTS.get("retry_delay", 2))
+                tracing.sleep(TIMEOUTS.get("retry_delay", 2))
     
     if not silent:
         print_error("언어 조회 최종 실패")
@@ -129,10 +107,12 @@ def verify_language_value(api_client: CameraApiClient, expected_language: str,
         if current_language == expected_language:
             return True
         
+        # 불일치 값은 캐시에 남기지 않음 (다음 시도는 카메라에서 다시 조회)
+        api_client.invalidate("systemInfo")
         if attempt < max_retries - 1:
             if not silent:
                 print_warning(f"불일치 (실제: '{current_language}'), 재시도 {attempt + 1}/{max_retries}")
-            time.sleep(TIMEOUTS.get("retry_delay", 2))
+            tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         else:
             if not silent:
                 print_error(f"검증 실패: 기대='{expected_language}', 실제='{current_language}'")
@@ -230,7 +210,7 @@ def run_all_languages_test(page: Page, api_client: CameraApiClient) -> Tuple[boo
             failed_languages.append(language_name)
             continue
         
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         # API 검증
         print_action("API 검증 중...")
@@ -243,7 +223,7 @@ def run_all_languages_test(page: Page, api_client: CameraApiClient) -> Tuple[boo
             failed_languages.append(language_name)
         
         if idx < total:
-            time.sleep(1)
+            tracing.sleep(1)
     
     # 한국어로 복구
     print(f"\n{'='*60}")
@@ -251,7 +231,7 @@ def run_all_languages_test(page: Page, api_client: CameraApiClient) -> Tuple[boo
     print(f"{'='*60}")
     
     if ui_set_language(page, KOREAN_VALUE, silent=True):
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         if verify_language_value(api_client, "korean", max_retries=3, silent=True):
             print_success("한국어 복구 완료")
         else:
@@ -298,7 +278,7 @@ def run_single_language_test(page: Page, api_client: CameraApiClient,
         print_step(1, total_steps, f"UI 언어 변경 → {language_name}")
         if not ui_set_language(page, target_ui_val):
             raise Exception("UI 설정 실패")
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         # Step 2: API 검증
         print_step(2, total_steps, "API 검증")
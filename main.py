@@ -3,6 +3,11 @@ import sys
 import ctypes
 import subprocess
 import os  
+import json
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import ExitStack, redirect_stdout, redirect_stderr
 from playwright.sync_api import sync_playwright
 
 # 각 모듈에서 테스트 함수 import
@@ -19,7 +24,15 @@ try:
     from event_action import (
         run_alarm_out_test, run_email_test, run_ftp_test, run_recording_test
     )
-    from api_client import CameraApiClient
+    from api_client import get_api_client, API_METRICS
+    from common_actions import SETTLE_METRICS
+    from tracing import TRACER, STEP_TIMER
+    from snapshot_service import flush_snapshots, start_recorder, dump_recorder, stop_recorders
+    from test_report import write_json_report, write_junit_report
+    from scheduler import (
+        RES_BROWSER, RES_IRAS, RES_NIC, RES_REBOOT, RES_SINK,
+        ResourceBroker, run_lane, print_schedule_report
+    )
     import config
 except ImportError as e:
     print(f"❌ 오류: 필요한 모듈을 찾을 수 없습니다.\n{e}")
@@ -28,51 +41,108 @@ except ImportError as e:
 
 # ===========================================================
 # 📋 테스트 카테고리 정의
+# (test_id, 이름, 함수, 브라우저 필요 여부, 사용 자원)
+# 사용 자원은 scheduler가 카메라 간 동시 실행/직렬화를 결정하는 데 사용
 # ===========================================================
+# 스트림 정보를 RTSP로 직접 측정하면 iRAS 화면 정보가 필요 없음
+STREAM_INFO_RESOURCES = (RES_IRAS,) if config.STREAM_PROBE_SETTINGS["source"] == "iras" else ()
+
 TEST_CATEGORIES = {
     "system": {
         "name": "🔧 시스템 테스트",
         "tests": [
-            ("default_setup", "초기화 및 기본 설정 복구", run_default_setup_test, True),
-            ("setup_roundtrip", "설정 내보내기/불러오기", run_setup_roundtrip_test, True),
-            ("language", "다국어 지원", run_all_languages_test, True),
-            ("datetime", "날짜/시간 설정", run_datetime_tests, True),
-            ("user_group", "사용자/그룹 관리", run_user_group_test, True),
+            ("default_setup", "초기화 및 기본 설정 복구", run_default_setup_test, True, (RES_BROWSER, RES_REBOOT)),
+            ("setup_roundtrip", "설정 내보내기/불러오기", run_setup_roundtrip_test, True, (RES_BROWSER, RES_REBOOT)),
+            ("language", "다국어 지원", run_all_languages_test, True, (RES_BROWSER,)),
+            ("datetime", "날짜/시간 설정", run_datetime_tests, True, (RES_BROWSER,)),
+            ("user_group", "사용자/그룹 관리", run_user_group_test, True, (RES_BROWSER, RES_IRAS)),
         ]
     },
     "network": {
         "name": "📡 네트워크 테스트",
         "tests": [
-            ("network_full", "네트워크 통합 테스트 (별도 프로세스)", None, False),
+            ("network_full", "네트워크 통합 테스트 (별도 프로세스)", None, False, (RES_NIC, RES_IRAS, RES_REBOOT)),
         ],
         "special": "subprocess"  # 특수 실행 방식 표시
     },
     "video": {
         "name": "🎥 비디오 테스트",
         "tests": [
-            ("self_adjust", "Self Adjust Mode", run_self_adjust_mode_test, False),
-            ("image", "Image Setting (Mirroring/Pivot)", run_video_image_test, False),
-            ("white_balance", "White Balance", run_white_balance_test, False),
-            ("exposure", "Exposure (Gain/Shutter/WDR)", run_exposure_test, False),
-            ("daynight", "Day & Night", run_daynight_test, False),
-            ("misc", "Misc (EIS)", run_video_misc_test, False),
-            ("streaming", "Streaming", run_streaming_test, False),
-            ("mat", "MAT (Motion Adaptive Transmission)", run_video_mat_test, False),
-            ("privacy", "Privacy Mask", run_privacy_mask_test, False),
-            ("osd", "OSD (On-Screen Display)", run_osd_test, False),
+            ("self_adjust", "Self Adjust Mode", run_self_adjust_mode_test, False, ()),
+            ("image", "Image Setting (Mirroring/Pivot)", run_video_image_test, False, ()),
+            ("white_balance", "White Balance", run_white_balance_test, False, ()),
+            ("exposure", "Exposure (Gain/Shutter/WDR)", run_exposure_test, False, STREAM_INFO_RESOURCES),
+            ("daynight", "Day & Night", run_daynight_test, False, ()),
+            ("misc", "Misc (EIS)", run_video_misc_test, False, ()),
+            ("streaming", "Streaming", run_streaming_test, False, STREAM_INFO_RESOURCES),
+            ("mat", "MAT (Motion Adaptive Transmission)", run_video_mat_test, False, STREAM_INFO_RESOURCES),
+            ("privacy", "Privacy Mask", run_privacy_mask_test, False, ()),
+            ("osd", "OSD (On-Screen Display)", run_osd_test, False, ()),
         ]
     },
     "event": {
         "name": "🚨 이벤트/액션 테스트",
         "tests": [
-            ("alarm_out", "Alarm Out", run_alarm_out_test, False),
-            ("email", "Email 전송", run_email_test, False),
-            ("ftp", "FTP 업로드", run_ftp_test, False),
-            ("recording", "SD Recording", run_recording_test, False),
+            ("alarm_out", "Alarm Out", run_alarm_out_test, False, ()),
+            ("email", "Email 전송", run_email_test, False, (RES_SINK,)),
+            ("ftp", "FTP 업로드", run_ftp_test, False, (RES_SINK,)),
+            ("recording", "SD Recording", run_recording_test, False, ()),
         ]
     }
 }
 
+# 테스트 ID 별칭 (--tests 에서 사용)
+TEST_ALIASES = {
+    "wb": "white_balance",
+    "ae": "exposure",
+    "dn": "daynight",
+    "eis": "misc",
+    "stream": "streaming",
+    "network_test": "network_full",
+    "roundtrip": "setup_roundtrip",
+    "user": "user_group",
+    "record": "recording",
+}
+
+def find_tests(test_ids):
+    """test_id 목록 → TEST_CATEGORIES 항목 목록 (TEST_CATEGORIES 순서, 네트워크 테스트는 마지막)"""
+    wanted = set(test_ids)
+    tests = [test for cat_key, cat in TEST_CATEGORIES.items() if cat_key != "network"
+             for test in cat["tests"] if test[0] in wanted]
+    tests.extend(test for test in TEST_CATEGORIES["network"]["tests"] if test[0] in wanted)
+    return tests
+
+def resolve_tests(spec):
+    """
+    테스트 선택 문자열 → test_id 목록
+    
+    쉼표 구분으로 카테고리(video), test_id(default_setup), 별칭(wb), all 을 섞어 쓸 수 있습니다.
+    """
+    items = spec if isinstance(spec, (list, tuple)) else str(spec).split(",")
+    test_ids = []
+    for item in (i.strip().lower() for i in items):
+        if not item:
+            continue
+        if item == "all":
+            ids = [t[0] for cat in TEST_CATEGORIES.values() for t in cat["tests"]]
+        elif item in TEST_CATEGORIES:
+            ids = [t[0] for t in TEST_CATEGORIES[item]["tests"]]
+        else:
+            ids = [TEST_ALIASES.get(item, item)]
+            if not find_tests(ids):
+                raise ValueError(f"알 수 없는 테스트: {item}")
+        test_ids.extend(i for i in ids if i not in test_ids)
+    return [t[0] for t in find_tests(test_ids)]
+
+def apply_shard(test_ids, shard):
+    """'k/n' 샤드 선택 (1부터 시작, 순서 기준 라운드로빈 분배)"""
+    if not shard:
+        return test_ids
+    index, count = (int(x) for x in str(shard).split("/"))
+    if not 1 <= index <= count:
+        raise ValueError(f"잘못된 샤드 지정: {shard} (예: 1/4)")
+    return test_ids[index - 1::count]
+
 def get_user_input():
     """사용자로부터 테스트에 필요한 정보를 입력받습니다."""
     print("\n" + "="*60)
@@ -169,6 +239,25 @@ def show_test_menu():
                 return "all"
         print("❌ 올바른 번호를 입력하세요.")
 
+def run_single_test(test_id, test_func, page, api_client, camera_ip, username, password):
+    """테스트 함수의 시그니처에 따라 인자 전달"""
+    if test_id in ["default_setup", "setup_roundtrip", "language", "datetime"]:
+        return test_func(page, api_client)
+    elif test_id == "user_group":
+        return test_func(page, camera_ip, username, password)
+    return test_func(page, camera_ip)
+
+def _finish_test(camera_ip, test_id, success):
+    """
+    테스트 종료 처리: 백그라운드 스냅샷 저장 완료 대기, 단계 기록 마감
+    실패 시 녹화 중이면 마지막 단계 이름으로 직전 프레임 저장
+    """
+    flush_snapshots()
+    steps = STEP_TIMER.finish()
+    if not success:
+        dump_recorder(camera_ip, f"{test_id}_{steps[-1]['name']}" if steps else test_id)
+    return steps
+
 def run_tests_with_browser(tests_to_run, camera_ip, username, password):
     """브라우저가 필요한 테스트 실행"""
     with sync_playwright() as p:
@@ -185,25 +274,24 @@ def run_tests_with_browser(tests_to_run, camera_ip, username, password):
             page.wait_for_selector("#Page200_id", timeout=10000)
             print("   ✅ 로그인 성공\n")
             
-            api_client = CameraApiClient(page, camera_ip)
+            api_client = get_api_client(camera_ip, page=page)
+            start_recorder(camera_ip, page=page)
             
             # 테스트 실행
             passed = 0
             failed = 0
             
-            for test_id, test_name, test_func, needs_browser in tests_to_run:
+            for test_id, test_name, test_func, needs_browser, resources in tests_to_run:
                 print(f"\n{'='*60}")
                 print(f"🧪 [{passed+failed+1}/{len(tests_to_run)}] {test_name}")
                 print(f"{'='*60}")
                 
                 try:
-                    # 테스트 함수의 시그니처에 따라 인자 전달
-                    if test_id in ["default_setup", "setup_roundtrip", "language", "datetime"]:
-                        success, msg = test_func(page, api_client)
-                    elif test_id == "user_group":
-                        success, msg = test_func(page, camera_ip, username, password)
-                    else:
-                        success, msg = test_func(page, camera_ip)
+                    with TRACER.span(test_id, "test", camera=camera_ip):
+                        STEP_TIMER.begin()
+                        success, msg = run_single_test(test_id, test_func, page, api_client,
+                                                       camera_ip, username, password)
+                        _finish_test(camera_ip, test_id, success)
                     
                     if success:
                         print(f"✅ 성공: {msg}")
@@ -234,69 +322,65 @@ def run_tests_with_browser(tests_to_run, camera_ip, username, password):
             import traceback
             traceback.print_exc()
         finally:
+            stop_recorders()
             browser.close()
             print("\n브라우저를 종료했습니다.")
 
 def run_tests_without_browser(tests_to_run, camera_ip, username, password):
-    """브라우저 없이 API만으로 실행 가능한 테스트"""
-    with sync_playwright() as p:
-        print("\n🔧 백그라운드 세션 초기화 중...")
-        # headless 모드로 실행 (화면 없음)
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(
-            http_credentials={'username': username, 'password': password}
-        )
-        page = context.new_page()
+    """브라우저 없이 API만으로 실행 가능한 테스트 (HTTP 전송, Playwright 미사용)"""
+    print("\n🔧 API 세션 초기화 중 (HTTP)...")
+    get_api_client(camera_ip)
+    
+    try:
+        start_recorder(camera_ip)
         
-        try:
-            # 최소한의 인증만 수행
-            page.goto(config.CAMERA_URL, wait_until="domcontentloaded")
-            print("   ✅ 인증 완료\n")
-            
-            # 테스트 실행
-            passed = 0
-            failed = 0
-            
-            for test_id, test_name, test_func, needs_browser in tests_to_run:
-                print(f"\n{'='*60}")
-                print(f"🧪 [{passed+failed+1}/{len(tests_to_run)}] {test_name}")
-                print(f"{'='*60}")
-                
-                try:
-                    success, msg = test_func(page, camera_ip)
-                    
-                    if success:
-                        print(f"✅ 성공: {msg}")
-                        passed += 1
-                    else:
-                        print(f"❌ 실패: {msg}")
-                        failed += 1
-                        
-                except Exception as e:
-                    print(f"❌ 예외 발생: {e}")
-                    failed += 1
-            
-            # 최종 결과
+        # 테스트 실행
+        passed = 0
+        failed = 0
+        
+        for test_id, test_name, test_func, needs_browser, resources in tests_to_run:
             print(f"\n{'='*60}")
-            print(f"📊 테스트 결과")
+            print(f"🧪 [{passed+failed+1}/{len(tests_to_run)}] {test_name}")
             print(f"{'='*60}")
-            print(f"✅ 성공: {passed}/{len(tests_to_run)}")
-            print(f"❌ 실패: {failed}/{len(tests_to_run)}")
-            print(f"{'='*60}")
-            
-            if failed > 0:
-                print(f"\n⚠️  {failed}개의 테스트가 실패했습니다.")
-            else:
-                print("\n🎉 모든 테스트가 성공적으로 완료되었습니다!")
             
-        except Exception as e:
-            print(f"\n🔥 [치명적 오류] {e}")
-            import traceback
-            traceback.print_exc()
-        finally:
-            browser.close()
+            try:
+                with TRACER.span(test_id, "test", camera=camera_ip):
+                    STEP_TIMER.begin()
+                    success, msg = test_func(None, camera_ip)
+                    _finish_test(camera_ip, test_id, success)
+                
+                if success:
+                    print(f"✅ 성공: {msg}")
+                    passed += 1
+                else:
+                    print(f"❌ 실패: {msg}")
+                    failed += 1
+                    
+            except Exception as e:
+                print(f"❌ 예외 발생: {e}")
+                failed += 1
+        
+        # 최종 결과
+        print(f"\n{'='*60}")
+        print(f"📊 테스트 결과")
+        print(f"{'='*60}")
+        print(f"✅ 성공: {passed}/{len(tests_to_run)}")
+        print(f"❌ 실패: {failed}/{len(tests_to_run)}")
+        print(f"{'='*60}")
+        
+        if failed > 0:
+            print(f"\n⚠️  {failed}개의 테스트가 실패했습니다.")
+        else:
+            print("\n🎉 모든 테스트가 성공적으로 완료되었습니다!")
+        
+    except Exception as e:
+        print(f"\n🔥 [치명적 오류] {e}")
+        import traceback
+        traceback.print_exc()
+    finally:
+        stop_recorders()
 
-def run_network_test(camera_ip, username, password, interface_name):
+def run_network_test(camera_ip, username, password, interface_name, log_file=None):
     """네트워크 테스트를 별도 프로세스로 실행 (브라우저 충돌 방지)"""
     print("\n" + "="*60)
     print("📡 네트워크 통합 테스트")
@@ -311,10 +395,15 @@ def run_network_test(camera_ip, username, password, interface_name):
         "--pw", password,
         "--iface", interface_name
     ]
+    if not config.RUN_SETTINGS["interactive"]:
+        cmd.append("--headless")
     
     try:
-        # 별도 프로세스로 실행 (현재 콘솔에서)
-        result = subprocess.run(cmd)
+        # 별도 프로세스로 실행 (log_file이 없으면 현재 콘솔에서)
+        if log_file is not None:
+            result = subprocess.run(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+        else:
+            result = subprocess.run(cmd)
         
         if result.returncode == 0:
             print("\n✅ 네트워크 테스트가 정상 종료되었습니다.")
@@ -330,14 +419,385 @@ def run_network_test(camera_ip, username, password, interface_name):
         print(f"\n🔥 [실패] 네트워크 테스트 실행 중 오류: {e}")
         return False
 
+# ===========================================================
+# 🗂️ 다중 카메라 모드 (인벤토리 기반, 비대화형)
+# ===========================================================
+def load_inventory(path):
+    """
+    인벤토리(JSON) 로드
+    
+    형식: [{"ip": "10.0.131.104", "username": "admin", "password": "...",
+            "iras_device_name": "104_T6631", "model_group": "T6631",
+            "interface_name": "이더넷", "pc_static_ip": "10.0.131.102",
+            "categories": ["video"]}, ...]  또는 {"devices": [...]}
+    (interface_name, pc_static_ip, categories는 선택)
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    devices = data.get("devices", []) if isinstance(data, dict) else data
+    
+    for device in devices:
+        missing = [k for k in ("ip", "password", "iras_device_name") if not device.get(k)]
+        if missing:
+            raise ValueError(f"인벤토리 항목에 필수 값이 없습니다 ({', '.join(missing)}): {device}")
+        device.setdefault("username", "admin")
+        device.setdefault("model_group", "-")
+        device.setdefault("interface_name", config.MULTI_DEVICE_SETTINGS["default_interface"])
+        device.setdefault("pc_static_ip", f"{device['ip'].rsplit('.', 1)[0]}.102")
+    return devices
+
+def _run_device_tests(tests_to_run, device, broker):
+    """
+    [워커] 카메라 1대의 테스트를 스케줄러 레인으로 실행
+
+    헤드리스 브라우저 세션 1개로 일반 테스트를 실행하고, 네트워크 테스트(network_full)는
+    별도 프로세스로 실행합니다. PC 전역 자원(iRAS/NIC/수신 서버)은 broker로 다른 카메라와 조율합니다.
+
+    Returns:
+        실행 기록 목록 (scheduler.run_lane 형식)
+    """
+    camera_ip, username, password = device["ip"], device["username"], device["password"]
+    tasks = [{"test_id": test_id, "name": test_name, "func": test_func, "resources": resources}
+             for test_id, test_name, test_func, needs_browser, resources in tests_to_run]
+    log = sys.stdout
+
+    with ExitStack() as stack:
+        # 브라우저가 필요한 테스트가 있을 때만 Playwright 세션 사용 (API 전용 테스트는 page=None, HTTP 전송)
+        page = None
+        if any(needs_browser for _, _, _, needs_browser, _ in tests_to_run):
+            p = stack.enter_context(sync_playwright())
+            browser = p.chromium.launch(headless=True)
+            stack.callback(browser.close)
+            context = browser.new_context(
+                http_credentials={'username': username, 'password': password}
+            )
+            page = context.new_page()
+        try:
+            if page is not None:
+                page.goto(config.CAMERA_URL)
+                page.wait_for_selector("#Page200_id", timeout=10000)
+            api_client = get_api_client(camera_ip, page=page)
+            start_recorder(camera_ip, page=page)
+
+            def execute(task):
+                print(f"\n{'='*60}\n🧪 {task['name']}\n{'='*60}")
+                with TRACER.span(task["test_id"], "test", camera=camera_ip):
+                    STEP_TIMER.begin()
+                    if task["test_id"] == "network_full":
+                        log.flush()
+                        success = run_network_test(camera_ip, username, password,
+                                                   device["interface_name"], log_file=log)
+                        msg = "네트워크 통합 테스트"
+                    else:
+                        success, msg = run_single_test(task["test_id"], task["func"], page, api_client,
+                                                       camera_ip, username, password)
+                    steps = _finish_test(camera_ip, task["test_id"], success)
+                print(f"{'✅ 성공' if success else '❌ 실패'}: {msg}")
+                return success, msg, {"steps": steps}
+
+            return run_lane(camera_ip, tasks, broker, execute)
+        except Exception as e:
+            print(f"\n🔥 [치명적 오류] {e}")
+            now = time.time()
+            return [{"lane": camera_ip, "test_id": task["test_id"], "name": task["name"],
+                     "resources": list(task["resources"]), "ready": now, "start": now, "end": now,
+                     "success": False, "message": f"치명적 오류: {e}"} for task in tasks]
+        finally:
+            stop_recorders()
+
+def run_device_suite(device, test_ids, broker, run_settings=None, run_inputs=None):
+    """
+    [워커 프로세스] 카메라 1대에 대해 선택한 테스트 실행
+    
+    config 전역값이 카메라마다 다르므로 카메라별로 별도 프로세스에서 실행하며,
+    출력은 카메라별 로그 파일로, 스냅샷은 카메라별 폴더로 분리합니다.
+    (워커 프로세스는 config를 새로 import하므로 무인 실행 설정을 인자로 전달받음)
+    
+    Returns:
+        (카메라 IP, {test_id: (성공 여부, 메시지, 소요 시간)}, 실행 기록)
+    """
+    settings = config.MULTI_DEVICE_SETTINGS
+    os.makedirs(settings["log_dir"], exist_ok=True)
+    log_path = os.path.join(settings["log_dir"], f"{device['ip']}.log")
+    
+    with open(log_path, "w", encoding="utf-8") as log, redirect_stdout(log), redirect_stderr(log):
+        config.update_config(device["ip"], device["username"], device["password"],
+                             device["interface_name"], device["iras_device_name"], device["pc_static_ip"])
+        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+        config.CAPTURE_DIR = os.path.join(desktop_path, "TestCapture", device["ip"])
+        config.RUN_SETTINGS.update(run_settings or {})
+        config.RUN_INPUTS.update(run_inputs or {})
+        
+        # 네트워크 테스트는 카메라 IP를 바꾸므로 find_tests가 레인의 마지막 순서로 배치
+        tests_to_run = find_tests(test_ids)
+        records = _run_device_tests(tests_to_run, device, broker) if tests_to_run else []
+        
+        API_METRICS.print_summary()
+        SETTLE_METRICS.print_summary()
+        TRACER.print_summary()
+    
+    results = {r["test_id"]: (r["success"], r["message"], r["end"] - r["start"]) for r in records}
+    trace_events = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": device["ip"]}}]
+    return device["ip"], results, records, trace_events + TRACER.events()
+
+def print_result_matrix(devices, matrix):
+    """카메라 x 테스트 결과 매트릭스 출력"""
+    test_ids = []
+    for results in matrix.values():
+        test_ids.extend(t for t in results if t not in test_ids)
+    
+    print(f"\n{'='*60}")
+    print("📊 다중 카메라 결과 매트릭스")
+    print(f"{'='*60}")
+    print(f"{'Camera':<18}{'Group':<10}" + "".join(f"{t[:12]:>14}" for t in test_ids))
+    for device in devices:
+        results = matrix.get(device["ip"], {})
+        cells = []
+        for t in test_ids:
+            if t not in results:
+                cells.append(f"{'-':>14}")
+            else:
+                cells.append(f"{'PASS' if results[t][0] else 'FAIL':>14}")
+        print(f"{device['ip']:<18}{device['model_group'][:9]:<10}" + "".join(cells))
+    
+    total = sum(len(r) for r in matrix.values())
+    passed = sum(1 for r in matrix.values() for ok, _, _ in r.values() if ok)
+    print(f"{'='*60}")
+    print(f"✅ 성공: {passed}/{total}   ❌ 실패: {total - passed}/{total}")
+
+def save_reports(records, json_path=None, junit_path=None, meta=None, trace_path=None, trace_events=None):
+    """
+    실행 기록을 JSON/JUnit, 실행 추적을 Chrome Trace로 저장
+    (경로 미지정 시 result_dir에 시각 기반 이름으로 저장)
+    """
+    result_dir = config.MULTI_DEVICE_SETTINGS["result_dir"]
+    stamp = time.strftime('%Y%m%d_%H%M%S')
+    if records:
+        write_json_report(records, json_path or os.path.join(result_dir, f"run_{stamp}.json"), meta)
+        write_junit_report(records, junit_path or os.path.join(result_dir, f"run_{stamp}.xml"))
+    TRACER.export(trace_path or os.path.join(result_dir, f"trace_{stamp}.json"), trace_events)
+
+def run_multi_device(inventory_path, test_ids, max_workers=None, json_path=None, junit_path=None, trace_path=None):
+    """인벤토리의 카메라들에 대해 테스트를 병렬 실행 (카메라별 프로세스 격리)"""
+    devices = load_inventory(inventory_path)
+    if not devices:
+        print("❌ 인벤토리에 카메라가 없습니다.")
+        return {}
+    
+    max_workers = max_workers or config.MULTI_DEVICE_SETTINGS["max_workers"]
+    max_workers = max(1, min(max_workers, len(devices)))
+    print(f"\n🗂️  다중 카메라 모드: {len(devices)}대, 동시 실행 {max_workers}대")
+    print(f"   테스트: {', '.join(test_ids)}")
+    print(f"   카메라별 로그: {config.MULTI_DEVICE_SETTINGS['log_dir']}/<IP>.log\n")
+    
+    matrix = {}
+    schedule = []
+    trace_events = []
+    with multiprocessing.Manager() as manager:
+        broker = ResourceBroker(manager)
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {}
+            for device in devices:
+                device_tests = resolve_tests(device["categories"]) if device.get("categories") else test_ids
+                futures[pool.submit(run_device_suite, device, device_tests, broker,
+                                    dict(config.RUN_SETTINGS), dict(config.RUN_INPUTS))] = device
+            for future in as_completed(futures):
+                device = futures[future]
+                try:
+                    _, results, records, events = future.result()
+                    schedule.extend(records)
+                    trace_events.extend(events)
+                except Exception as e:
+                    results = {"worker": (False, f"워커 오류: {e}", 0.0)}
+                    # JSON/JUnit 보고서에도 실행되지 못한 카메라가 실패로 남도록 기록
+                    now = time.time()
+                    schedule.append({"lane": device["ip"], "test_id": "worker", "name": "워커 실행",
+                                     "resources": [], "ready": now, "start": now, "end": now,
+                                     "success": False, "message": f"워커 오류: {e}"})
+                matrix[device["ip"]] = results
+                failed = sum(1 for ok, _, _ in results.values() if not ok)
+                print(f"   {'✅' if failed == 0 else '❌'} {device['ip']} 완료 "
+                      f"({len(results) - failed}/{len(results)} 성공)")
+    
+    print_result_matrix(devices, matrix)
+    print_schedule_report(schedule)
+    TRACER.print_summary(trace_events)
+    save_reports(schedule, json_path, junit_path,
+                 meta={"mode": "inventory", "inventory": inventory_path, "tests": test_ids},
+                 trace_path=trace_path, trace_events=trace_events)
+    return matrix
+
+def run_headless(opts):
+    """
+    카메라 1대 무인 실행 (입력 대기 없음)
+    
+    Returns:
+        모든 테스트 성공 여부
+    """
+    config.update_config(opts["ip"], opts["username"], opts["password"],
+                         opts["interface"], opts["iras_device"], opts["pc_ip"])
+    device = {"ip": opts["ip"], "username": opts["username"], "password": opts["password"],
+              "interface_name": opts["interface"]}
+    test_ids = opts["tests"]
+    print(f"\n🤖 무인 실행: {opts['ip']} / {len(test_ids)}개 테스트"
+          + (f" (샤드 {opts['shard']})" if opts.get("shard") else ""))
+    print(f"   테스트: {', '.join(test_ids)}")
+    
+    with multiprocessing.Manager() as manager:
+        records = _run_device_tests(find_tests(test_ids), device, ResourceBroker(manager))
+    
+    passed = sum(1 for r in records if r["success"])
+    print(f"\n{'='*60}")
+    print(f"📊 테스트 결과: ✅ {passed}/{len(records)}   ❌ {len(records) - passed}/{len(records)}")
+    print(f"{'='*60}")
+    print_schedule_report(records)
+    API_METRICS.print_summary()
+    SETTLE_METRICS.print_summary()
+    TRACER.print_summary()
+    save_reports(records, opts.get("json"), opts.get("junit"),
+                 meta={"mode": "headless", "camera": opts["ip"], "tests": test_ids, "shard": opts.get("shard")},
+                 trace_path=opts.get("trace"))
+    return bool(records) and passed == len(records)
+
+# 무인 실행 옵션: (옵션 이름, 환경 변수, 기본값)
+RUN_OPTIONS = [
+    ("ip", "CAMTEST_IP", None),
+    ("username", "CAMTEST_USERNAME", "admin"),
+    ("password", "CAMTEST_PASSWORD", None),
+    ("interface", "CAMTEST_IFACE", None),
+    ("iras_device", "CAMTEST_IRAS_DEVICE", None),
+    ("pc_ip", "CAMTEST_PC_IP", None),
+    ("tests", "CAMTEST_TESTS", "system,video,event"),
+    ("shard", "CAMTEST_SHARD", None),
+    ("json", "CAMTEST_JSON", None),
+    ("junit", "CAMTEST_JUNIT", None),
+    ("trace", "CAMTEST_TRACE", None),
+]
+
+def load_run_options(args):
+    """
+    무인 실행 옵션 결정 (명령행 인자 > 환경 변수 > 설정 파일 > 기본값)
+    
+    설정 파일(JSON) 예: {"ip": "10.0.131.104", "password": "...", "iras_device": "104_T6631",
+                       "tests": "video,wb", "inputs": {"smtp_id": "..."}, "assume_yes": false}
+    """
+    file_opts = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            file_opts = json.load(f)
+    
+    opts = {}
+    for name, env_name, default in RUN_OPTIONS:
+        value = getattr(args, name, None)
+        if value in (None, ""):
+            value = os.environ.get(env_name)
+        if value in (None, ""):
+            value = file_opts.get(name, default)
+        opts[name] = value
+    
+    if opts["ip"]:
+        opts["interface"] = opts["interface"] or config.MULTI_DEVICE_SETTINGS["default_interface"]
+        opts["pc_ip"] = opts["pc_ip"] or f"{opts['ip'].rsplit('.', 1)[0]}.102"
+        opts["iras_device"] = opts["iras_device"] or opts["ip"]
+    opts["tests"] = apply_shard(resolve_tests(opts["tests"]), opts["shard"])
+    
+    # 테스트 실행 중 묻는 값 / 확인 응답
+    config.RUN_SETTINGS["interactive"] = False
+    config.RUN_SETTINGS["assume_yes"] = bool(args.assume_yes or file_opts.get("assume_yes", False))
+    config.RUN_SETTINGS["operator_delay"] = float(file_opts.get("operator_delay", config.RUN_SETTINGS["operator_delay"]))
+    config.RUN_SETTINGS["record"] = bool(config.RUN_SETTINGS["record"] or file_opts.get("record", False))
+    config.RUN_INPUTS.update(file_opts.get("inputs", {}))
+    for item in args.set or []:
+        key, _, value = item.partition("=")
+        config.RUN_INPUTS[key.strip()] = value
+    return opts
+
+def print_test_list():
+    """선택 가능한 test_id / 별칭 출력"""
+    for cat_key, cat in TEST_CATEGORIES.items():
+        print(f"{cat['name']} ({cat_key})")
+        for test_id, test_name, *_ in cat["tests"]:
+            aliases = [a for a, t in TEST_ALIASES.items() if t == test_id]
+            print(f"   {test_id:<18} {test_name}" + (f"  [별칭: {', '.join(aliases)}]" if aliases else ""))
+
+def parse_args():
+    """명령행 인자 (인자가 없으면 기존 대화형 모드)"""
+    parser = argparse.ArgumentParser(description="IDIS 카메라 자동 테스트")
+    parser.add_argument("--inventory", help="다중 카메라 인벤토리 JSON 경로 (지정 시 비대화형 다중 카메라 모드)")
+    parser.add_argument("--config", help="무인 실행 설정 파일 (JSON)")
+    parser.add_argument("--headless", action="store_true", help="카메라 1대 무인 실행 (입력 대기 없음)")
+    parser.add_argument("--ip", help="카메라 IP (환경 변수 CAMTEST_IP)")
+    parser.add_argument("--username", help="카메라 사용자 이름 (CAMTEST_USERNAME, 기본 admin)")
+    parser.add_argument("--password", help="카메라 비밀번호 (CAMTEST_PASSWORD)")
+    parser.add_argument("--interface", help="PC 네트워크 인터페이스 이름 (CAMTEST_IFACE)")
+    parser.add_argument("--iras-device", dest="iras_device", help="iRAS 장치 이름 (CAMTEST_IRAS_DEVICE)")
+    parser.add_argument("--pc-ip", dest="pc_ip", help="PC 고정 IP (CAMTEST_PC_IP)")
+    parser.add_argument("--tests", "--categories", dest="tests",
+                        help="실행할 테스트 (쉼표 구분: 카테고리/test_id/별칭/all, 예: video,wb,default_setup)")
+    parser.add_argument("--shard", help="CI 분산 실행용 샤드 (예: 2/4)")
+    parser.add_argument("--json", help="JSON 결과 파일 경로")
+    parser.add_argument("--junit", help="JUnit XML 결과 파일 경로")
+    parser.add_argument("--trace", help="Chrome Trace(Perfetto) JSON 파일 경로")
+    parser.add_argument("--set", action="append", metavar="KEY=VALUE",
+                        help="테스트 입력값 지정 (예: smtp_id=qa, confirm_email=y)")
+    parser.add_argument("--assume-yes", dest="assume_yes", action="store_true",
+                        help="무인 모드에서 육안 확인 질문을 모두 Y로 응답")
+    parser.add_argument("--record", action="store_true",
+                        help="실패 시 직전 스냅샷을 저장하는 백그라운드 녹화 사용 (CAMTEST_RECORD)")
+    parser.add_argument("--workers", type=int, default=None, help="동시에 테스트할 카메라 수")
+    parser.add_argument("--list-tests", dest="list_tests", action="store_true", help="test_id 목록 출력")
+    return parser.parse_args()
+
+def is_admin() -> bool:
+    """관리자 권한 여부 (Windows가 아니면 UAC가 없으므로 항상 False)"""
+    if os.name != "nt":
+        return False
+    return bool(ctypes.windll.shell32.IsUserAnAdmin())
+
 def main():
+    args = parse_args()
+    if args.list_tests:
+        print_test_list()
+        return
+    config.RUN_SETTINGS["record"] = bool(args.record or os.environ.get("CAMTEST_RECORD"))
+    unattended = bool(args.inventory or args.headless or args.config or args.tests or args.ip)
+    
     # -----------------------------------------------------------
     # 🔐 관리자 권한 체크
     # -----------------------------------------------------------
-    if not ctypes.windll.shell32.IsUserAnAdmin():
-        print("🔒 관리자 권한으로 재실행합니다...")
-        ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
-        sys.exit()
+    admin = is_admin()
+    if not admin:
+        if unattended or os.name != "nt":
+            # 무인 실행/비 Windows는 UAC 재실행 불가: 관리자 권한이 필요한 네트워크 테스트만 제외
+            print("⚠️  관리자 권한이 아니므로 네트워크 테스트(network_full)는 제외됩니다.")
+        else:
+            print("🔒 관리자 권한으로 재실행합니다...")
+            ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, " ".join(sys.argv), None, 1)
+            sys.exit()
+    
+    # -----------------------------------------------------------
+    # 🤖 무인 실행 (다중 카메라 / 카메라 1대)
+    # -----------------------------------------------------------
+    if unattended:
+        try:
+            opts = load_run_options(args)
+        except (ValueError, OSError) as e:
+            print(f"❌ 실행 옵션 오류: {e}")
+            sys.exit(2)
+        if not admin:
+            opts["tests"] = [t for t in opts["tests"] if t != "network_full"]
+        
+        if args.inventory:
+            matrix = run_multi_device(args.inventory, opts["tests"], args.workers,
+                                      opts["json"], opts["junit"], opts["trace"])
+            all_passed = all(ok for results in matrix.values() for ok, _, _ in results.values())
+            sys.exit(0 if matrix and all_passed else 1)
+        
+        missing = [name for name in ("ip", "password") if not opts[name]]
+        if missing:
+            print(f"❌ 필수 옵션이 없습니다: {', '.join(missing)} (--{missing[0]} 또는 CAMTEST_{missing[0].upper()})")
+            sys.exit(2)
+        sys.exit(0 if run_headless(opts) else 1)
     
     # -----------------------------------------------------------
     # 📋 사용자 입력 받기
@@ -356,6 +816,9 @@ def main():
     # 📡 네트워크 테스트는 별도 처리
     # -----------------------------------------------------------
     if selected_category == "network":
+        if not admin:
+            print("\n❌ 네트워크 테스트는 관리자 권한이 필요합니다.")
+            return
         print("\n✅ 설정 완료. 네트워크 테스트를 시작합니다...\n")
         time.sleep(1)
         run_network_test(camera_ip, username, password, interface_name)
@@ -375,19 +838,20 @@ def main():
                 tests_to_run.extend(TEST_CATEGORIES[cat_key]["tests"])
         needs_browser = True  # 전체 실행 시 브라우저 필요
         
-        # 전체 테스트 후 네트워크 테스트 실행 여부 확인
-        print("\n" + "="*60)
-        print("📡 네트워크 테스트도 실행하시겠습니까?")
-        print("="*60)
-        print("   ℹ️  네트워크 테스트는 별도 프로세스로 실행됩니다.")
-        confirm = input("   실행 (y/n): ").strip().lower()
-        run_network_after = (confirm == 'y')
+        # 전체 테스트 후 네트워크 테스트 실행 여부 확인 (관리자 권한일 때만)
+        if admin:
+            print("\n" + "="*60)
+            print("📡 네트워크 테스트도 실행하시겠습니까?")
+            print("="*60)
+            print("   ℹ️  네트워크 테스트는 별도 프로세스로 실행됩니다.")
+            confirm = input("   실행 (y/n): ").strip().lower()
+            run_network_after = (confirm == 'y')
     else:
         # 선택한 카테고리의 테스트만 실행
         category = TEST_CATEGORIES[selected_category]
         tests_to_run = category["tests"]
         # 하나라도 브라우저가 필요하면 브라우저 모드로 실행
-        needs_browser = any(test[3] for test in tests_to_run)
+        needs_browser = any(needs for _, _, _, needs, _ in tests_to_run)
     
     print(f"\n✅ 설정 완료. {len(tests_to_run)}개의 테스트를 시작합니다...\n")
     time.sleep(1)
@@ -405,6 +869,12 @@ def main():
         print("="*60)
         run_network_test(camera_ip, username, password, interface_name)
     
+    # API 호출 통계 (액션별 지연 시간) / 설정 반영 시간 통계 / 실행 시간 분석
+    API_METRICS.print_summary()
+    SETTLE_METRICS.print_summary()
+    TRACER.print_summary()
+    save_reports([])
+    
     print("\n\n" + "="*60)
     print("🎉 모든 작업이 완료되었습니다!")
     print("="*60)
@@ -422,5 +892,6 @@ if __name__ == "__main__":
         print(f"\n❌ 예상치 못한 오류: {e}")
         import traceback
         traceback.print_exc()
-        input("\n엔터 키를 누르면 종료합니다...")
+        if config.RUN_SETTINGS["interactive"]:
+            input("\n엔터 키를 누르면 종료합니다...")
         sys.exit(1)
\ No newline at end of file
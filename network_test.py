@@ -1,18 +1,21 @@
 import argparse
 import time
+import tracing
 import subprocess
 import sys
 import ctypes
 import socket
 import re
 import requests
-from urllib.parse import parse_qsl
-from requests.auth import HTTPDigestAuth
-from scapy.all import ARP, Ether, srp, sniff, conf
+from scapy.all import conf
 from playwright.sync_api import sync_playwright
 
 # 사용자 정의 모듈
 import config  # 설정 파일 Import
+from api_client import CameraApiClient, get_http_transport
+from discovery import DiscoveryEngine, cached_mac, get_cache
+import reachability
+from common_actions import wait_for_operator
 import iRAS_test
 import webgaurd
 
@@ -52,14 +55,14 @@ class NetworkManager:
         gw_cmd = f" {gw}" if gw else ""
         cmd = f'netsh interface ip set address name="{config.INTERFACE_NAME}" static {ip} {subnet}{gw_cmd}'
         NetworkManager.run_cmd(cmd)
-        time.sleep(5)
+        tracing.sleep(5)
 
     @staticmethod
     def set_dhcp():
         print("💻 [System] PC IP DHCP(자동) 설정 변경 중...")
         NetworkManager.run_cmd(f'netsh interface ip set address name="{config.INTERFACE_NAME}" source=dhcp')
         NetworkManager.run_cmd(f'netsh interface ip set dns name="{config.INTERFACE_NAME}" source=dhcp')
-        time.sleep(3)
+        tracing.sleep(3)
 
     @staticmethod
     def wait_for_dhcp(prefix="10.", timeout=60):
@@ -75,20 +78,17 @@ class NetworkManager:
                     return True
             except: pass
             print(".", end="", flush=True)
-            time.sleep(2)
+            tracing.sleep(2)
         print(" 실패 ❌")
         return False
 
     @staticmethod
     def ping(ip, timeout=30):
-        print(f"📡 [Ping] {ip} 통신 확인 중...", end="")
-        start = time.time()
-        while time.time() - start < timeout:
-            if subprocess.call(f"ping -n 1 -w 500 {ip}", shell=True, stdout=subprocess.DEVNULL) == 0:
-                print(" 연결됨! ✅")
-                return True
-            print(".", end="", flush=True)
-            time.sleep(1)
+        print(f"📡 [Ping] {ip} 통신 확인 중 ({reachability.method().upper()})...", end="", flush=True)
+        rtt = reachability.wait_reachable(ip, timeout=timeout)
+        if rtt is not None:
+            print(f" 연결됨! ✅ ({rtt}ms)")
+            return True
         print(" 응답 없음 ❌")
         return False
 
@@ -97,132 +97,26 @@ class NetworkManager:
 # =========================================================
 class CameraScanner:
     @staticmethod
-    def normalize_mac(mac):
-        if not mac: return ""
-        return mac.lower().replace("-", ":").replace(".", "")
-
-    @staticmethod
-    def scan_onvif(timeout=2):
-        discovery_msg = (
-            b'<?xml version="1.0" encoding="UTF-8"?>'
-            b'<e:Envelope xmlns:e="http://www.w3.org/2003/05/soap-envelope" '
-            b'xmlns:w="http://schemas.xmlsoap.org/ws/2004/08/addressing" '
-            b'xmlns:d="http://schemas.xmlsoap.org/ws/2005/04/discovery" '
-            b'xmlns:dn="http://www.onvif.org/ver10/network/wsdl">'
-            b'<e:Header>'
-            b'<w:MessageID>uuid:84ede3de-7dec-11d0-c360-f01234567890</w:MessageID>'
-            b'<w:To e:mustUnderstand="true">urn:schemas-xmlsoap-org:ws:2005:04:discovery</w:To>'
-            b'<w:Action a:mustUnderstand="true">http://schemas.xmlsoap.org/ws/2005/04/discovery/Probe</w:Action>'
-            b'</e:Header>'
-            b'<e:Body><d:Probe><d:Types>dn:NetworkVideoTransmitter</d:Types></d:Probe></e:Body>'
-            b'</e:Envelope>'
-        )
-        found_ips = []
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
-                sock.settimeout(timeout)
-                sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                sock.sendto(discovery_msg, ('239.255.255.250', 3702))
-                start = time.time()
-                while time.time() - start < timeout:
-                    try:
-                        data, addr = sock.recvfrom(65536)
-                        resp_str = data.decode('utf-8', errors='ignore')
-                        ips = re.findall(r'(\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})', resp_str)
-                        for ip in ips:
-                            if ip not in ["0.0.0.0", "239.255.255.250"]:
-                                found_ips.append(ip)
-                        found_ips.append(addr[0]) 
-                    except socket.timeout: break
-        except: pass
-        return list(set(found_ips))
-
-    @staticmethod
-    def scan_arp(target_mac, scan_range, timeout=2):
-        if "/16" in scan_range or "/8" in scan_range: return None
-        try:
-            ans, _ = srp(Ether(dst="ff:ff:ff:ff:ff:ff")/ARP(pdst=scan_range), 
-                         timeout=timeout, verbose=0, iface=config.INTERFACE_NAME)
-            for _, rcv in ans:
-                if CameraScanner.normalize_mac(rcv.hwsrc) == target_mac:
-                    return rcv.psrc
-        except: pass
-        return None
-
-    @staticmethod
-    def sniff_target_packet(target_mac, timeout=5):
-        found_ip = None
-        target_mac = CameraScanner.normalize_mac(target_mac)
-
-        def packet_handler(pkt):
-            nonlocal found_ip
-            if pkt.haslayer(Ether):
-                src = CameraScanner.normalize_mac(pkt[Ether].src)
-                if src == target_mac:
-                    if pkt.haslayer(ARP):
-                        found_ip = pkt[ARP].psrc
-                        return True
-                    elif pkt.haslayer("IP"):
-                        found_ip = pkt["IP"].src
-                        return True
-            return False
-
-        try:
-            sniff(iface=config.INTERFACE_NAME, stop_filter=packet_handler, timeout=timeout, store=0)
-        except: pass
-        return found_ip
-
-    @staticmethod
-    def find_ip_combined(target_mac, scan_range, timeout=40):
-        """MAC 주소로 IP 탐색 (ARP Cache, ONVIF, Sniffing)"""
-        print(f"   🔍 MAC 주소 탐색 중 ({target_mac})...", end="", flush=True)
-        target_mac = CameraScanner.normalize_mac(target_mac)
-        target_mac_dash = target_mac.replace(":", "-")
-        is_link_local = "169.254" in scan_range
-        is_large_subnet = "/16" in scan_range
-        
-        start_time = time.time()
-        last_cache_check = 0
-        
-        while time.time() - start_time < timeout:
-            current_time = time.time()
-            if current_time - last_cache_check > 3:
-                last_cache_check = current_time
-                try:
-                    out = subprocess.check_output("arp -a", shell=True).decode('cp949', errors='ignore')
-                    for line in out.splitlines():
-                        if target_mac_dash in line.lower():
-                            parts = line.split()
-                            if len(parts) < 1: continue
-                            ip = parts[0]
-                            if ip in ["0.0.0.0", "255.255.255.255"]: continue
-                            
-                            if (is_link_local and not ip.startswith("169.254")) or \
-                               (not is_link_local and ip.startswith("169.254")):
-                                continue
-                            
-                            if subprocess.call(f"ping -n 1 -w 500 {ip}", shell=True, stdout=subprocess.DEVNULL) == 0:
-                                print(f" 발견! ✅ {ip}")
-                                return ip
-                except: pass
-            
-            if is_large_subnet:
-                found_ip = CameraScanner.sniff_target_packet(target_mac, timeout=2)
-                if found_ip and found_ip != "0.0.0.0":
-                    if (is_link_local and found_ip.startswith("169.254")) or \
-                       (not is_link_local and not found_ip.startswith("169.254")):
-                        print(f" 발견! ✅ {found_ip}")
-                        return found_ip
-            else:
-                CameraScanner.scan_onvif(timeout=1)
-                found_ip = CameraScanner.scan_arp(target_mac, scan_range, timeout=2)
-                if found_ip and found_ip != "0.0.0.0":
-                    print(f" 발견! ✅ {found_ip}")
-                    return found_ip
-            
-            print(".", end="", flush=True)
-            time.sleep(1)
+    def find_ip_combined(target_mac, scan_range, timeout=40, hints=None, mode=None):
+        """
+        MAC 주소로 IP 탐색 (유력 주소 ARP, ONVIF, ARP 스윕, Sniffing 동시 실행 - discovery.py)
+        이전 실행에서 기록된 주소(탐색 캐시)를 hints 다음 순위로 먼저 확인하고, 찾은 주소는 캐시에 기록합니다.
         
+        Args:
+            hints: 우선 확인할 주소 (마지막으로 알려진 IP 등)
+            mode: 캐시 기록용 주소 체계 (static/dhcp/link_local, 미지정 시 주소로 추정)
+        """
+        print(f"   🔍 MAC 주소 탐색 중 ({target_mac})...", end="", flush=True)
+        start = time.monotonic()
+        cache = get_cache()
+        engine = DiscoveryEngine(target_mac, scan_range, hints=list(hints or []))
+        engine.add_candidates(cache.candidates(target_mac, engine.link_local), "cache")
+        with tracing.span("find_ip", "network", scan_range=scan_range):
+            found_ip = engine.run(timeout)
+        if found_ip:
+            print(f" 발견! ✅ {found_ip} ({engine.found[1]}, {time.monotonic() - start:.1f}s)")
+            cache.record(target_mac, found_ip, mode)
+            return found_ip
         print(" 실패 ❌")
         return None
     
@@ -248,7 +142,7 @@ class WebController:
     def _click_and_wait(self, selector):
         try:
             self.page.click(selector, timeout=3000)
-            time.sleep(0.5)
+            tracing.sleep(0.5)
         except: pass
 
     def get_mac_address(self):
@@ -270,36 +164,47 @@ class WebController:
 # 🕵️ [API] 카메라 설정 검증기
 # =========================================================
 class CameraApi:
+    """네트워크 설정용 API 래퍼 (공통 API 엔진 CameraApiClient 사용)"""
     def __init__(self, ip, port, user_id, user_pw):
-        self.base_url = f"http://{ip}:{port}/cgi-bin/webSetup.cgi"
-        self.session = requests.Session()
-        self.session.auth = HTTPDigestAuth(user_id, user_pw)
+        self.transport = get_http_transport(user_id, user_pw)
+        self.client = CameraApiClient(None, ip, port, transport=self.transport)
+
+    @property
+    def base_url(self):
+        return self.client.base_url
 
     def _get_config(self, action):
-        try:
-            url = f"{self.base_url}?action={action}&mode=1"
-            res = self.session.get(url, timeout=5)
-            if res.status_code == 200:
-                return dict(parse_qsl(res.text))
-        except Exception: pass
-        return {}
+        return self.client.get(action, timeout=5) or {}
 
     def _post_config(self, payload, timeout=10):
-        try:
-            res = self.session.post(self.base_url, data=payload, timeout=timeout)
-            if "returnCode=0" in res.text or "returnCode=301" in res.text:
-                return True, res.text
-            return False, res.text
-        except requests.exceptions.ReadTimeout:
-            return True, "Timeout (Expected)" # IP 변경 등에서 발생 가능
-        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError) as e:
-            # 포트 변경 중 연결이 끊기는 것은 정상 (포트가 변경되면서 연결이 끊김)
-            error_str = str(e)
-            if "Connection aborted" in error_str or "Remote end closed" in error_str or "RemoteDisconnected" in error_str:
-                return True, "Connection closed (Expected during port change)"
-            return False, str(e)
-        except Exception as e:
-            return False, str(e)
+        params = dict(payload)
+        action = params.pop("action")
+        mode = params.pop("mode", "0")
+        # IP/포트 변경 등에서 발생하는 타임아웃/연결 끊김은 정상으로 간주
+        return self.client.submit(action, params, mode, timeout=timeout, max_retries=1,
+                                  expect_disconnect=True)
+
+    def get_mac_address(self):
+        """MAC 주소 조회 (networkIp → systemInfo 순, 브라우저 없이 API만 사용)"""
+        for action in ("networkIp", "systemInfo"):
+            mac = str(self._get_config(action).get("macAddress", "")).strip()
+            if re.fullmatch(r"[0-9A-Fa-f]{2}([:-][0-9A-Fa-f]{2}){5}", mac):
+                print(f"   ✅ MAC 주소 조회 완료 (API {action}): {mac}")
+                return mac
+        return None
+
+    def _wait_for_web_port(self, ip, web_port, attempts, timeout, show_progress=None):
+        """변경된 웹 포트로 재접속하여 webPort 값 검증 (성공 시 클라이언트 교체)"""
+        new_client = CameraApiClient(None, ip, web_port, transport=self.transport)
+        for attempt in range(attempts):
+            tracing.sleep(1)
+            data = new_client.get("networkPort", timeout=timeout, max_retries=1, silent=True)
+            if data and data.get("webPort") == str(web_port):
+                self.client = new_client
+                return True
+            if show_progress is None or attempt < show_progress:
+                print(".", end="")
+        return False
 
     def set_link_local_api(self, enable=True):
         """Link-Local 설정"""
@@ -330,7 +235,7 @@ class CameraApi:
             print(f"   ❌ FEN 설정 실패")
             return False
             
-        time.sleep(2)
+        tracing.sleep(2)
         check_payload = payload.copy()
         check_payload["mode"] = "2"
         success, _ = self._post_config(check_payload)
@@ -371,22 +276,10 @@ class CameraApi:
         
         self._post_config(payload, timeout=3)
 
-        verify_url = f"http://{current_ip}:{target_web}/cgi-bin/webSetup.cgi"
         print(f"   🔄 변경된 포트({target_web})로 검증 중...", end="")
-        
-        new_session = requests.Session()
-        new_session.auth = self.session.auth
-        
-        for _ in range(20):
-            try:
-                time.sleep(1)
-                res = new_session.get(f"{verify_url}?action=networkPort&mode=1", timeout=2)
-                if res.status_code == 200 and f"webPort={target_web}" in res.text:
-                    print(" 성공 ✅")
-                    self.session = new_session
-                    self.base_url = verify_url
-                    return True
-            except: print(".", end="")
+        if self._wait_for_web_port(current_ip, target_web, attempts=20, timeout=2):
+            print(" 성공 ✅")
+            return True
         print(" 실패 ❌")
         return False
 
@@ -411,34 +304,12 @@ class CameraApi:
         }
         
         self._post_config(payload, timeout=10)
-        time.sleep(8)
+        tracing.sleep(8)
         
-        verify_url = f"http://{current_ip}:80/cgi-bin/webSetup.cgi"
         print(f"   🔄 복구된 포트(80)로 검증 중...", end="")
-        
-        new_session = requests.Session()
-        new_session.auth = self.session.auth
-        
-        for attempt in range(30):
-            try:
-                time.sleep(1)
-                res = new_session.get(f"{verify_url}?action=networkPort&mode=1", timeout=3)
-                if res.status_code == 200:
-                    if "webPort=80" in res.text:
-                        print(" 성공 ✅")
-                        self.session = new_session
-                        self.base_url = verify_url
-                        return True
-                    elif "webPort=" in res.text:
-                        match = re.search(r'webPort=(\d+)', res.text)
-                        if match and match.group(1) == "80":
-                            print(" 성공 ✅")
-                            self.session = new_session
-                            self.base_url = verify_url
-                            return True
-            except Exception:
-                if attempt < 5:
-                    print(".", end="")
+        if self._wait_for_web_port(current_ip, "80", attempts=30, timeout=3, show_progress=5):
+            print(" 성공 ✅")
+            return True
         
         print(" 실패 ❌")
         return False
@@ -519,8 +390,7 @@ def _action_verify_web_access(web, port):
         web.page.wait_for_load_state("domcontentloaded", timeout=10000)
         title = web.page.title()
         print(f"      페이지 로드 완료 (Title: {title})")
-        print(f"      👀 브라우저에서 페이지를 확인하세요. 확인 후 'Enter'를 누르세요...")
-        input()
+        wait_for_operator("      👀 브라우저에서 페이지를 확인하세요. 확인 후 'Enter'를 누르세요...")
         return True
     except Exception as e:
         print(f"      ❌ Web 접속 실패: {e}")
@@ -530,7 +400,7 @@ def _action_webguard_login(web_dummy, fen_url, user, pw):
     """WebGuard 로그인 실행"""
     try:
         web_dummy.page.goto(fen_url)
-        time.sleep(5)
+        tracing.sleep(5)
         return webgaurd.run_login(user, pw)
     except:
         return False
@@ -568,9 +438,15 @@ def run_integrated_network_test(args):
         NetworkManager.set_static_ip(config.PC_STATIC_IP, config.PC_SUBNET, config.PC_GW)
         
         if NetworkManager.ping(ctx["CAM_IP"]):
-            target_mac = _run_web_action(_action_get_mac, ctx)
+            # MAC 조회: 탐색 캐시 → API → (실패 시에만) 브라우저 Web UI
+            api = CameraApi(ctx["CAM_IP"], ctx["PORT"], ctx["ID"], ctx["PW"])
+            target_mac = cached_mac(ctx["CAM_IP"])
             if target_mac:
-                api = CameraApi(ctx["CAM_IP"], ctx["PORT"], ctx["ID"], ctx["PW"])
+                print(f"   ♻️ 탐색 캐시의 MAC 사용: {target_mac}")
+            else:
+                target_mac = api.get_mac_address() or _run_web_action(_action_get_mac, ctx)
+            if target_mac:
+                get_cache().record(target_mac, ctx["CAM_IP"], "static", port=ctx["PORT"])
                 api.set_link_local_api(enable=True)
                 print(f"   ✅ Step 1 완료 (MAC: {target_mac})")
         else: 
@@ -585,7 +461,7 @@ def run_integrated_network_test(args):
         print("\n[Step 2/13] Auto-IP 검증 (169.254.x.x) 및 DHCP 설정")
         NetworkManager.set_static_ip(config.PC_AUTO_IP, config.AUTO_SUBNET)
         NetworkManager.run_cmd("arp -d *")
-        time.sleep(3)
+        tracing.sleep(3)
         
         auto_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_AUTO_NET, timeout=40)
         
@@ -606,19 +482,20 @@ def run_integrated_network_test(args):
         new_dhcp_ip = None
         if NetworkManager.wait_for_dhcp("10."):
             NetworkManager.run_cmd("arp -d *")
-            time.sleep(3)
+            tracing.sleep(3)
             
             start_scan = time.time()
             while time.time() - start_scan < 60:
-                temp_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_NET, timeout=8)
+                temp_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_NET, timeout=8,
+                                                         hints=[ctx["CAM_IP"]])
                 if temp_ip:
                     if temp_ip.startswith("169.254"):
                         NetworkManager.run_cmd("arp -d *")
-                        time.sleep(3)
+                        tracing.sleep(3)
                         continue
                     
                     if temp_ip == ctx["CAM_IP"]:
-                        if subprocess.call(f"ping -n 1 -w 1000 {temp_ip}", shell=True, stdout=subprocess.DEVNULL) == 0:
+                        if reachability.is_reachable(temp_ip, timeout=1):
                             new_dhcp_ip = temp_ip
                             break
                         else:
@@ -627,7 +504,7 @@ def run_integrated_network_test(args):
                     
                     new_dhcp_ip = temp_ip
                     break
-                time.sleep(3)
+                tracing.sleep(3)
 
             if new_dhcp_ip:
                 print(f"   ✅ Step 3 완료 (카메라 DHCP IP: {new_dhcp_ip})")
@@ -648,9 +525,9 @@ def run_integrated_network_test(args):
                 
                 # 세션 갱신 (SSL Toggle)
                 api.set_ssl(True)
-                time.sleep(10)
+                tracing.sleep(10)
                 api.set_ssl(False)
-                time.sleep(10)
+                tracing.sleep(10)
 
                 if iRAS_test.run_fen_verification("TcpDirectExternal"):
                     print("   ✅ Step 4 완료 (TcpDirectExternal)")
@@ -663,13 +540,17 @@ def run_integrated_network_test(args):
         # Step 5: UPNP 활성화 및 DirectInternal 검증
         # =========================================================
         router_cam_ip = None
-        if new_dhcp_ip:
+        if new_dhcp_ip and not config.RUN_SETTINGS["interactive"]:
+            # 공유기 연결/차단 등 케이블 작업이 필요한 Step 5~7은 무인 모드에서 건너뜀
+            print("\n[Step 5~7/13] ⏭️  무인 모드: 공유기 연결 작업이 필요한 단계 건너뜀")
+        elif new_dhcp_ip:
             print("\n[Step 5/13] UPNP 활성화 및 DirectInternal 검증")
-            input("   🚨 [ACTION] 카메라와 PC를 '공유기'에 연결하고 Enter >> ")
+            wait_for_operator("   🚨 [ACTION] 카메라와 PC를 '공유기'에 연결하고 Enter >> ")
             NetworkManager.set_dhcp()
             NetworkManager.wait_for_dhcp("192.")
             
-            router_cam_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_NET, timeout=40)
+            router_cam_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_NET, timeout=40,
+                                                           hints=[new_dhcp_ip])
             if not router_cam_ip:
                 router_cam_ip = auto_ip
 
@@ -688,15 +569,15 @@ def run_integrated_network_test(args):
             print("\n[Step 6/13] UDP Hole Punching 검증")
             api = CameraApi(router_cam_ip, ctx["PORT"], ctx["ID"], ctx["PW"])
             api.set_upnp_api(False)
-            time.sleep(5)
+            tracing.sleep(5)
             
             # 세션 갱신
             api.set_ssl(True)
-            time.sleep(5)
+            tracing.sleep(5)
             api.set_ssl(False)
-            time.sleep(5)
+            tracing.sleep(5)
 
-            input("   🚨 [ACTION] PC만 '사내망'으로 이동하고 Enter >> ")
+            wait_for_operator("   🚨 [ACTION] PC만 '사내망'으로 이동하고 Enter >> ")
             NetworkManager.set_dhcp()
             NetworkManager.wait_for_dhcp("10.")
             iRAS_test.wait_for_connection()
@@ -708,15 +589,16 @@ def run_integrated_network_test(args):
         # =========================================================
         if router_cam_ip:
             print("\n[Step 7/13] FEN Relay 검증")
-            input("   🚨 [ACTION] 공유기 'UDP 차단' 후 사내망 복귀, Enter >> ")
+            wait_for_operator("   🚨 [ACTION] 공유기 'UDP 차단' 후 사내망 복귀, Enter >> ")
             iRAS_test.wait_for_connection()
             if iRAS_test.run_fen_verification("Relay"):
                 print("   ✅ Step 7 완료 (Relay)")
 
-            input("   🚨 [ACTION] '카메라'를 사내망으로 복귀 후 Enter >> ")
+            wait_for_operator("   🚨 [ACTION] '카메라'를 사내망으로 복귀 후 Enter >> ")
 
             NetworkManager.run_cmd("arp -d *")
-            new_dhcp_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_NET, timeout=20)
+            new_dhcp_ip = CameraScanner.find_ip_combined(target_mac, config.SCAN_NET, timeout=20,
+                                                          hints=[new_dhcp_ip, ctx["CAM_IP"]])
 
             if new_dhcp_ip:
                 current_test_ip = new_dhcp_ip
@@ -741,7 +623,7 @@ def run_integrated_network_test(args):
             print("\n[Step 9/13] 네트워크 설정 복구 (고정 IP)")
             api = CameraApi(new_dhcp_ip, ctx["PORT"], ctx["ID"], ctx["PW"])
             if api.set_ip_address_api("manual", config.CAMERA_IP, config.PC_GW, config.PC_SUBNET):
-                time.sleep(5)
+                tracing.sleep(5)
                 if NetworkManager.ping(config.CAMERA_IP, timeout=10):
                     if iRAS_test.run_restore_ip_process(config.IRAS_DEVICE_NAME, config.CAMERA_IP):
                         print("   ✅ Step 9 완료 (고정 IP 복구)")
@@ -764,7 +646,7 @@ def run_integrated_network_test(args):
                     if api.set_ports_api(web_port="8080", remote_port="9200"):
                         ctx["PORT"] = "8080"
                         print("   ✅ 포트 변경 성공")
-                        time.sleep(3)
+                        tracing.sleep(3)
                         
                         print(f"   → 웹 접속 확인: http://{current_test_ip}:8080")
                         if _run_web_action(_action_verify_web_access, ctx, "8080"):
@@ -783,7 +665,7 @@ def run_integrated_network_test(args):
                         if recovery_api.reset_ports_default():
                             print("   ✅ 포트 복구 완료")
                             ctx["PORT"] = "80"
-                            time.sleep(3)
+                            tracing.sleep(3)
                             
                             print(f"   → Live 화면 연결 확인 중...")
                             if iRAS_test.wait_for_connection(timeout=30):
@@ -806,14 +688,14 @@ def run_integrated_network_test(args):
             api = CameraApi(current_test_ip, ctx["PORT"], ctx["ID"], ctx["PW"])
             
             api.set_bandwidth_limit(True, 102400)
-            time.sleep(3)
+            tracing.sleep(3)
 
             base_ips = iRAS_test.IRASController().get_current_ips()
             print(f"   → Base IPS: {base_ips}")
 
             if api.set_bandwidth_limit(True, 1024):
                 print("   → 대역폭 제한 설정 (1024 kbps), 20초 대기 중...")
-                time.sleep(20)
+                tracing.sleep(20)
                 
                 limit_ips = iRAS_test.IRASController().get_current_ips()
                 print(f"   → Limit IPS: {limit_ips}")
@@ -825,10 +707,10 @@ def run_integrated_network_test(args):
             else:
                 print("   ❌ 대역폭 제한 설정 실패")
             
-            time.sleep(5)
+            tracing.sleep(5)
             api.set_bandwidth_limit(False)
             print("   → 대역폭 제한 해제 완료")
-            time.sleep(5)
+            tracing.sleep(5)
 
         # =========================================================
         # Step 12: IP 필터링 테스트
@@ -840,7 +722,7 @@ def run_integrated_network_test(args):
             
             print(f"   → IP 차단 설정: {my_ip}")
             if api.set_ip_filter("deny", deny_list=my_ip):
-                time.sleep(5)
+                tracing.sleep(5)
                 try:
                     requests.get(f"http://{current_test_ip}:{ctx['PORT']}", timeout=3)
                     print("   ❌ 접속 차단 실패 (접속됨)")
@@ -855,7 +737,7 @@ def run_integrated_network_test(args):
                 NetworkManager.set_static_ip(config.PC_STATIC_IP, config.PC_SUBNET, config.PC_GW)
                 print("   → IP 필터 복구 완료")
 
-            time.sleep(5)
+            tracing.sleep(5)
 
         # =========================================================
         # Step 13: SSL 모드 검증
@@ -869,7 +751,7 @@ def run_integrated_network_test(args):
                                    ("veryHigh", "FullPacket")]:
                 print(f"   → SSL 모드 변경: {mode}")
                 if api.set_ssl(True, mode):
-                    time.sleep(20)
+                    tracing.sleep(20)
                     status = iRAS_test.IRASController().get_current_ssl_info()
                     if status and expected.lower() in status.lower().replace(" ", ""):
                         print(f"   ✅ {mode} 검증 성공")
@@ -897,6 +779,10 @@ if __name__ == "__main__":
     parser.add_argument('--id', default=None, help='카메라 사용자 ID')
     parser.add_argument('--pw', default=None, help='카메라 비밀번호')
     parser.add_argument('--iface', default=None, help='네트워크 인터페이스 이름')
+    parser.add_argument('--headless', action='store_true', help='무인 모드 (사용자 입력 없이 실행)')
     args = parser.parse_args()
+    config.RUN_SETTINGS["interactive"] = not args.headless
     
-    run_integrated_network_test(args)
+    success, msg = run_integrated_network_test(args)
+    print(f"\n{'✅' if success else '❌'} {msg}")
+    sys.exit(0 if success else 1)
@@ -0,0 +1,198 @@
+"""
+프로세스 내 도달성 검사 (ping 서브프로세스 대체)
+
+- ICMP: raw 소켓 1개로 모든 대상에 Echo Request를 보내고 응답을 식별자/순번으로 매칭
+  (raw 소켓은 관리자 권한 필요 - 네트워크 테스트는 관리자 권한으로 실행됨)
+- TCP: raw 소켓을 쓸 수 없으면 웹 포트 연결로 판단 (check_port_open과 같은 방식,
+  연결 거부(RST)도 장치가 살아 있다는 응답으로 인정)
+
+asyncio 이벤트 루프에서 수백 개 주소를 동시에 검사하며 대상별 RTT(ms)를 반환합니다.
+
+    rtts = probe_hosts(["10.0.131.104", "10.0.131.105"])   # {ip: RTT ms 또는 None}
+    hit = first_responder(candidates)                      # (ip, RTT ms) 또는 None
+"""
+import asyncio
+import itertools
+import os
+import socket
+import struct
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import config
+from config import REACHABILITY_SETTINGS
+import tracing
+
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_IDENT = os.getpid() & 0xFFFF
+_SEQ = itertools.count(1)
+_ICMP_STATE = {"allowed": None}  # raw 소켓 사용 가능 여부 (첫 시도 후 캐시)
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(seq: int) -> bytes:
+    payload = b"camtest-reachability"
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, _IDENT, seq)
+    return struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, _checksum(header + payload), _IDENT, seq) + payload
+
+
+def _open_icmp_socket() -> Optional[socket.socket]:
+    """raw ICMP 소켓 (권한이 없으면 None, 결과는 프로세스 내 캐시)"""
+    if _ICMP_STATE["allowed"] is False or REACHABILITY_SETTINGS["method"] == "tcp":
+        return None
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    except OSError:
+        _ICMP_STATE["allowed"] = False
+        return None
+    _ICMP_STATE["allowed"] = True
+    sock.setblocking(False)
+    return sock
+
+
+# ===========================================================
+# 📡 [Async] 검사 코루틴
+# ===========================================================
+async def _icmp_probe(sock: socket.socket, ips: List[str], timeout: float, first: bool) -> Dict[str, float]:
+    """Echo Request 일괄 전송 후 응답 수집 {ip: RTT ms}"""
+    loop = asyncio.get_running_loop()
+    pending: Dict[int, Tuple[str, float]] = {}
+    for ip in ips:
+        seq = next(_SEQ) & 0xFFFF
+        try:
+            sock.sendto(_echo_request(seq), (ip, 0))
+        except OSError:
+            continue
+        pending[seq] = (ip, time.perf_counter())
+
+    results: Dict[str, float] = {}
+    deadline = loop.time() + timeout
+    while pending and loop.time() < deadline:
+        try:
+            data = await asyncio.wait_for(loop.sock_recv(sock, 1024), deadline - loop.time())
+        except asyncio.TimeoutError:
+            break
+        received = time.perf_counter()
+        offset = (data[0] & 0x0F) * 4  # IP 헤더 길이
+        if len(data) < offset + 8:
+            continue
+        icmp_type, _, _, ident, seq = struct.unpack_from("!BBHHH", data, offset)
+        if icmp_type != _ICMP_ECHO_REPLY or ident != _IDENT or seq not in pending:
+            continue
+        ip, sent = pending.pop(seq)
+        if socket.inet_ntoa(data[12:16]) != ip:
+            continue
+        results[ip] = round((received - sent) * 1000, 1)
+        if first:
+            break
+    return results
+
+
+async def _tcp_connect(ip: str, port: int, timeout: float, limit: asyncio.Semaphore) -> Tuple[str, Optional[float]]:
+    """(ip, TCP 연결 RTT ms) - 연결 거부도 응답으로 인정, 무응답이면 None"""
+    async with limit:
+        start = time.perf_counter()
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), timeout)
+        except ConnectionRefusedError:
+            return ip, round((time.perf_counter() - start) * 1000, 1)
+        except (OSError, asyncio.TimeoutError):
+            return ip, None
+        rtt = round((time.perf_counter() - start) * 1000, 1)
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+        return ip, rtt
+
+
+async def _tcp_probe(ips: List[str], port: int, timeout: float, first: bool) -> Dict[str, float]:
+    limit = asyncio.Semaphore(REACHABILITY_SETTINGS["max_concurrency"])
+    tasks = [asyncio.ensure_future(_tcp_connect(ip, port, timeout, limit)) for ip in ips]
+    results: Dict[str, float] = {}
+    try:
+        for done in asyncio.as_completed(tasks):
+            ip, rtt = await done
+            if rtt is None:
+                continue
+            results[ip] = rtt
+            if first:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    return results
+
+
+async def probe_async(ips: Iterable[str], port: int = None, timeout: float = None,
+                      first: bool = False) -> Dict[str, float]:
+    """
+    여러 주소 동시 검사 (응답한 주소만 {ip: RTT ms})
+
+    Args:
+        port: TCP 대체 검사 포트 (기본 config.CAMERA_PORT)
+        first: True면 첫 응답 즉시 반환
+    """
+    ips = list(dict.fromkeys(ip for ip in ips if ip))
+    if not ips:
+        return {}
+    timeout = REACHABILITY_SETTINGS["timeout"] if timeout is None else timeout
+    sock = _open_icmp_socket()
+    if sock is None:
+        return await _tcp_probe(ips, int(port or config.CAMERA_PORT), timeout, first)
+    with sock:
+        return await _icmp_probe(sock, ips, timeout, first)
+
+
+# ===========================================================
+# 🔧 [API] 동기 단축 함수
+# ===========================================================
+def probe_hosts(ips: Iterable[str], port: int = None, timeout: float = None) -> Dict[str, Optional[float]]:
+    """모든 주소의 RTT (ms, 무응답이면 None)"""
+    ips = list(ips)
+    with tracing.span(f"probe x{len(ips)}", "network"):
+        results = asyncio.run(probe_async(ips, port, timeout))
+    return {ip: results.get(ip) for ip in ips}
+
+
+def first_responder(ips: Iterable[str], port: int = None, timeout: float = None) -> Optional[Tuple[str, float]]:
+    """가장 먼저 응답한 주소와 RTT (없으면 None)"""
+    results = asyncio.run(probe_async(ips, port, timeout, first=True))
+    return next(iter(results.items()), None)
+
+
+def is_reachable(ip: str, port: int = None, timeout: float = None) -> bool:
+    return first_responder([ip], port, timeout) is not None
+
+
+def method() -> str:
+    """현재 검사 방식 ("icmp" | "tcp")"""
+    sock = _open_icmp_socket()
+    if sock is None:
+        return "tcp"
+    sock.close()
+    return "icmp"
+
+
+def wait_reachable(ip: str, timeout: float = 30, port: int = None) -> Optional[float]:
+    """응답할 때까지 반복 검사 후 RTT 반환 (timeout 내 무응답이면 None)"""
+    deadline = time.monotonic() + timeout
+    while True:
+        hit = first_responder([ip], port)
+        if hit:
+            return hit[1]
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        tracing.sleep(min(REACHABILITY_SETTINGS["interval"], remaining))
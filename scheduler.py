@@ -0,0 +1,195 @@
+"""
+자원 인식 테스트 스케줄러
+
+각 테스트가 선언한 자원(TEST_CATEGORIES 5번째 항목)을 기준으로
+서로 충돌하지 않는 테스트는 동시에 실행하고, 충돌하는 테스트는 직렬화합니다.
+
+- 카메라 1대의 테스트는 하나의 레인(워커 프로세스)에서 순서대로 실행 (카메라 자체가 배타 자원)
+- PC에 하나뿐인 자원(iRAS 창, NIC, SMTP/FTP 수신 서버)은 모든 레인이 공유하며
+  필요한 자원을 한꺼번에 획득할 수 있을 때만 실행 (교착 없음)
+- 레인은 다음 테스트의 자원이 사용 중이면 자원이 비어 있는 뒤쪽 테스트를 먼저 실행
+  (재부팅/NIC 재설정 테스트는 순서를 유지)
+- 실행 기록으로 크리티컬 패스(전체 실행 시간을 결정한 테스트 사슬)를 계산
+"""
+import time
+from typing import Dict, List, Optional, Tuple
+
+# ===========================================================
+# 📦 자원 정의
+# ===========================================================
+RES_BROWSER = "browser"  # 카메라 웹 UI (Playwright 페이지)
+RES_IRAS = "iras"        # iRAS 데스크톱 창 (PC당 1개)
+RES_NIC = "nic"          # PC NIC IP 재설정
+RES_REBOOT = "reboot"    # 카메라 재부팅/초기화
+RES_SINK = "sink"        # SMTP/FTP 수신 서버
+
+# 레인(카메라) 간 공유되는 PC 전역 자원
+GLOBAL_RESOURCES = (RES_IRAS, RES_NIC, RES_SINK)
+
+# 카메라 상태(IP/설정)를 바꾸는 자원: 이 자원을 쓰는 테스트는 앞 테스트를 건너뛰어 먼저 실행하지 않음
+ORDERED_RESOURCES = (RES_REBOOT, RES_NIC)
+
+
+def global_resources(resources) -> Tuple[str, ...]:
+    """테스트 자원 중 레인 간 잠금이 필요한 전역 자원만 (정렬)"""
+    return tuple(sorted(r for r in resources if r in GLOBAL_RESOURCES))
+
+
+# ===========================================================
+# 🔒 자원 중개자 (프로세스 간 공유)
+# ===========================================================
+class ResourceBroker:
+    """
+    여러 워커 프로세스가 공유하는 전역 자원 점유 관리자
+
+    multiprocessing.Manager의 Condition/dict를 사용하므로 프로세스 간에 전달할 수 있습니다.
+    """
+
+    def __init__(self, manager):
+        self._cond = manager.Condition()
+        self._held = manager.dict()
+
+    def try_acquire(self, resources, owner: str) -> bool:
+        """자원을 모두 점유할 수 있으면 점유 후 True (일부만 점유하지 않음)"""
+        if not resources:
+            return True
+        with self._cond:
+            if any(self._held.get(r) for r in resources):
+                return False
+            for r in resources:
+                self._held[r] = owner
+            return True
+
+    def release(self, resources):
+        if not resources:
+            return
+        with self._cond:
+            for r in resources:
+                self._held[r] = None
+            self._cond.notify_all()
+
+    def wait_for_release(self, timeout: float = 1.0):
+        """다른 레인이 자원을 반납할 때까지 대기"""
+        with self._cond:
+            self._cond.wait(timeout)
+
+    def holders(self) -> Dict[str, Optional[str]]:
+        return dict(self._held)
+
+
+# ===========================================================
+# 🛣️ 레인 실행 (워커 프로세스 내부)
+# ===========================================================
+def run_lane(lane: str, tasks: List[dict], broker: ResourceBroker, execute) -> List[dict]:
+    """
+    카메라 1대의 테스트를 자원 상황에 맞춰 순서대로 실행
+
+    Args:
+        lane: 레인 이름 (카메라 IP)
+        tasks: [{"test_id", "name", "resources", ...}, ...] (목록 순서가 기본 우선순위)
+        broker: 전역 자원 중개자
+        execute: execute(task) -> (성공 여부, 메시지) 또는 (성공 여부, 메시지, 기록에 추가할 dict)
+
+    Returns:
+        실행 기록 [{"lane", "test_id", "name", "resources", "ready", "start", "end", "success", "message"}, ...]
+    """
+    pending = list(tasks)
+    records = []
+    ready = time.time()
+
+    while pending:
+        # 자원을 바로 점유할 수 있는 첫 번째 테스트 선택
+        chosen = None
+        for i, task in enumerate(pending):
+            if i > 0 and any(r in ORDERED_RESOURCES for r in task["resources"]):
+                break
+            if broker.try_acquire(global_resources(task["resources"]), lane):
+                chosen = task
+                break
+        if chosen is None:
+            broker.wait_for_release()
+            continue
+
+        pending.remove(chosen)
+        held = global_resources(chosen["resources"])
+        start = time.time()
+        extra = {}
+        try:
+            success, msg, *rest = execute(chosen)
+            if rest:
+                extra = rest[0]
+        except Exception as e:
+            success, msg = False, f"예외 발생: {e}"
+        finally:
+            broker.release(held)
+        end = time.time()
+
+        records.append({
+            "lane": lane, "test_id": chosen["test_id"], "name": chosen["name"],
+            "resources": list(chosen["resources"]),
+            "ready": ready, "start": start, "end": end,
+            "success": bool(success), "message": msg,
+            **extra,
+        })
+        ready = end
+    return records
+
+
+# ===========================================================
+# 📈 크리티컬 패스 분석
+# ===========================================================
+def critical_path(records: List[dict]) -> List[dict]:
+    """
+    마지막에 끝난 테스트에서 거꾸로, 시작을 지연시킨 선행 테스트를 따라가 사슬 구성
+
+    선행 테스트 = 같은 레인의 직전 테스트 또는 같은 전역 자원을 쓴 테스트 중
+                 해당 테스트 시작 전에 가장 늦게 끝난 테스트
+    """
+    if not records:
+        return []
+    chain = [max(records, key=lambda r: r["end"])]
+    while True:
+        current = chain[-1]
+        shared = set(global_resources(current["resources"]))
+        candidates = [
+            r for r in records
+            if r is not current and r["end"] <= current["start"] + 1e-6
+            and (r["lane"] == current["lane"] or shared & set(global_resources(r["resources"])))
+        ]
+        if not candidates:
+            break
+        chain.append(max(candidates, key=lambda r: r["end"]))
+    chain.reverse()
+    return chain
+
+
+def print_schedule_report(records: List[dict]):
+    """레인별 실행 시간과 크리티컬 패스 출력"""
+    if not records:
+        return
+    t0 = min(r["ready"] for r in records)
+    wall = max(r["end"] for r in records) - t0
+    busy = sum(r["end"] - r["start"] for r in records)
+
+    print(f"\n{'='*60}")
+    print("🗓️  스케줄 리포트")
+    print(f"{'='*60}")
+    lanes = {}
+    for r in records:
+        lanes.setdefault(r["lane"], []).append(r)
+    for lane, items in lanes.items():
+        run = sum(r["end"] - r["start"] for r in items)
+        wait = sum(r["start"] - r["ready"] for r in items)
+        print(f"   {lane:<18} 실행 {run:7.1f}s   자원 대기 {wait:6.1f}s   ({len(items)}개)")
+    print(f"   전체 소요 {wall:.1f}s / 테스트 합계 {busy:.1f}s (병렬 효율 x{busy / wall if wall else 1:.2f})")
+
+    chain = critical_path(records)
+    print(f"\n⛓️  크리티컬 패스 ({len(chain)}개 테스트)")
+    for r in chain:
+        wait = r["start"] - r["ready"]
+        wait_str = f"  (자원 대기 {wait:.1f}s)" if wait > 0.5 else ""
+        print(f"   +{r['start'] - t0:7.1f}s  {r['lane']:<16} {r['test_id']:<16} "
+              f"{r['end'] - r['start']:7.1f}s{wait_str}")
+    dominant = max(chain, key=lambda r: r["end"] - r["start"])
+    print(f"   👉 가장 오래 걸린 테스트: {dominant['test_id']} @ {dominant['lane']} "
+          f"({dominant['end'] - dominant['start']:.1f}s, 전체의 {(dominant['end'] - dominant['start']) / wall * 100 if wall else 0:.0f}%)")
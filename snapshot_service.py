@@ -0,0 +1,272 @@
+"""
+스냅샷 저장 서비스
+
+videoSnapshot API 응답(JPEG)을 백그라운드 스레드에서 파일로 바로 기록합니다.
+- HttpTransport: 공유 keep-alive 연결 풀로 받아 청크 단위로 디스크에 기록 (base64/IPC 없음)
+- PlaywrightTransport: Playwright page는 스레드 간 공유가 안 되므로 호출 스레드에서 바로 저장
+
+테스트는 capture()가 반환하는 Future를 기다리지 않고 다음 단계로 진행하며,
+테스트 종료 시 flush_snapshots()로 남은 다운로드를 마무리합니다.
+
+SnapshotRecorder는 일정 주기로 스냅샷을 메모리 링 버퍼에만 쌓아 두었다가
+테스트가 실패했을 때 최근 구간과 당시 비디오 설정만 디스크에 저장합니다. (실패 분석용, 기본 비활성)
+"""
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Optional, Tuple
+
+import config
+from config import SNAPSHOT_SETTINGS, RECORDER_SETTINGS
+from api_client import HttpTransport, get_api_client, snapshot_video_settings
+import tracing
+
+
+def resolve_capture_path(file_name: Optional[str] = None, subfolder: Optional[str] = None) -> str:
+    """저장 경로 결정 (config.CAPTURE_DIR 또는 바탕화면/TestCapture, 확장자는 .jpg로 통일)"""
+    desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
+    save_folder = config.CAPTURE_DIR or os.path.join(desktop_path, "TestCapture")
+    if subfolder:
+        save_folder = os.path.join(save_folder, subfolder)
+    os.makedirs(save_folder, exist_ok=True)
+
+    if file_name is None:
+        file_name = f"snapshot_{time.strftime('%Y%m%d_%H%M%S')}.jpg"
+    if not file_name.lower().endswith(('.jpg', '.jpeg')):
+        file_name = file_name.rsplit('.', 1)[0] + '.jpg'
+    return os.path.join(save_folder, file_name)
+
+
+class SnapshotService:
+    """카메라 1대의 스냅샷 다운로드 큐"""
+
+    def __init__(self, client, workers: int = None):
+        self.client = client
+        self.workers = workers or SNAPSHOT_SETTINGS["workers"]
+        self._executor = None
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    @property
+    def background(self) -> bool:
+        """백그라운드 다운로드 가능 여부 (HTTP 전송일 때만)"""
+        return isinstance(self.client.transport, HttpTransport)
+
+    def capture(self, file_name: Optional[str] = None, stream_index: int = None) -> Future:
+        """
+        스냅샷 요청 (즉시 반환)
+
+        Returns:
+            Future: 결과는 (저장 경로, 바이트 수) - 실패 시 바이트 수 0
+        """
+        path = resolve_capture_path(file_name)
+        params = {"action": "videoSnapshot", "mode": "1",
+                  "streamIndex": stream_index or SNAPSHOT_SETTINGS["stream_index"]}
+
+        if not self.background:
+            future = Future()
+            future.set_result(self._download(path, params))
+            return future
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix=f"snapshot-{self.client.camera_ip}")
+            future = self._executor.submit(self._download, path, params)
+            self._pending.add(future)
+        future.add_done_callback(self._discard)
+        return future
+
+    def grab(self, stream_index: int = None) -> Optional[bytes]:
+        """스냅샷 1장을 메모리로 받아 반환 (이미지 검증용, 호출 스레드에서 동기 실행)"""
+        params = {"action": "videoSnapshot", "mode": "1",
+                  "streamIndex": stream_index or SNAPSHOT_SETTINGS["stream_index"]}
+        with tracing.span("videoSnapshot", "snapshot"):
+            return self.client.transport.fetch(self.client.base_url, params=params,
+                                               timeout=SNAPSHOT_SETTINGS["timeout"])
+
+    def _download(self, path: str, params: dict) -> Tuple[str, int]:
+        with tracing.span(os.path.basename(path), "snapshot"):
+            size = self.client.transport.download(self.client.base_url, path, params=params,
+                                                  chunk_size=SNAPSHOT_SETTINGS["chunk_size"],
+                                                  timeout=SNAPSHOT_SETTINGS["timeout"])
+        if size == 0:
+            print(f"   ⚠️ 스냅샷 저장 실패: {os.path.basename(path)}")
+        return path, size
+
+    def _discard(self, future: Future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def flush(self, timeout: float = None) -> int:
+        """진행 중인 다운로드가 끝날 때까지 대기 후 미완료 건수 반환"""
+        with self._lock:
+            pending = list(self._pending)
+        if not pending:
+            return 0
+        _, not_done = wait(pending, timeout=timeout)
+        return len(not_done)
+
+    def close(self):
+        """남은 다운로드 완료 후 스레드 정리"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+# 카메라별 공유 서비스: {(camera_ip, base_port): SnapshotService}
+_SERVICES: Dict[Tuple[str, str], SnapshotService] = {}
+_SERVICES_LOCK = threading.Lock()
+
+
+def get_snapshot_service(camera_ip: str, base_port: str = "80", page=None) -> SnapshotService:
+    """카메라별 공유 SnapshotService 반환 (전송 계층은 get_api_client와 동일)"""
+    client = get_api_client(camera_ip, base_port, page=page)
+    key = (camera_ip, str(base_port))
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(key)
+        if service is None or service.client is not client:
+            service = SnapshotService(client)
+            _SERVICES[key] = service
+        return service
+
+
+def flush_snapshots(timeout: float = None) -> int:
+    """모든 카메라의 진행 중인 스냅샷 다운로드 완료 대기 (미완료 건수 반환)"""
+    with _SERVICES_LOCK:
+        services = list(_SERVICES.values())
+    return sum(service.flush(timeout) for service in services)
+
+
+# ===========================================================
+# 🎞️ [Recorder] 실패 분석용 링 버퍼 녹화
+# ===========================================================
+class SnapshotRecorder:
+    """
+    주기적으로 스냅샷을 받아 메모리 링 버퍼에 보관 (프레임 수 / 전체 바이트 수 제한)
+    통과한 테스트에서는 디스크 I/O가 없고, dump() 호출 시에만 최근 프레임을 저장합니다.
+    """
+
+    def __init__(self, client, interval: float = None, max_frames: int = None, max_bytes: int = None):
+        self.client = client
+        self.interval = interval or RECORDER_SETTINGS["interval"]
+        self.max_bytes = max_bytes or RECORDER_SETTINGS["max_bytes"]
+        self._frames = deque(maxlen=max_frames or RECORDER_SETTINGS["max_frames"])
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, daemon=True,
+                                            name=f"recorder-{self.client.camera_ip}")
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=SNAPSHOT_SETTINGS["timeout"])
+            self._thread = None
+
+    def _run(self):
+        params = {"action": "videoSnapshot", "mode": "1", "streamIndex": SNAPSHOT_SETTINGS["stream_index"]}
+        next_time = time.monotonic()
+        while not self._stop.is_set():
+            data = self.client.transport.fetch(self.client.base_url, params=params,
+                                               timeout=SNAPSHOT_SETTINGS["timeout"])
+            if data:
+                self._push(time.time(), data)
+            # 다운로드 시간과 무관하게 주기 유지 (밀린 경우 다음 주기부터)
+            next_time = max(next_time + self.interval, time.monotonic())
+            self._stop.wait(next_time - time.monotonic())
+
+    def _push(self, timestamp: float, data: bytes):
+        with self._lock:
+            if len(self._frames) == self._frames.maxlen:
+                self._bytes -= len(self._frames[0][1])
+            self._frames.append((timestamp, data))
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._frames) > 1:
+                self._bytes -= len(self._frames.popleft()[1])
+
+    def frames(self, seconds: float = None) -> list:
+        """최근 seconds초 구간의 [(시각, JPEG 바이트), ...] (None이면 전체)"""
+        with self._lock:
+            frames = list(self._frames)
+        if seconds is None:
+            return frames
+        since = time.time() - seconds
+        return [f for f in frames if f[0] >= since]
+
+    def dump(self, label: str, seconds: float = None) -> list:
+        """최근 프레임을 '<label>_<시각>.jpg'로 저장 후 경로 목록 반환"""
+        seconds = RECORDER_SETTINGS["dump_seconds"] if seconds is None else seconds
+        frames = self.frames(seconds)
+        if not frames:
+            return []
+        label = re.sub(r'[\\/:*?"<>|\s]+', "_", label).strip("_") or "failure"
+        paths = []
+        for timestamp, data in frames:
+            stamp = time.strftime("%H%M%S", time.localtime(timestamp)) + f"_{int(timestamp * 1000) % 1000:03d}"
+            path = resolve_capture_path(f"{label}_{stamp}.jpg", RECORDER_SETTINGS["folder"])
+            with open(path, "wb") as f:
+                f.write(data)
+            paths.append(path)
+        print(f"   🎞️ 실패 직전 {len(paths)}프레임 저장: {os.path.dirname(paths[0])}")
+        self._dump_settings(os.path.join(os.path.dirname(paths[0]), f"{label}_{stamp}_settings.json"))
+        return paths
+
+    def _dump_settings(self, path: str):
+        """실패 시점의 비디오 설정 전체(VIDEO_SETTING_ACTIONS)를 동시 조회해 JSON으로 저장"""
+        try:
+            settings = snapshot_video_settings(self.client.camera_ip, self.client.base_port)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(settings, f, ensure_ascii=False, indent=2)
+        except Exception as e:
+            print(f"   ⚠️ 비디오 설정 저장 실패: {e}")
+
+
+# 카메라별 녹화기: {camera_ip: SnapshotRecorder}
+_RECORDERS: Dict[str, SnapshotRecorder] = {}
+
+
+def start_recorder(camera_ip: str, base_port: str = "80", page=None) -> Optional[SnapshotRecorder]:
+    """
+    RUN_SETTINGS["record"]일 때 카메라 녹화 시작
+    HTTP 전송이 아니면 (브라우저 page는 다른 스레드에서 사용 불가) 녹화하지 않습니다.
+    """
+    if not config.RUN_SETTINGS.get("record"):
+        return None
+    client = get_api_client(camera_ip, base_port, page=page)
+    if not isinstance(client.transport, HttpTransport):
+        print("   ⚠️ HTTP 전송이 아니므로 스냅샷 녹화를 사용하지 않습니다.")
+        return None
+    with _SERVICES_LOCK:
+        recorder = _RECORDERS.get(camera_ip)
+        if recorder is None:
+            recorder = SnapshotRecorder(client)
+            _RECORDERS[camera_ip] = recorder
+    recorder.start()
+    return recorder
+
+
+def dump_recorder(camera_ip: str, label: str) -> list:
+    """카메라 녹화기의 최근 프레임 저장 (녹화 중이 아니면 빈 목록)"""
+    recorder = _RECORDERS.get(camera_ip)
+    return recorder.dump(label) if recorder else []
+
+
+def stop_recorders():
+    """모든 녹화 중지"""
+    with _SERVICES_LOCK:
+        recorders = list(_RECORDERS.values())
+        _RECORDERS.clear()
+    for recorder in recorders:
+        recorder.stop()
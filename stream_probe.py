@@ -0,0 +1,606 @@
+"""
+RTSP 스트림 통계 측정 (iRAS 클립보드 스크래핑 대체)
+
+카메라 RTSP 스트림에 직접 접속해 RTP 패킷으로 스트림 정보를 측정합니다.
+- 코덱: SDP rtpmap (H264 / H265 / JPEG)
+- 해상도: SDP sprop 파라미터 또는 스트림 내 SPS 파싱
+- IPS: 슬라이딩 윈도우 내 프레임 수 / RTP 타임스탬프 구간
+- Mbps: 슬라이딩 윈도우 내 RTP 페이로드 바이트
+- IpsSampler: 연결을 유지한 채 IPS 시계열 기록 (MAT 등 프레임레이트 변화 시점 측정)
+
+RTP는 RTSP 연결 위에 인터리브(TCP)로 받으므로 방화벽/UDP 포트 설정이 필요 없고,
+Windows 데스크톱/iRAS 없이 동작합니다. 반환값은 parse_stream_info()와 같은 형식입니다.
+    {"codec": "h264", "res_w": "1920", "res_h": "1080", "res_str": "1920x1080", "ips": 30.0, "mbps": 2.41}
+
+표준 라이브러리만 사용합니다.
+"""
+import base64
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+import config
+from config import STREAM_PROBE_SETTINGS
+from api_client import get_api_client
+import tracing
+
+
+class StreamProbeError(Exception):
+    """RTSP 접속/응답 오류"""
+
+
+def _md5(text: str) -> str:
+    return hashlib.md5(text.encode("utf-8")).hexdigest()
+
+
+# ===========================================================
+# 🧮 [SPS] H.264 / H.265 해상도 파싱
+# ===========================================================
+class _BitReader:
+    """MSB 우선 비트 읽기 (Exp-Golomb 포함)"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.pos = 0
+
+    def u(self, n: int) -> int:
+        value = 0
+        for _ in range(n):
+            byte = self.data[self.pos >> 3]
+            value = (value << 1) | ((byte >> (7 - (self.pos & 7))) & 1)
+            self.pos += 1
+        return value
+
+    def ue(self) -> int:
+        zeros = 0
+        while self.u(1) == 0:
+            zeros += 1
+            if zeros > 31:
+                raise ValueError("잘못된 Exp-Golomb 값")
+        return (1 << zeros) - 1 + self.u(zeros)
+
+    def se(self) -> int:
+        k = self.ue()
+        return (k + 1) // 2 if k & 1 else -(k // 2)
+
+
+def _unescape(nal: bytes) -> bytes:
+    """에뮬레이션 방지 바이트(00 00 03) 제거"""
+    out = bytearray()
+    zeros = 0
+    for byte in nal:
+        if zeros >= 2 and byte == 3:
+            zeros = 0
+            continue
+        out.append(byte)
+        zeros = zeros + 1 if byte == 0 else 0
+    return bytes(out)
+
+
+def parse_h264_sps(nal: bytes) -> Tuple[int, int]:
+    """H.264 SPS NAL → (가로, 세로)"""
+    r = _BitReader(_unescape(nal[1:]))
+    profile_idc = r.u(8)
+    r.u(16)  # constraint flags + level_idc
+    r.ue()   # seq_parameter_set_id
+    chroma_format_idc = 1
+    separate_colour_plane = 0
+    if profile_idc in (100, 110, 122, 244, 44, 83, 86, 118, 128, 138, 139, 134, 135):
+        chroma_format_idc = r.ue()
+        if chroma_format_idc == 3:
+            separate_colour_plane = r.u(1)
+        r.ue()  # bit_depth_luma_minus8
+        r.ue()  # bit_depth_chroma_minus8
+        r.u(1)  # qpprime_y_zero_transform_bypass_flag
+        if r.u(1):  # seq_scaling_matrix_present_flag
+            for i in range(8 if chroma_format_idc != 3 else 12):
+                if r.u(1):
+                    last = next_scale = 8
+                    for _ in range(16 if i < 6 else 64):
+                        if next_scale != 0:
+                            next_scale = (last + r.se() + 256) % 256
+                        last = next_scale or last
+    r.ue()  # log2_max_frame_num_minus4
+    poc_type = r.ue()
+    if poc_type == 0:
+        r.ue()
+    elif poc_type == 1:
+        r.u(1)
+        r.se()
+        r.se()
+        for _ in range(r.ue()):
+            r.se()
+    r.ue()  # max_num_ref_frames
+    r.u(1)  # gaps_in_frame_num_value_allowed_flag
+    width_mbs = r.ue() + 1
+    height_units = r.ue() + 1
+    frame_mbs_only = r.u(1)
+    if not frame_mbs_only:
+        r.u(1)  # mb_adaptive_frame_field_flag
+    r.u(1)  # direct_8x8_inference_flag
+    width = width_mbs * 16
+    height = (2 - frame_mbs_only) * height_units * 16
+    if r.u(1):  # frame_cropping_flag
+        left, right, top, bottom = r.ue(), r.ue(), r.ue(), r.ue()
+        if separate_colour_plane or chroma_format_idc == 0:
+            crop_x, crop_y = 1, 2 - frame_mbs_only
+        else:
+            crop_x = 1 if chroma_format_idc == 3 else 2
+            crop_y = (2 if chroma_format_idc == 1 else 1) * (2 - frame_mbs_only)
+        width -= crop_x * (left + right)
+        height -= crop_y * (top + bottom)
+    return width, height
+
+
+def parse_h265_sps(nal: bytes) -> Tuple[int, int]:
+    """H.265 SPS NAL → (가로, 세로)"""
+    r = _BitReader(_unescape(nal[2:]))
+    r.u(4)  # sps_video_parameter_set_id
+    max_sub_layers = r.u(3)
+    r.u(1)  # sps_temporal_id_nesting_flag
+    # profile_tier_level: general profile(88) + level(8)
+    r.u(88)
+    r.u(8)
+    profile_present, level_present = [], []
+    for _ in range(max_sub_layers):
+        profile_present.append(r.u(1))
+        level_present.append(r.u(1))
+    if max_sub_layers > 0:
+        for _ in range(max_sub_layers, 8):
+            r.u(2)
+    for i in range(max_sub_layers):
+        if profile_present[i]:
+            r.u(88)
+        if level_present[i]:
+            r.u(8)
+    r.ue()  # sps_seq_parameter_set_id
+    chroma_format_idc = r.ue()
+    if chroma_format_idc == 3:
+        r.u(1)  # separate_colour_plane_flag
+    width, height = r.ue(), r.ue()
+    if r.u(1):  # conformance_window_flag
+        left, right, top, bottom = r.ue(), r.ue(), r.ue(), r.ue()
+        sub_w = 2 if chroma_format_idc in (1, 2) else 1
+        sub_h = 2 if chroma_format_idc == 1 else 1
+        width -= sub_w * (left + right)
+        height -= sub_h * (top + bottom)
+    return width, height
+
+
+def _iter_nals(codec: str, payload: bytes):
+    """RTP 페이로드 안의 완전한 NAL 목록 (단일 NAL / STAP-A / AP, 조각 NAL은 제외)"""
+    if codec == "h264" and payload:
+        nal_type = payload[0] & 0x1F
+        if 1 <= nal_type <= 23:
+            yield nal_type, payload
+        elif nal_type == 24:  # STAP-A
+            pos = 1
+            while pos + 2 <= len(payload):
+                size = int.from_bytes(payload[pos:pos + 2], "big")
+                nal = payload[pos + 2:pos + 2 + size]
+                if nal:
+                    yield nal[0] & 0x1F, nal
+                pos += 2 + size
+    elif codec == "h265" and len(payload) >= 2:
+        nal_type = (payload[0] >> 1) & 0x3F
+        if nal_type < 48:
+            yield nal_type, payload
+        elif nal_type == 48:  # Aggregation Packet
+            pos = 2
+            while pos + 2 <= len(payload):
+                size = int.from_bytes(payload[pos:pos + 2], "big")
+                nal = payload[pos + 2:pos + 2 + size]
+                if len(nal) >= 2:
+                    yield (nal[0] >> 1) & 0x3F, nal
+                pos += 2 + size
+
+
+# 코덱별 SPS NAL 타입 / 파서
+_SPS = {"h264": (7, parse_h264_sps), "h265": (33, parse_h265_sps)}
+
+
+# ===========================================================
+# 📡 [RTSP] 세션 + RTP 통계
+# ===========================================================
+class StreamProbe:
+    """
+    RTSP 스트림 1개에 접속해 RTP 통계를 슬라이딩 윈도우로 유지
+
+    사용 예:
+        with StreamProbe("10.0.131.104", stream=2) as probe:
+            probe.read_for(3.0)
+            info = probe.info()
+    """
+
+    def __init__(self, camera_ip: str, stream: int = 1, port: int = None,
+                 username: str = None, password: str = None, window: float = None):
+        self.camera_ip = camera_ip
+        self.stream = int(stream)
+        self.port = int(port or get_rtsp_port(camera_ip))
+        self.username = username or config.USERNAME
+        self.password = password or config.PASSWORD
+        self.window = window or STREAM_PROBE_SETTINGS["window"]
+        self.url = STREAM_PROBE_SETTINGS["url_template"].format(ip=camera_ip, port=self.port, stream=self.stream)
+        self.codec = None
+        self.clock_rate = 90000
+        self.resolution = None
+        self._sock = None
+        self._buf = bytearray()
+        self._cseq = 0
+        self._session = None
+        self._auth = None
+        self._packets = deque()  # (도착 시각, 페이로드 바이트)
+        self._frames = deque()   # (도착 시각, RTP 타임스탬프)
+        self._last_ts = None
+        self._last_keepalive = 0.0
+
+    # --- 연결 ---
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def open(self):
+        """DESCRIBE → SETUP(TCP 인터리브) → PLAY"""
+        timeout = STREAM_PROBE_SETTINGS["connect_timeout"]
+        self._sock = socket.create_connection((self.camera_ip, self.port), timeout=timeout)
+        headers, body = self._request("DESCRIBE", self.url, {"Accept": "application/sdp"})
+        base = headers.get("content-base", self.url)
+        control = self._parse_sdp(body.decode("utf-8", "replace"), base)
+        headers, _ = self._request("SETUP", control, {"Transport": "RTP/AVP/TCP;unicast;interleaved=0-1"})
+        self._session = headers.get("session", "").split(";")[0].strip()
+        self._request("PLAY", base, {"Range": "npt=0.000-"})
+        self._last_keepalive = time.monotonic()
+
+    def close(self):
+        if self._sock is None:
+            return
+        try:
+            if self._session:
+                self._send("TEARDOWN", self.url, {})
+        except (OSError, StreamProbeError):
+            # 카메라가 이미 세션을 끊은 경우 (TEARDOWN 응답 없음)
+            pass
+        finally:
+            self._sock.close()
+            self._sock = None
+
+    # --- RTSP 요청/응답 ---
+    def _send(self, method: str, url: str, headers: dict):
+        self._cseq += 1
+        lines = [f"{method} {url} RTSP/1.0", f"CSeq: {self._cseq}", "User-Agent: camera-test-probe"]
+        if self._session:
+            lines.append(f"Session: {self._session}")
+        if self._auth:
+            lines.append(f"Authorization: {self._authorization(method, url)}")
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        self._sock.sendall(("\r\n".join(lines) + "\r\n\r\n").encode("utf-8"))
+
+    def _request(self, method: str, url: str, headers: dict) -> Tuple[dict, bytes]:
+        """요청 전송 후 응답 (401이면 인증 정보를 붙여 1회 재시도)"""
+        for _ in range(2):
+            self._send(method, url, headers)
+            status, resp_headers, body = self._read_response()
+            if status == 401 and self._auth is None:
+                self._auth = self._parse_challenge(resp_headers.get("www-authenticate", ""))
+                continue
+            if status != 200:
+                raise StreamProbeError(f"{method} {url} → RTSP {status}")
+            return resp_headers, body
+        raise StreamProbeError(f"{method} {url} → 인증 실패")
+
+    def _fill(self, size: int):
+        while len(self._buf) < size:
+            chunk = self._sock.recv(65536)
+            if not chunk:
+                raise StreamProbeError("RTSP 연결 종료")
+            self._buf += chunk
+
+    def _take(self, size: int) -> bytes:
+        self._fill(size)
+        data = bytes(self._buf[:size])
+        del self._buf[:size]
+        return data
+
+    def _read_response(self) -> Tuple[int, dict, bytes]:
+        """RTSP 응답 1개 읽기 (사이에 끼어 있는 인터리브 RTP는 통계에 반영)"""
+        while True:
+            self._fill(1)
+            if self._buf[0] == 0x24:  # '$'
+                self._read_interleaved()
+                continue
+            while b"\r\n\r\n" not in self._buf:
+                self._fill(len(self._buf) + 1)
+            head, _, _ = bytes(self._buf).partition(b"\r\n\r\n")
+            del self._buf[:len(head) + 4]
+            lines = head.decode("utf-8", "replace").split("\r\n")
+            parts = lines[0].split(" ", 2)
+            if len(parts) < 2 or not parts[0].startswith("RTSP/"):
+                raise StreamProbeError(f"잘못된 RTSP 응답: {lines[0]}")
+            headers = {}
+            for line in lines[1:]:
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+            body = self._take(int(headers.get("content-length", 0)))
+            return int(parts[1]), headers, body
+
+    # --- 인증 ---
+    def _parse_challenge(self, header: str) -> dict:
+        scheme, _, rest = header.partition(" ")
+        fields = dict(re.findall(r'(\w+)="?([^",]*)"?', rest))
+        fields["scheme"] = scheme.lower()
+        return fields
+
+    def _authorization(self, method: str, uri: str) -> str:
+        auth = self._auth
+        if auth["scheme"] == "basic":
+            token = base64.b64encode(f"{self.username}:{self.password}".encode("utf-8")).decode("ascii")
+            return f"Basic {token}"
+        ha1 = _md5(f"{self.username}:{auth.get('realm', '')}:{self.password}")
+        ha2 = _md5(f"{method}:{uri}")
+        value = f'Digest username="{self.username}", realm="{auth.get("realm", "")}", nonce="{auth.get("nonce", "")}", uri="{uri}"'
+        if "auth" in auth.get("qop", "").split(","):
+            cnonce = os.urandom(8).hex()
+            nc = f"{self._cseq:08x}"
+            response = _md5(f"{ha1}:{auth['nonce']}:{nc}:{cnonce}:auth:{ha2}")
+            value += f', qop=auth, nc={nc}, cnonce="{cnonce}"'
+        else:
+            response = _md5(f"{ha1}:{auth.get('nonce', '')}:{ha2}")
+        return value + f', response="{response}"'
+
+    # --- SDP ---
+    def _parse_sdp(self, sdp: str, base: str) -> str:
+        """비디오 미디어의 코덱/해상도 정보를 읽고 SETUP 대상 URL 반환"""
+        media = None
+        control = None
+        for line in sdp.splitlines():
+            line = line.strip()
+            if line.startswith("m="):
+                if media == "video":
+                    break
+                media = line[2:].split(" ", 1)[0]
+                continue
+            if media != "video":
+                continue
+            if line.startswith("a=rtpmap:"):
+                encoding = line.split(" ", 1)[1].split("/")
+                name = encoding[0].upper()
+                self.codec = {"H264": "h264", "H265": "h265", "HEVC": "h265", "JPEG": "mjpeg"}.get(name, name.lower())
+                if len(encoding) > 1 and encoding[1].isdigit():
+                    self.clock_rate = int(encoding[1])
+            elif line.startswith("a=fmtp:"):
+                params = dict(p.strip().split("=", 1) for p in line.split(" ", 1)[-1].split(";") if "=" in p)
+                sps = params.get("sprop-sps") or params.get("sprop-parameter-sets", "").split(",")[0]
+                if sps:
+                    self._read_sps(base64.b64decode(sps + "=" * (-len(sps) % 4)))
+            elif line.startswith("a=control:"):
+                control = line[len("a=control:"):]
+        if media != "video":
+            raise StreamProbeError("SDP에 비디오 트랙이 없습니다")
+        if not control or control == "*":
+            return base
+        if control.startswith("rtsp://"):
+            return control
+        return base.rstrip("/") + "/" + control
+
+    def _read_sps(self, nal: bytes):
+        if self.codec in _SPS and nal:
+            try:
+                self.resolution = _SPS[self.codec][1](nal)
+            except (IndexError, ValueError):
+                pass
+
+    # --- RTP ---
+    def _read_interleaved(self):
+        header = self._take(4)
+        channel, size = header[1], int.from_bytes(header[2:4], "big")
+        packet = self._take(size)
+        if channel == 0 and len(packet) >= 12:
+            self._on_rtp(packet)
+
+    def _on_rtp(self, packet: bytes):
+        b0 = packet[0]
+        offset = 12 + 4 * (b0 & 0x0F)
+        if b0 & 0x10 and len(packet) >= offset + 4:  # 확장 헤더
+            offset += 4 + 4 * int.from_bytes(packet[offset + 2:offset + 4], "big")
+        end = len(packet) - (packet[-1] if b0 & 0x20 else 0)
+        payload = packet[offset:end]
+        timestamp = int.from_bytes(packet[4:8], "big")
+        now = time.monotonic()
+
+        self._packets.append((now, len(payload)))
+        if timestamp != self._last_ts:
+            self._frames.append((now, timestamp))
+            self._last_ts = timestamp
+        if self.resolution is None and self.codec in _SPS:
+            sps_type = _SPS[self.codec][0]
+            for nal_type, nal in _iter_nals(self.codec, payload):
+                if nal_type == sps_type:
+                    self._read_sps(nal)
+                    break
+        self._trim(now)
+
+    def _trim(self, now: float):
+        since = now - self.window
+        while self._packets and self._packets[0][0] < since:
+            self._packets.popleft()
+        while self._frames and self._frames[0][0] < since:
+            self._frames.popleft()
+
+    def read_for(self, seconds: float):
+        """seconds초 동안 RTP 수신 (세션 유지용 keep-alive 포함)"""
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self._sock.settimeout(max(deadline - time.monotonic(), 0.05))
+            try:
+                self._fill(1)
+            except socket.timeout:
+                break
+            # 패킷 중간에서 끊기지 않도록 나머지는 일반 타임아웃으로 읽음
+            self._sock.settimeout(STREAM_PROBE_SETTINGS["connect_timeout"])
+            if self._buf[0] == 0x24:
+                self._read_interleaved()
+            else:
+                self._read_response()  # keep-alive 응답 등은 무시
+            if time.monotonic() - self._last_keepalive > STREAM_PROBE_SETTINGS["keepalive"]:
+                self._send("GET_PARAMETER", self.url, {})
+                self._last_keepalive = time.monotonic()
+        self._trim(time.monotonic())
+
+    # --- 통계 ---
+    def info(self) -> dict:
+        """현재 윈도우 기준 스트림 정보 (parse_stream_info와 같은 형식)"""
+        info = {}
+        if self.codec:
+            info["codec"] = self.codec
+        if self.resolution:
+            width, height = self.resolution
+            info["res_w"], info["res_h"] = str(width), str(height)
+            info["res_str"] = f"{width}x{height}"
+        frames = list(self._frames)
+        if len(frames) >= 2:
+            ticks = sum((b[1] - a[1]) & 0xFFFFFFFF for a, b in zip(frames, frames[1:]))
+            if ticks > 0:
+                info["ips"] = round((len(frames) - 1) * self.clock_rate / ticks, 1)
+        packets = list(self._packets)
+        if len(packets) >= 2 and packets[-1][0] > packets[0][0]:
+            total = sum(size for _, size in packets)
+            info["mbps"] = round(total * 8 / (packets[-1][0] - packets[0][0]) / 1e6, 2)
+        return info
+
+
+# ===========================================================
+# 📈 [Sampler] IPS 시계열
+# ===========================================================
+class IpsSampler:
+    """
+    RTSP 연결을 유지하며 sample_interval마다 IPS를 기록
+    mark() 시점(예: MAT 활성화)부터의 경과 시간으로 samples에 [(초, IPS), ...]를 쌓고,
+    조건 충족 시 프레임 간격으로 변화 시작 시점을 역추적합니다.
+
+    사용 예:
+        with IpsSampler(camera_ip) as sampler:
+            api_set_video_mat(...)
+            sampler.mark()
+            onset = sampler.wait_for(lambda ips: abs(ips - 5.0) <= 1.0, timeout=20)
+    """
+
+    def __init__(self, camera_ip: str, stream: int = 1, window: float = None, interval: float = None):
+        self.probe = StreamProbe(camera_ip, stream, window=window or STREAM_PROBE_SETTINGS["sample_window"])
+        self.interval = interval or STREAM_PROBE_SETTINGS["sample_interval"]
+        self.samples = []  # (mark 이후 경과 초, IPS)
+        self._log = []     # mark 이후 전체 프레임 (도착 시각, RTP 타임스탬프)
+        self._t0 = time.monotonic()
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def open(self):
+        self.probe.open()
+        self.mark()
+
+    def close(self):
+        self.probe.close()
+
+    def mark(self):
+        """기준 시점 지정 (이전 기록 초기화)"""
+        self._t0 = time.monotonic()
+        self.samples = []
+        self._log = []
+
+    def sample(self) -> Optional[float]:
+        """interval초 수신 후 현재 윈도우 IPS 기록 (프레임이 부족하면 None)"""
+        self.probe.read_for(self.interval)
+        last = self._log[-1][0] if self._log else self._t0
+        self._log.extend(f for f in self.probe._frames if f[0] > last)
+        ips = self.probe.info().get("ips")
+        if ips is not None:
+            self.samples.append((round(time.monotonic() - self._t0, 2), ips))
+            tracing.TRACER.counter(f"stream{self.probe.stream} ips", camera=ips)
+        return ips
+
+    def wait_for(self, predicate: Callable[[float], bool], timeout: float, hold: int = None) -> Optional[float]:
+        """
+        predicate(IPS)가 hold회 연속 참이 될 때까지 샘플링 (충족 즉시 종료)
+
+        Returns:
+            변화 시작 시점 (mark 이후 경과 초), 타임아웃 시 None
+        """
+        hold = hold or STREAM_PROBE_SETTINGS["sample_hold"]
+        deadline = self._t0 + timeout
+        run = 0
+        while time.monotonic() < deadline:
+            ips = self.sample()
+            run = run + 1 if ips is not None and predicate(ips) else 0
+            if run >= hold:
+                return self._onset(predicate)
+        return None
+
+    def _onset(self, predicate: Callable[[float], bool]) -> float:
+        """
+        끝에서부터 프레임 간격별 순간 IPS가 조건을 만족하는 구간을 거슬러 올라가
+        마지막으로 조건을 벗어난 프레임의 도착 시각을 변화 시작 시점으로 판단
+        """
+        frames = self._log
+        k = len(frames) - 1
+        while k > 0:
+            ticks = (frames[k][1] - frames[k - 1][1]) & 0xFFFFFFFF
+            if not ticks or not predicate(self.probe.clock_rate / ticks):
+                break
+            k -= 1
+        onset = frames[k][0] if frames else time.monotonic()
+        return round(max(onset - self._t0, 0.0), 2)
+
+
+# ===========================================================
+# 🔧 [API] 단축 함수
+# ===========================================================
+_RTSP_PORTS: Dict[str, int] = {}
+_RTSP_PORTS_LOCK = threading.Lock()
+
+
+def get_rtsp_port(camera_ip: str) -> int:
+    """networkPort.rtspPort 조회 (카메라별 캐시, 조회 실패 시 554)"""
+    with _RTSP_PORTS_LOCK:
+        if camera_ip in _RTSP_PORTS:
+            return _RTSP_PORTS[camera_ip]
+    data = get_api_client(camera_ip).get("networkPort")
+    port = int((data or {}).get("rtspPort") or 554)
+    with _RTSP_PORTS_LOCK:
+        _RTSP_PORTS[camera_ip] = port
+    return port
+
+
+def probe_stream(camera_ip: str, stream: int = 1, window: float = None) -> dict:
+    """스트림 1개를 window초 측정해 스트림 정보 반환 (실패 시 빈 dict)"""
+    window = window or STREAM_PROBE_SETTINGS["window"]
+    try:
+        with tracing.span(f"rtsp stream{stream}", "stream", camera=camera_ip):
+            with StreamProbe(camera_ip, stream, window=window) as probe:
+                probe.read_for(window)
+                return probe.info()
+    except (OSError, StreamProbeError) as e:
+        print(f"   ⚠️ RTSP 스트림 {stream} 측정 실패: {e}")
+        return {}
+
+
+def probe_streams(camera_ip: str, streams: Iterable[int], window: float = None) -> Dict[int, dict]:
+    """여러 스트림을 동시에 측정 ({스트림 번호: 스트림 정보})"""
+    streams = [int(s) for s in streams]
+    if not streams:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(streams), thread_name_prefix=f"rtsp-{camera_ip}") as pool:
+        futures = {s: pool.submit(probe_stream, camera_ip, s, window) for s in streams}
+        return {s: f.result() for s, f in futures.items()}
@@ -12,30 +12,8 @@ from playwright.sync_api import Page
 from common_actions import handle_popup, VISIBLE_DIALOG, DIALOG_BUTTONS
 from config import TIMEOUTS
 from api_client import CameraApiClient
-
-# ===========================================================
-# 🎨 출력 헬퍼 함수
-# ===========================================================
-
-def print_step(current: int, total: int, message: str):
-    """단계별 진행 상황 출력"""
-    print(f"\n[{current}/{total}] {message}")
-
-def print_action(message: str):
-    """액션 진행 중 메시지"""
-    print(f"   → {message}")
-
-def print_success(message: str):
-    """성공 메시지"""
-    print(f"   ✅ {message}")
-
-def print_warning(message: str):
-    """경고 메시지"""
-    print(f"   ⚠️  {message}")
-
-def print_error(message: str):
-    """에러 메시지"""
-    print(f"   ❌ {message}")
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
 
 # ===========================================================
 # ⚙️ [공통 헬퍼 함수] UI 네비게이션
@@ -73,7 +51,7 @@ def api_get_note(api_client: CameraApiClient, max_retries: int = None, silent: b
         if attempt < max_retries - 1:
             if not silent:
                 print_warning(f"조회 실패 ({attempt + 1}/{max_retries}), 재시도 중...")
-            time.sleep(TIMEOUTS.get("retry_delay", 2))
+            tracing.sleep(TIMEOUTS.get("retry_delay", 2))
     
     if not silent:
         print_error("Note 조회 최종 실패")
@@ -101,9 +79,11 @@ def verify_note_value(api_client: CameraApiClient, expected_value: str,
             print_success("검증 성공")
             return True
         
+        # 불일치 값은 캐시에 남기지 않음 (다음 시도는 카메라에서 다시 조회)
+        api_client.invalidate("systemInfo")
         if attempt < max_retries - 1:
             print_warning(f"불일치 (실제: '{val}'), 재시도 {attempt + 1}/{max_retries}")
-            time.sleep(TIMEOUTS.get("retry_delay", 2))
+            tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         else:
             print_error(f"검증 실패: 기대='{expected_value}', 실제='{val}'")
     
@@ -223,7 +203,7 @@ def import_settings(page: Page, file_path: str = "registry.dat",
         
         page.reload()
         page.wait_for_selector("#Page200_id", timeout=TIMEOUTS.get("page_load", 15000))
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         print_success("불러오기 완료")
         return True
@@ -281,7 +261,7 @@ def load_default_settings(page: Page, password: str = "qwerty0-",
         
         page.reload()
         page.wait_for_selector("#Page200_id", timeout=TIMEOUTS.get("page_load", 15000))
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         print_success("초기화 완료")
         return True
@@ -305,7 +285,7 @@ def run_default_setup_test(page: Page, api_client: CameraApiClient) -> Tuple[boo
         print_step(1, total_steps, f"설정 오염 (값='{test_value}')")
         if not ui_set_note(page, test_value):
             raise Exception("설정 변경 실패")
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         # Step 2: 백업
         print_step(2, total_steps, f"현재 상태 백업 ({backup_file})")
@@ -326,7 +306,7 @@ def run_default_setup_test(page: Page, api_client: CameraApiClient) -> Tuple[boo
         print_step(5, total_steps, f"백업 파일로 복구 ({backup_file})")
         if not import_settings(page, backup_file):
             raise Exception("복구 실패")
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         # Step 6: 복구 검증
         print_step(6, total_steps, f"복구 검증 (Note='{test_value}')")
@@ -350,7 +330,7 @@ def run_setup_roundtrip_test(page: Page, api_client: CameraApiClient) -> Tuple[b
         print_step(1, total_steps, f"테스트 값 설정 (값='{test_value}')")
         if not ui_set_note(page, test_value):
             raise Exception("설정 실패")
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         if not verify_note_value(api_client, test_value, max_retries=3):
             raise Exception("초기값 검증 실패")
@@ -364,7 +344,7 @@ def run_setup_roundtrip_test(page: Page, api_client: CameraApiClient) -> Tuple[b
         print_step(3, total_steps, f"설정 오염 (값='{trash_value}')")
         if not ui_set_note(page, trash_value):
             raise Exception("오염 실패")
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         if not verify_note_value(api_client, trash_value, max_retries=3):
             print_warning("오염 값 반영 안됨 (계속 진행)")
@@ -373,7 +353,7 @@ def run_setup_roundtrip_test(page: Page, api_client: CameraApiClient) -> Tuple[b
         print_step(4, total_steps, f"설정 불러오기 ({export_file})")
         if not import_settings(page, export_file):
             raise Exception("불러오기 실패")
-        time.sleep(TIMEOUTS.get("retry_delay", 2))
+        tracing.sleep(TIMEOUTS.get("retry_delay", 2))
         
         # Step 5: 최종 검증
         print_step(5, total_steps, f"복원 검증 (Note='{test_value}')")
@@ -0,0 +1,230 @@
+"""
+선언형 설정 매트릭스 (영상 파라미터 스윕)
+
+설정 액션(videoImage 등), config.py의 파라미터 축, 검증 함수만 선언하면
+케이스를 생성해 apply_and_verify로 적용/검증/복구합니다.
+
+    matrix = Matrix("videoImage", [Axis("mirroring", VIDEO_MIRRORING_OPTS, base="off", label="Mirroring"),
+                                   Axis("pivot", VIDEO_PIVOT_OPTS, base="off", label="Pivot")],
+                    verify=_verify)
+    failed = run_matrix(page, camera_ip, matrix)
+
+- sweep: 한 번에 한 축만 기준값에서 바꾼 케이스 (기존 항목별 루프와 같은 케이스)
+- product: 모든 축의 조합
+- 순서: 첫 케이스는 모든 축이 기준값인 상태(검증 기준 프레임용),
+  product는 혼합 진법 반사 Gray 코드로 정렬해 이웃 케이스 간 파라미터 변경이 항상 1개
+  (apply_and_verify가 바뀐 키만 전송하므로 카메라 재설정 횟수가 최소화됨)
+- 분산: MATRIX_SETTINGS["cameras"]에 같은 모델 카메라를 지정하면 축(또는 Gray 순서 구간)을
+  카메라별로 나눠 동시에 실행 (추가 카메라는 HTTP 전송으로 별도 스레드에서 실행)
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from config import MATRIX_SETTINGS
+from api_client import get_api_client
+from image_verify import wait_for_stable_image
+from snapshot_service import get_snapshot_service
+import tracing
+
+Case = Tuple[str, Dict[str, str]]
+
+
+class Axis:
+    """파라미터 축: 설정 키 1개와 시험할 값 목록 (base는 다른 축을 시험할 때 유지하는 값)"""
+
+    def __init__(self, key: str, values: Sequence, base=None, label: str = None):
+        self.key = key
+        self.values = list(values)
+        self.base = self.values[0] if base is None else base
+        self.label = label or key
+        # 기준값을 맨 앞으로 (케이스 생성 시 0번 = 기준값)
+        self.ordered = [self.base] + [v for v in self.values if v != self.base]
+
+
+class Matrix:
+    """
+    설정 액션 1개에 대한 케이스 매트릭스
+
+    Args:
+        fixed: 모든 케이스에 공통으로 적용할 값 (예: {"useOsd": "on"})
+        mode: "sweep" | "product"
+        verify: 설정 반영 후 영상 검증 verify(camera_ip, page, name, values) -> bool
+        settle: 케이스마다 영상 안정화 대기 여부 (API 값만 확인하는 속성은 False)
+        snapshot_prefix: 케이스별 스냅샷 파일 접두어 (None이면 스냅샷 없음, ""이면 케이스 이름만)
+    """
+
+    def __init__(self, action: str, axes: List[Axis], mode: str = "sweep", fixed: Dict[str, str] = None,
+                 verify: Callable = None, settle: bool = True, snapshot_prefix: Optional[str] = None,
+                 channel: Optional[int] = None):
+        if mode not in ("sweep", "product"):
+            raise ValueError(f"알 수 없는 매트릭스 모드: {mode}")
+        self.action = action
+        self.axes = axes
+        self.mode = mode
+        self.fixed = dict(fixed or {})
+        self.verify = verify
+        self.settle = settle
+        self.snapshot_prefix = snapshot_prefix
+        self.channel = channel
+
+    def base_values(self) -> Dict[str, str]:
+        return {**self.fixed, **{axis.key: axis.base for axis in self.axes}}
+
+    def case_name(self, values: Dict[str, str]) -> str:
+        """기준값이 아닌 축만 '라벨_값'으로 연결 (모두 기준값이면 'Base')"""
+        parts = [f"{axis.label}_{values[axis.key]}" for axis in self.axes if values[axis.key] != axis.base]
+        return "_".join(parts) or "Base"
+
+    def _case(self, values: Dict[str, str]) -> Case:
+        return self.case_name(values), values
+
+    def cases(self, axes: List[Axis] = None) -> List[Case]:
+        """케이스 목록 (첫 케이스는 항상 기준값 조합)"""
+        axes = self.axes if axes is None else axes
+        base = self.base_values()
+        cases = [self._case(base)]
+        if self.mode == "sweep":
+            for axis in axes:
+                cases.extend(self._case({**base, axis.key: value}) for value in axis.ordered[1:])
+            return cases
+        for digits in gray_sequence([len(axis.ordered) for axis in axes])[1:]:
+            values = dict(base)
+            values.update({axis.key: axis.ordered[d] for axis, d in zip(axes, digits)})
+            cases.append(self._case(values))
+        return cases
+
+    def shards(self, count: int) -> List[List[Case]]:
+        """
+        케이스를 count개 카메라로 분할 (각 구간은 기준값 조합부터 시작)
+        - sweep: 축 단위로 케이스 수가 비슷하도록 배분 (축끼리 독립)
+        - product: Gray 순서를 연속 구간으로 분할 (구간 내 변경 1개 유지)
+        """
+        count = max(1, count)
+        if self.mode == "sweep":
+            groups = [[] for _ in range(count)]
+            loads = [0] * count
+            for axis in sorted(self.axes, key=lambda a: -len(a.ordered)):
+                i = loads.index(min(loads))
+                groups[i].append(axis)
+                loads[i] += len(axis.ordered) - 1
+            return [self.cases(sorted(g, key=self.axes.index)) for g in groups if g]
+
+        cases = self.cases()
+        base, rest = cases[0], cases[1:]
+        size = -(-len(rest) // count)
+        chunks = [rest[i:i + size] for i in range(0, len(rest), size)] or [[]]
+        return [[base] + chunk for chunk in chunks]
+
+
+def gray_sequence(radices: List[int]) -> List[Tuple[int, ...]]:
+    """혼합 진법 반사 Gray 코드 (이웃한 두 항목은 자릿수 1개만 ±1 차이)"""
+    if not radices:
+        return [()]
+    tail = gray_sequence(radices[1:])
+    sequence = []
+    for digit in range(radices[0]):
+        sequence.extend((digit,) + t for t in (tail if digit % 2 == 0 else reversed(tail)))
+    return sequence
+
+
+def count_changes(cases: List[Case]) -> int:
+    """이웃 케이스 사이에 바뀌는 파라미터 수 합계 (첫 케이스 제외)"""
+    return sum(sum(1 for k, v in b.items() if a.get(k) != v) for (_, a), (_, b) in zip(cases, cases[1:]))
+
+
+# ===========================================================
+# ▶️ [Run] 케이스 실행
+# ===========================================================
+def run_cases(page, camera_ip: str, action: str, cases: List[Case], snapshot_prefix: Optional[str] = None,
+              verify: Callable = None, settle: bool = True, channel: Optional[int] = None,
+              emit: Callable = print) -> Optional[int]:
+    """
+    [(이름, delta), ...] 케이스를 apply_and_verify로 일괄 적용/검증
+    (변경된 키만 전송/검증, 케이스마다 스냅샷, 기준값 복구는 마지막에 1회)
+
+    Args:
+        verify: 설정 반영 후 호출되는 영상 검증 함수 verify(name, delta) -> bool (실패 시 실패 건수에 포함)
+        emit: 결과 출력 함수 (분산 실행 시 카메라별 버퍼)
+
+    Returns:
+        실패 건수 (기준 설정 조회 실패 시 None)
+    """
+    names = iter([name for name, _ in cases])
+    image_failed = []
+
+    def _on_applied(delta, ok, data):
+        name = next(names)
+        if ok and settle:
+            wait_for_stable_image(camera_ip, page, label=action)
+        if snapshot_prefix is not None:
+            file_name = f"{snapshot_prefix}_{name}.png" if snapshot_prefix else f"{name}.png"
+            try:
+                get_snapshot_service(camera_ip, page=page).capture(file_name)
+            except Exception as e:
+                emit(f"   ⚠️ 스냅샷 요청 실패: {e}")
+        if ok and verify is not None and not verify(name, delta):
+            emit(f"   ❌ {name}: Fail (영상 검증)")
+            image_failed.append(name)
+        elif ok:
+            emit(f"   ✅ {name}: Pass")
+        else:
+            actual = {k: data.get(k) for k in delta} if data else None
+            emit(f"   ❌ {name}: Fail (기대: {delta}, 실제: {actual})")
+
+    results = get_api_client(camera_ip, page=page).apply_and_verify(
+        action, [delta for _, delta in cases], on_applied=_on_applied, channel=channel)
+    if results is None:
+        emit(f"   ❌ 설정 조회 실패: {action}")
+        return None
+    emit(f"   🔄 {action} 기준값 복구 완료")
+    return sum(1 for _, ok, _ in results if not ok) + len(image_failed)
+
+
+def _run_shard(page, camera_ip: str, matrix: Matrix, cases: List[Case], emit: Callable = print) -> Optional[int]:
+    verify = (lambda name, values: matrix.verify(camera_ip, page, name, values)) if matrix.verify is not None else None
+    with tracing.span(f"{matrix.action} x{len(cases)}", "matrix", camera=camera_ip):
+        return run_cases(page, camera_ip, matrix.action, cases, matrix.snapshot_prefix, verify,
+                         matrix.settle, matrix.channel, emit)
+
+
+def run_matrix(page, camera_ip: str, matrix: Matrix, cameras: List[str] = None) -> Optional[int]:
+    """
+    매트릭스 실행 (추가 카메라가 있으면 분할해 동시 실행)
+
+    기준 카메라(camera_ip)는 호출 스레드에서 page로 실행하고 (Playwright page는 스레드 간 공유 불가),
+    추가 카메라는 page 없이(HTTP) 작업 스레드에서 실행한 뒤 결과를 카메라별로 모아 출력합니다.
+
+    Returns:
+        실패 건수 (기준 카메라 설정 조회 실패 시 None)
+    """
+    cameras = MATRIX_SETTINGS["cameras"] if cameras is None else cameras
+    lanes = [camera_ip] + [ip for ip in cameras if ip != camera_ip]
+    shards = list(zip(lanes, matrix.shards(len(lanes))))
+
+    total = sum(len(cases) for _, cases in shards)
+    changes = sum(count_changes(cases) for _, cases in shards)
+    print(f"   🧮 {matrix.action}: {total}개 케이스 ({matrix.mode}), 파라미터 변경 {changes}회"
+          + (f", 카메라 {len(shards)}대 분산" if len(shards) > 1 else ""))
+
+    if len(shards) == 1:
+        return _run_shard(page, camera_ip, matrix, shards[0][1])
+
+    outputs = {ip: [] for ip, _ in shards[1:]}
+    with ThreadPoolExecutor(max_workers=len(shards) - 1, thread_name_prefix="matrix") as pool:
+        futures = {ip: pool.submit(_run_shard, None, ip, matrix, cases, outputs[ip].append)
+                   for ip, cases in shards[1:]}
+        print(f"\n   📷 {camera_ip} ({len(shards[0][1])}개 케이스)")
+        failed = _run_shard(page, camera_ip, matrix, shards[0][1])
+
+    for ip, cases in shards[1:]:
+        print(f"\n   📷 {ip} ({len(cases)}개 케이스)")
+        for line in outputs[ip]:
+            print(line)
+        try:
+            shard_failed = futures[ip].result()
+        except Exception as e:
+            print(f"   ❌ {ip} 실행 오류: {e}")
+            shard_failed = None
+        if failed is not None:
+            failed += len(cases) if shard_failed is None else shard_failed
+    return failed
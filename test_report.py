@@ -0,0 +1,88 @@
+"""
+테스트 결과 리포트 (JSON / JUnit XML)
+
+scheduler.run_lane 실행 기록을 CI에서 읽을 수 있는 형식으로 저장합니다.
+- JSON: 테스트별 결과/소요 시간/단계별 소요 시간 (실행 시간 추이 분석용)
+- JUnit XML: 카메라별 testsuite, 테스트별 testcase (단계 시간은 properties로 기록)
+"""
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from typing import List
+
+
+def _ensure_dir(path: str):
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+
+
+def write_json_report(records: List[dict], path: str, meta: dict = None):
+    """실행 기록을 JSON으로 저장"""
+    _ensure_dir(path)
+    report = {
+        "meta": dict(meta or {}, generated=time.strftime("%Y-%m-%dT%H:%M:%S")),
+        "summary": {
+            "total": len(records),
+            "passed": sum(1 for r in records if r["success"]),
+            "failed": sum(1 for r in records if not r["success"]),
+            "duration": round(max((r["end"] for r in records), default=0)
+                              - min((r["ready"] for r in records), default=0), 2),
+        },
+        "tests": [{
+            "camera": r["lane"],
+            "test_id": r["test_id"],
+            "name": r["name"],
+            "success": r["success"],
+            "message": r["message"],
+            "resources": r["resources"],
+            "start": round(r["start"], 3),
+            "elapsed": round(r["end"] - r["start"], 3),
+            "wait": round(r["start"] - r["ready"], 3),
+            "steps": [{"name": s["name"], "elapsed": round(s["elapsed"], 3)} for s in r.get("steps", [])],
+        } for r in records],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"💾 JSON 결과 저장: {path}")
+
+
+def write_junit_report(records: List[dict], path: str, suite_name: str = "camera_test"):
+    """실행 기록을 JUnit XML로 저장 (카메라별 testsuite)"""
+    _ensure_dir(path)
+    root = ET.Element("testsuites", name=suite_name)
+    lanes = {}
+    for r in records:
+        lanes.setdefault(r["lane"], []).append(r)
+
+    for lane, items in lanes.items():
+        suite = ET.SubElement(root, "testsuite", {
+            "name": f"{suite_name}.{lane}",
+            "tests": str(len(items)),
+            "failures": str(sum(1 for r in items if not r["success"])),
+            "errors": "0",
+            "time": f"{sum(r['end'] - r['start'] for r in items):.3f}",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(min(r["start"] for r in items))),
+        })
+        for r in items:
+            case = ET.SubElement(suite, "testcase", {
+                "classname": f"{suite_name}.{lane}",
+                "name": r["test_id"],
+                "time": f"{r['end'] - r['start']:.3f}",
+            })
+            steps = r.get("steps", [])
+            if steps:
+                props = ET.SubElement(case, "properties")
+                for i, s in enumerate(steps, 1):
+                    ET.SubElement(props, "property", name=f"step.{i:02d} {s['name']}", value=f"{s['elapsed']:.3f}")
+            if not r["success"]:
+                ET.SubElement(case, "failure", message=str(r["message"])).text = str(r["message"])
+
+    root.set("tests", str(len(records)))
+    root.set("failures", str(sum(1 for r in records if not r["success"])))
+    tree = ET.ElementTree(root)
+    if hasattr(ET, "indent"):
+        ET.indent(tree)
+    tree.write(path, encoding="utf-8", xml_declaration=True)
+    print(f"💾 JUnit 결과 저장: {path}")
@@ -0,0 +1,256 @@
+"""
+테스트 실행 추적 (단계/API/sleep/UI/iRAS 구간 기록)
+
+- 각 모듈에 중복되어 있던 print_step/print_action/print_success/... 출력 함수를 통합
+- 단계, API 호출, sleep, iRAS 조작, 조건 대기 구간을 span으로 기록
+- Chrome Trace / Perfetto(ui.perfetto.dev)에서 열 수 있는 JSON으로 내보내기
+- 카테고리별 순수 소요 시간(하위 구간 제외) 요약 출력
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# perf_counter 기준 시각을 epoch(µs)로 환산 (프로세스 간 trace 병합 가능)
+_EPOCH_OFFSET = time.time() - time.perf_counter()
+
+
+def _now_us() -> float:
+    return (_EPOCH_OFFSET + time.perf_counter()) * 1e6
+
+
+# ===========================================================
+# 🧵 [Tracer] 구간 기록기
+# ===========================================================
+class Tracer:
+    """span 기록 및 Chrome Trace 내보내기 (프로세스 전역 1개)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events = []
+        self._threads = {}
+
+    def add_complete(self, name: str, cat: str, start_us: float, dur_us: float, args: dict = None):
+        """완료된 구간 1개 추가 (Chrome Trace 'X' 이벤트)"""
+        tid = threading.get_native_id()
+        event = {"name": name, "cat": cat, "ph": "X", "ts": round(start_us, 1),
+                 "dur": round(max(dur_us, 0.0), 1), "pid": os.getpid(), "tid": tid}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+            self._threads.setdefault(tid, threading.current_thread().name)
+
+    def instant(self, name: str, cat: str = "mark", **args):
+        """시점 이벤트 (Chrome Trace 'i' 이벤트)"""
+        event = {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": round(_now_us(), 1),
+                 "pid": os.getpid(), "tid": threading.get_native_id()}
+        if args:
+            event["args"] = args
+        with self._lock:
+            self._events.append(event)
+
+    def counter(self, name: str, cat: str = "metric", **values):
+        """시계열 값 (Chrome Trace 'C' 이벤트, 예: IPS 변화)"""
+        event = {"name": name, "cat": cat, "ph": "C", "ts": round(_now_us(), 1),
+                 "pid": os.getpid(), "tid": threading.get_native_id(), "args": values}
+        with self._lock:
+            self._events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str = "ui", **args):
+        """with 블록 구간 기록"""
+        start = _now_us()
+        try:
+            yield
+        finally:
+            self.add_complete(name, cat, start, _now_us() - start, args)
+
+    def events(self) -> list:
+        """기록된 이벤트 (스레드 이름 메타데이터 포함)"""
+        with self._lock:
+            meta = [{"name": "thread_name", "ph": "M", "pid": os.getpid(), "tid": tid,
+                     "args": {"name": name}} for tid, name in self._threads.items()]
+            return meta + [dict(e) for e in self._events]
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+
+    def export(self, path: str, events: list = None, process_name: str = None):
+        """
+        Chrome Trace JSON 저장 (chrome://tracing 또는 ui.perfetto.dev 에서 열기)
+
+        Args:
+            events: 저장할 이벤트 (None이면 현재 프로세스 기록, 다중 카메라 병합 시 전달)
+            process_name: 프로세스 이름 메타데이터 (예: 카메라 IP)
+        """
+        events = self.events() if events is None else list(events)
+        if process_name:
+            events.insert(0, {"name": "process_name", "ph": "M", "pid": os.getpid(),
+                              "args": {"name": process_name}})
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        print(f"💾 Trace 저장: {path} (ui.perfetto.dev 에서 열기)")
+
+    def print_summary(self, events: list = None, top: int = 8):
+        """카테고리별 순수 소요 시간 (하위 구간 시간 제외) 및 가장 오래 걸린 sleep 위치"""
+        events = [e for e in (self.events() if events is None else events) if e.get("ph") == "X"]
+        if not events:
+            return
+
+        # 스레드별로 시작 순 정렬 후 스택으로 부모-자식 관계를 구해 순수 시간 계산
+        self_time = {}
+        by_thread = {}
+        for e in events:
+            by_thread.setdefault((e["pid"], e["tid"]), []).append(e)
+        for items in by_thread.values():
+            items.sort(key=lambda e: (e["ts"], -e["dur"]))
+            stack = []
+            for e in items:
+                while stack and stack[-1]["ts"] + stack[-1]["dur"] <= e["ts"]:
+                    stack.pop()
+                self_time[id(e)] = e["dur"]
+                if stack:
+                    parent = stack[-1]
+                    self_time[id(parent)] -= min(e["dur"], parent["ts"] + parent["dur"] - e["ts"])
+                stack.append(e)
+
+        cats = {}
+        for e in events:
+            c = cats.setdefault(e["cat"], {"count": 0, "self": 0.0})
+            c["count"] += 1
+            c["self"] += max(self_time[id(e)], 0.0)
+        total = sum(c["self"] for c in cats.values()) or 1.0
+
+        print(f"\n{'='*60}")
+        print("🧭 실행 시간 분석 (카테고리별 순수 시간)")
+        print(f"{'='*60}")
+        print(f"{'Category':<14}{'Count':>8}{'Time(s)':>11}{'Share':>8}")
+        for cat, c in sorted(cats.items(), key=lambda kv: -kv[1]["self"]):
+            print(f"{cat:<14}{c['count']:>8}{c['self'] / 1e6:>11.1f}{c['self'] / total * 100:>7.0f}%")
+
+        sleeps = {}
+        for e in events:
+            if e["cat"] == "sleep":
+                sleeps[e["name"]] = sleeps.get(e["name"], 0.0) + e["dur"]
+        if sleeps:
+            print(f"\n💤 sleep 상위 {top}개 위치")
+            for name, dur in sorted(sleeps.items(), key=lambda kv: -kv[1])[:top]:
+                print(f"   {dur / 1e6:8.1f}s  {name}")
+
+
+# 전역 추적기
+TRACER = Tracer()
+
+
+def span(name: str, cat: str = "ui", **args):
+    """TRACER.span 단축 함수"""
+    return TRACER.span(name, cat, **args)
+
+
+def traced(cat: str, name: str = None):
+    """함수 전체를 span으로 기록하는 데코레이터"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with TRACER.span(label, cat):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def sleep(seconds: float, reason: str = None):
+    """time.sleep 대체 (호출 위치를 이름으로 sleep 구간 기록)"""
+    if reason is None:
+        frame = sys._getframe(1)
+        reason = f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {frame.f_code.co_name}"
+    with TRACER.span(reason, "sleep", seconds=seconds):
+        time.sleep(seconds)
+
+
+# ===========================================================
+# ⏱️ [Step] 테스트 단계 기록 (JSON/JUnit 리포트 + trace)
+# ===========================================================
+class StepTimer:
+    """print_step 호출 사이 구간을 단계 소요 시간으로 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._steps = []
+        self._current = None
+
+    def begin(self):
+        """테스트 시작 (이전 기록 초기화)"""
+        with self._lock:
+            self._steps = []
+            self._current = None
+
+    def mark(self, name: str):
+        """이전 단계를 닫고 새 단계 시작"""
+        now = time.time()
+        with self._lock:
+            self._close(now)
+            self._current = (name, now, _now_us())
+
+    def finish(self) -> list:
+        """마지막 단계를 닫고 [{"name", "start", "elapsed"}, ...] 반환"""
+        with self._lock:
+            self._close(time.time())
+            steps, self._steps = self._steps, []
+            return steps
+
+    def _close(self, now):
+        if self._current:
+            name, start, start_us = self._current
+            self._steps.append({"name": name, "start": start, "elapsed": now - start})
+            TRACER.add_complete(name, "step", start_us, _now_us() - start_us)
+            self._current = None
+
+
+# 전역 단계 기록기
+STEP_TIMER = StepTimer()
+
+
+def mark_step(name: str):
+    """테스트 단계 시작 표시"""
+    STEP_TIMER.mark(name)
+
+
+# ===========================================================
+# 🖨️ [출력] 표준 출력 함수 (모든 테스트 모듈 공용)
+# ===========================================================
+def print_step(step_num: int, total_steps: int, msg: str):
+    """단계 표시 (단계 구간 시작)"""
+    print(f"\n[{step_num}/{total_steps}] {msg}")
+    mark_step(msg)
+
+def print_action(msg: str):
+    """작업 진행 표시"""
+    print(f"   → {msg}")
+    TRACER.instant(msg, "action")
+
+def print_success(msg: str = None):
+    """성공 표시"""
+    if msg:
+        print(f"   ✅ {msg}")
+    else:
+        print(f"   ✅ 완료")
+
+def print_warning(msg: str):
+    """경고 표시"""
+    print(f"   ⚠️ {msg}")
+    TRACER.instant(msg, "warning")
+
+def print_error(msg: str):
+    """에러 표시"""
+    print(f"   ❌ {msg}")
+    TRACER.instant(msg, "error")
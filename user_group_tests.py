@@ -1,7 +1,8 @@
-import time
 from playwright.sync_api import Page
-from api_client import CameraApiClient
+from api_client import get_api_client
 from common_actions import handle_popup
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
 from config import (
     TIMEOUTS,
     TEST_GROUP_A,
@@ -12,32 +13,6 @@ from config import (
 import config  # IRAS_DEVICE_NAME을 동적으로 참조하기 위해
 import iRAS_test
 
-# ===========================================================
-# 🖨️ [출력] 표준 출력 함수
-# ===========================================================
-def print_step(step_num: int, total_steps: int, msg: str):
-    """단계 표시"""
-    print(f"\n[{step_num}/{total_steps}] {msg}")
-
-def print_action(msg: str):
-    """작업 진행 표시"""
-    print(f"   → {msg}")
-
-def print_success(msg: str = None):
-    """성공 표시"""
-    if msg:
-        print(f"   ✅ {msg}")
-    else:
-        print(f"   ✅ 완료")
-
-def print_warning(msg: str):
-    """경고 표시"""
-    print(f"   ⚠️ {msg}")
-
-def print_error(msg: str):
-    """에러 표시"""
-    print(f"   ❌ {msg}")
-
 # ===========================================================
 # 📋 [설정] 상수 및 매핑
 # ===========================================================
@@ -98,12 +73,9 @@ INITIAL_PERMS = {
 
 def verify_permissions_via_api(page: Page, camera_ip: str, group_name: str, expected_perms: dict):
     """API를 통해 그룹 권한이 올바르게 설정되었는지 검증"""
-    api_url = f"http://{camera_ip}/cgi-bin/webSetup.cgi?action=groupSetup&mode=1"
-    try:
-        resp_text = page.evaluate(f"fetch('{api_url}').then(r => r.text())")
-        data = dict(item.split("=", 1) for item in resp_text.strip().split("&") if "=" in item)
-    except Exception as e:
-        print_error(f"API 조회 실패: {e}")
+    data = get_api_client(camera_ip, page=page).get_group_setup()
+    if not data:
+        print_error("API 조회 실패: groupSetup")
         return False
     
     count = int(data.get("groupCount", 0))
@@ -137,11 +109,8 @@ def verify_permissions_via_api(page: Page, camera_ip: str, group_name: str, expe
 
 def verify_group_absence_via_api(page: Page, camera_ip: str, group_name: str):
     """API를 통해 그룹이 삭제되었는지 확인"""
-    api_url = f"http://{camera_ip}/cgi-bin/webSetup.cgi?action=groupSetup&mode=1"
-    try:
-        resp_text = page.evaluate(f"fetch('{api_url}').then(r => r.text())")
-        data = dict(item.split("=", 1) for item in resp_text.strip().split("&") if "=" in item)
-    except Exception as e:
+    data = get_api_client(camera_ip, page=page).get_group_setup()
+    if not data:
         print_warning(f"API 조회 실패 (삭제된 것으로 간주)")
         return True
     
@@ -233,7 +202,7 @@ def create_group_only(page: Page, group_name: str) -> bool:
     page.wait_for_timeout(1000)
     page.locator("#setup-apply").click()
     handle_popup(page)
-    time.sleep(1)
+    tracing.sleep(1)
     return True
 
 def create_group_and_user(page: Page, group_name: str, uid: str, upw: str) -> bool:
@@ -274,7 +243,7 @@ def create_group_and_user(page: Page, group_name: str, uid: str, upw: str) -> bo
 
         page.locator("#setup-apply").click()
         handle_popup(page)
-        time.sleep(2)
+        tracing.sleep(2)
         return True
     except Exception as e:
         print_error(f"생성 오류: {e}")
@@ -300,7 +269,7 @@ def move_user_to_group(page: Page, uid: str, current_group: str, target_group: s
         page.locator(target_selector).first.wait_for(state="hidden")
         page.locator("#setup-apply").click()
         handle_popup(page)
-        time.sleep(2)
+        tracing.sleep(2)
         return True
     except Exception as e:
         print_error(f"이동 오류: {e}")
@@ -330,7 +299,7 @@ def modify_group_permissions(page: Page, group_name: str, target_perms: dict) ->
         
         page.locator("#setup-apply").click()
         handle_popup(page)
-        time.sleep(2)
+        tracing.sleep(2)
         return True
     except Exception as e:
         print_error(f"권한 변경 오류: {e}")
@@ -353,7 +322,7 @@ def delete_group_and_user(page: Page, group_name: str, uid: str = None) -> bool:
         handle_popup(page)
         page.locator("#setup-apply").click()
         handle_popup(page)
-        time.sleep(2)
+        tracing.sleep(2)
         return True
     except Exception as e:
         print_error(f"삭제 실패: {e}")
@@ -375,8 +344,8 @@ def run_user_group_test(page: Page, camera_ip: str, admin_id: str, admin_pw: str
     DEVICE = config.IRAS_DEVICE_NAME  # 실행 시점에 config에서 동적으로 가져옴
     TOTAL_STEPS = 6
 
-    # API 클라이언트 생성
-    api_client = CameraApiClient(page, camera_ip)
+    # 공유 API 클라이언트
+    api_client = get_api_client(camera_ip, page=page)
 
     # 사전 조건: iRAS 테스트를 위해 알람 출력 활성화
     print("\n[사전 조건] Alarm Out 활성화")
@@ -460,7 +429,7 @@ def run_user_group_test(page: Page, camera_ip: str, admin_id: str, admin_pw: str
         print_error("Phase 1 권한 설정 실패")
         return False, "Phase 1 권한 설정 실패"
     
-    time.sleep(TIMEOUTS.get("retry_delay", 2))
+    tracing.sleep(TIMEOUTS.get("retry_delay", 2))
     print_action("API로 권한 검증 중...")
     if not verify_permissions_via_api(page, camera_ip, GROUP_B, phase1_perms):
         delete_group_and_user(page, GROUP_B, UID)
@@ -493,7 +462,7 @@ def run_user_group_test(page: Page, camera_ip: str, admin_id: str, admin_pw: str
         print_error("Phase 2 권한 설정 실패")
         return False, "Phase 2 권한 설정 실패"
     
-    time.sleep(TIMEOUTS.get("retry_delay", 2))
+    tracing.sleep(TIMEOUTS.get("retry_delay", 2))
     print_action("API로 권한 검증 중...")
     if not verify_permissions_via_api(page, camera_ip, GROUP_B, phase2_perms):
         delete_group_and_user(page, GROUP_B, UID)
@@ -1,16 +1,31 @@
 import time
-import os
 import re
 from playwright.sync_api import Page
-from common_actions import parse_api_response
+from api_client import get_api_client
+from snapshot_service import get_snapshot_service
+from test_matrix import Axis, Matrix, run_cases, run_matrix
+from stream_probe import IpsSampler, StreamProbeError, probe_stream, probe_streams
+from image_verify import (
+    grab_frame, check_orientation, check_privacy_zones, luma_shift, chroma_shift, judge_shift,
+    wait_for_stable_image
+)
+from common_actions import wait_until, wait_for_operator
+import tracing
+from tracing import print_step, print_action, print_success, print_warning, print_error
 
 # iRAS 컨트롤러 가져오기 (OSD 텍스트 읽기용)
-from iRAS_test import IRASController
+try:
+    from iRAS_test import IRASController
+except ImportError:
+    # iRAS 제어(pywin32/uiautomation)가 없는 환경 (Linux 시뮬레이터/벤치마크 실행)
+    IRASController = None
 
 # 비디오 테스트 설정값 가져오기
 from config import (
     IRAS_TITLES,
     VIDEO_WAIT_TIME,
+    IMAGE_VERIFY_SETTINGS,
+    STREAM_PROBE_SETTINGS,
     VIDEO_PRESET_MODES,
     VIDEO_PARAM_RANGES,
     VIDEO_DEFAULT_CUSTOM_PARAMS,
@@ -52,132 +67,31 @@ from config import (
     VIDEO_OSD_DATETIME_POSITION,
 )
 
-# ===========================================================
-# 🖨️ [출력] 표준 출력 함수
-# ===========================================================
-def print_step(step_num: int, total_steps: int, msg: str):
-    """단계 표시"""
-    print(f"\n[{step_num}/{total_steps}] {msg}")
-
-def print_action(msg: str):
-    """작업 진행 표시"""
-    print(f"   → {msg}")
-
-def print_success(msg: str = None):
-    """성공 표시"""
-    if msg:
-        print(f"   ✅ {msg}")
-    else:
-        print(f"   ✅ 완료")
-
-def print_warning(msg: str):
-    """경고 표시"""
-    print(f"   ⚠️ {msg}")
-
-def print_error(msg: str):
-    """에러 표시"""
-    print(f"   ❌ {msg}")
-
 # ===========================================================
 # 📸 [Snapshot] API를 통한 스냅샷 캡처 함수
 # ===========================================================
 def trigger_iras_snapshot(page: Page, camera_ip: str, file_name=None):
-    """videoSnapshot API를 사용하여 카메라에서 직접 JPEG 이미지를 받아서 저장"""
+    """
+    videoSnapshot API로 카메라에서 직접 JPEG 이미지를 받아서 저장
+    다운로드는 백그라운드에서 진행되므로 바로 다음 단계로 넘어갑니다. (Future 반환)
+    """
     try:
-        api_url = f"http://{camera_ip}/cgi-bin/webSetup.cgi?action=videoSnapshot&mode=1&streamIndex=1"
-        
-        image_base64 = page.evaluate("""async (url) => {
-            try {
-                const response = await fetch(url);
-                if (!response.ok) return null;
-                const blob = await response.blob();
-                
-                return new Promise((resolve) => {
-                    const reader = new FileReader();
-                    reader.onloadend = () => resolve(reader.result.split(',')[1]);
-                    reader.readAsDataURL(blob);
-                });
-            } catch (e) { 
-                return null; 
-            }
-        }""", api_url)
-        
-        if not image_base64:
-            return
-        
-        import base64
-        image_data = base64.b64decode(image_base64)
-        
-        desktop_path = os.path.join(os.path.expanduser("~"), "Desktop")
-        save_folder = os.path.join(desktop_path, "TestCapture")
-        
-        if not os.path.exists(save_folder):
-            os.makedirs(save_folder)
-
-        if file_name is None:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            file_name = f"snapshot_{timestamp}.jpg"
-        
-        if not file_name.lower().endswith(('.jpg', '.jpeg')):
-            file_name = file_name.rsplit('.', 1)[0] + '.jpg'
-        
-        full_path = os.path.join(save_folder, file_name)
-
-        with open(full_path, 'wb') as f:
-            f.write(image_data)
-            
-    except Exception:
-        pass
+        return get_snapshot_service(camera_ip, page=page).capture(file_name)
+    except Exception as e:
+        print_warning(f"스냅샷 요청 실패: {e}")
+        return None
 
 # ===========================================================
 # ⚙️ [API] 공통 제어 함수 (GET/SET)
 # ===========================================================
 
 def _api_get(page, ip, action, channel=None):
-    """API GET 요청"""
-    api_url = f"http://{ip}/cgi-bin/webSetup.cgi?action={action}&mode=1"
-    if channel is not None:
-        api_url += f"&channel={channel}"
-    
-    try:
-        response_text = page.evaluate("""async (url) => {
-            try {
-                const response = await fetch(url);
-                if (!response.ok) return `Error: ${response.status}`;
-                return await response.text();
-            } catch (e) { return `Error: ${e.message}`; }
-        }""", api_url)
-
-        if response_text and not response_text.startswith("Error"):
-            return parse_api_response(response_text)
-        else:
-            return None
-    except Exception:
-        return None
+    """API GET 요청 (공통 API 엔진 사용)"""
+    return get_api_client(ip, page=page).get(action, channel=channel)
 
 def _api_set(page, ip, action, params, channel=None):
-    """API SET 요청"""
-    query_str = "&".join([f"{k}={v}" for k, v in params.items()])
-    api_url = f"http://{ip}/cgi-bin/webSetup.cgi?action={action}&mode=0"
-    if channel is not None:
-        api_url += f"&channel={channel}"
-    api_url += f"&{query_str}"
-    
-    try:
-        response_text = page.evaluate("""async (url) => {
-            try {
-                const response = await fetch(url, { method: 'POST' });
-                if (!response.ok) return `Error: ${response.status}`;
-                return await response.text();
-            } catch (e) { return `Error: ${e.message}`; }
-        }""", api_url)
-
-        if "returnCode=0" in response_text:
-            return True
-        else:
-            return False
-    except Exception:
-        return False
+    """API SET 요청 (공통 API 엔진 사용)"""
+    return get_api_client(ip, page=page).set(action, params, channel=channel)
 
 # API 래퍼 함수들
 def api_get_video_easy_setting(page, ip): return _api_get(page, ip, "videoEasySetting")
@@ -216,6 +130,48 @@ def api_set_video_osd_text(page, ip, p): return _api_set(page, ip, "videoOsdText
 def api_get_video_osd_datetime(page, ip): return _api_get(page, ip, "videoOsdDateTime")
 def api_set_video_osd_datetime(page, ip, p): return _api_set(page, ip, "videoOsdDateTime", p)
 
+# ===========================================================
+# ⏳ [Wait] 설정 반영 대기 (API 읽기 값 폴링)
+# ===========================================================
+def wait_for_setting(page, ip, action, expected, channel=None, dwell=None):
+    """
+    API 읽기 값에 expected 값이 반영될 때까지 폴링 (고정 VIDEO_WAIT_TIME 대기 대체)
+    반영 후에는 영상이 안정될 때까지 대기 (dwell을 지정하면 dwell초 고정 대기, 0이면 대기 없음)
+    
+    Returns:
+        마지막으로 조회한 설정 dict (반영 실패 시에도 마지막 값, 조회 실패 시 None)
+    """
+    print(f"   ⏳ 반영 대기 ({action}: {','.join(expected)})...", end="")
+    start = time.monotonic()
+    ok, data = get_api_client(ip, page=page).wait_for_values(action, expected, channel=channel)
+    if ok:
+        print(f" {time.monotonic() - start:.1f}s")
+        # 값 반영 후 영상 파이프라인이 따라올 시간 (스냅샷용)
+        if dwell is None:
+            wait_for_stable_image(ip, page, label=action)
+        elif dwell > 0:
+            tracing.sleep(dwell)
+    else:
+        print(" 타임아웃")
+    return data
+
+def apply_video_cases(page, ip, action, cases, snapshot_prefix=None, verify=None):
+    """
+    [(이름, delta), ...] 케이스를 일괄 적용/검증 (test_matrix.run_cases)
+    
+    Returns:
+        실패 건수 (기준 설정 조회 실패 시 None)
+    """
+    return run_cases(page, ip, action, cases, snapshot_prefix=snapshot_prefix, verify=verify)
+
+def verify_orientation(reference, frame, mode, kind):
+    """미러링/피벗 스냅샷 판정 (off 상태이거나 프레임이 없으면 생략하고 통과)"""
+    if mode == "off" or reference is None or frame is None:
+        return True
+    ok, detail = check_orientation(reference, frame, mode, kind)
+    print(f"   🖼️ 영상 판정 ({kind}={mode}): {'Pass' if ok else 'Fail'} [{detail}]")
+    return ok
+
 # ===========================================================
 # 🛠️ [Helper] iRAS OSD 텍스트 추출 (Right Click + C)
 # ===========================================================
@@ -303,6 +259,104 @@ def parse_stream_info(text):
         
     return info
 
+def use_rtsp_probe(camera_ip=None):
+    """스트림 정보를 RTSP로 직접 측정하는지 여부 (STREAM_PROBE_SETTINGS["source"])"""
+    return bool(camera_ip) and STREAM_PROBE_SETTINGS["source"] == "rtsp"
+
+def read_stream_info(camera_ip=None, stream=1):
+    """
+    스트림 정보 1회 읽기 (코덱/해상도/IPS/Mbps)
+    - rtsp: 해당 스트림에 RTSP로 접속해 측정 구간(window) 동안 직접 측정
+    - iras: iRAS에 현재 표시 중인 스트림의 화면 정보(클립보드) 파싱
+    """
+    if use_rtsp_probe(camera_ip):
+        return probe_stream(camera_ip, stream)
+    return parse_stream_info(get_iras_clipboard_text())
+
+def wait_for_stream_info(check, label, timeout=None, camera_ip=None, stream=1):
+    """
+    스트림 정보가 check(info)를 만족할 때까지 폴링
+    
+    Returns:
+        마지막으로 읽은 스트림 정보 dict
+    """
+    print(f"   ⏳ 스트림 반영 대기 ({label})...", end="")
+    last = {"info": {}}
+    
+    def _applied():
+        info = read_stream_info(camera_ip, stream)
+        last["info"] = info
+        return check(info)
+    
+    start = time.monotonic()
+    # RTSP 측정은 측정 구간 자체가 간격 역할, 클립보드 복사는 우클릭 조작이 필요하므로 1초 이상 간격
+    ok = wait_until(_applied, timeout=timeout, interval=0.1 if use_rtsp_probe(camera_ip) else 1.0, label=label)
+    print(f" {time.monotonic() - start:.1f}s" if ok else " 타임아웃")
+    return last["info"]
+
+def open_ips_sampler(camera_ip, stream=1):
+    """RTSP IPS 시계열 기록기 연결 (iRAS 모드이거나 접속 실패 시 None)"""
+    if not use_rtsp_probe(camera_ip):
+        return None
+    sampler = IpsSampler(camera_ip, stream)
+    try:
+        sampler.open()
+    except (OSError, StreamProbeError) as e:
+        print(f"   ⚠️ RTSP 접속 실패, 단일 측정으로 대체: {e}")
+        return None
+    return sampler
+
+def format_ips_trend(samples):
+    """IPS 시계열을 변화 지점만 요약 ('30.0@0.5s → 5.0@11.5s')"""
+    points = []
+    for t, ips in samples:
+        if not points or abs(ips - points[-1][1]) >= STREAM_PROBE_SETTINGS["ips_tolerance"]:
+            points.append((t, ips))
+    return " → ".join(f"{ips}@{t:.1f}s" for t, ips in points)
+
+def stream_checks(info, expected):
+    """스트림 정보와 기대값 항목별 비교 {"codec", "resolution", "ips": 일치 여부}"""
+    return {
+        "codec": info.get('codec') == expected['codec'],
+        "resolution": info.get('res_str') == expected['resolution'],
+        "ips": abs(info.get('ips', -1.0) - expected['ips']) < STREAM_PROBE_SETTINGS["ips_tolerance"],
+    }
+
+def verify_streams(camera_ip, expected, timeout=None):
+    """
+    사용 중인 스트림 전체를 RTSP로 동시에 측정해 기대값과 비교
+    (스트림마다 전환/측정하는 대신 한 측정 구간에 전체 확인, 동시 인코딩 부하 상태에서 검증)
+    
+    Args:
+        expected: {스트림 번호: {"codec", "resolution", "ips"}}
+    
+    Returns:
+        {스트림 번호: {"info": 측정값, "checks": 항목별 결과, "ok": 전체 일치}} (마지막 측정 기준)
+    """
+    timeout = STREAM_PROBE_SETTINGS["verify_timeout"] if timeout is None else timeout
+    report = {}
+    
+    def _all_matched():
+        for stream_num, info in probe_streams(camera_ip, expected).items():
+            checks = stream_checks(info, expected[stream_num])
+            report[stream_num] = {"info": info, "checks": checks, "ok": all(checks.values())}
+        return all(r["ok"] for r in report.values())
+    
+    print(f"   ⏳ 스트림 {len(expected)}개 동시 측정...", end="")
+    start = time.monotonic()
+    ok = wait_until(_all_matched, timeout=timeout, interval=0.1, label="streams")
+    print(f" {time.monotonic() - start:.1f}s" if ok else " 타임아웃")
+    
+    mark = lambda passed: '✅' if passed else '❌'
+    print(f"      {'Stream':<8}{'Codec':<12}{'Resolution':<16}{'IPS':<14}{'Mbps':>6}")
+    for stream_num, r in sorted(report.items()):
+        info, checks, exp = r["info"], r["checks"], expected[stream_num]
+        print(f"      {stream_num:<8}{info.get('codec', '-'):<9}{mark(checks['codec']):<3}"
+              f"{info.get('res_str', '-'):<13}{mark(checks['resolution']):<3}"
+              f"{str(info.get('ips', '-')) + '/' + str(exp['ips']):<11}{mark(checks['ips']):<3}"
+              f"{info.get('mbps', 0.0):>6.2f}")
+    return report
+
 # ===========================================================
 # 🧪 [Test 1] Self Adjust Mode
 # ===========================================================
@@ -325,9 +379,8 @@ def run_self_adjust_mode_test(page: Page, camera_ip: str):
         preset_name = preset_names.get(val, name)
         print_action(f"모드 변경: {name}")
         if api_set_video_easy_setting(page, camera_ip, {"easyDayType": val, "easyNightType": val}):
-            time.sleep(VIDEO_WAIT_TIME)
+            curr = wait_for_setting(page, camera_ip, "videoEasySetting", {"easyDayType": val})
             trigger_iras_snapshot(page, camera_ip, f"{preset_name}.png")
-            curr = api_get_video_easy_setting(page, camera_ip)
             if curr and curr.get("easyDayType") == val:
                 print_success(f"{name} 검증 완료")
             else: 
@@ -337,8 +390,8 @@ def run_self_adjust_mode_test(page: Page, camera_ip: str):
             failed_count += 1
     
     print_action("Natural 모드로 복구 중...")
-    api_set_video_easy_setting(page, camera_ip, {"easyDayType": "1", "easyNightType": "1"})
-    time.sleep(2)
+    if api_set_video_easy_setting(page, camera_ip, {"easyDayType": "1", "easyNightType": "1"}):
+        wait_for_setting(page, camera_ip, "videoEasySetting", {"easyDayType": "1", "easyNightType": "1"}, dwell=0)
     print_success("복구 완료")
 
     print_step(2, 2, "Custom 모드 테스트")
@@ -355,7 +408,7 @@ def run_self_adjust_mode_test(page: Page, camera_ip: str):
     else:
         return False, "설정 조회 실패"
     
-    time.sleep(2)
+    wait_for_setting(page, camera_ip, "videoEasySetting", {"easyDayType": payload["easyDayType"]})
     trigger_iras_snapshot(page, camera_ip, "Custom_진입.png")
     print_success("Custom 모드 진입 완료")
 
@@ -373,9 +426,8 @@ def run_self_adjust_mode_test(page: Page, camera_ip: str):
             if 'returnCode' in payload: del payload['returnCode']
 
             if api_set_video_easy_setting(page, camera_ip, payload):
-                time.sleep(VIDEO_WAIT_TIME)
+                curr = wait_for_setting(page, camera_ip, "videoEasySetting", {api_key: val})
                 trigger_iras_snapshot(page, camera_ip, f"Custom_{param}_{val}.png")
-                curr = api_get_video_easy_setting(page, camera_ip)
                 if curr and curr.get(api_key) == val: 
                     print(f"      {val}: ✅")
                 else: 
@@ -385,8 +437,8 @@ def run_self_adjust_mode_test(page: Page, camera_ip: str):
                 failed_count += 1
     
     print_action("Natural 모드로 복구 중...")
-    api_set_video_easy_setting(page, camera_ip, {"easyDayType": "1", "easyNightType": "1"})
-    time.sleep(2)
+    if api_set_video_easy_setting(page, camera_ip, {"easyDayType": "1", "easyNightType": "1"}):
+        wait_for_setting(page, camera_ip, "videoEasySetting", {"easyDayType": "1", "easyNightType": "1"}, dwell=0)
     print_success("복구 완료")
     
     if failed_count == 0:
@@ -405,75 +457,23 @@ def run_video_image_test(page: Page, camera_ip: str):
     print(f"🎬 [Video Test 2/10] Image Setting")
     print("=======================================================")
     
-    base_set = api_get_video_image(page, camera_ip)
-    if not base_set: return False, "설정 조회 실패"
-    if 'returnCode' in base_set: del base_set['returnCode']
+    # 첫 케이스(Mirroring/Pivot 모두 off)의 프레임을 카메라별 기준으로 영상 판정
+    references = {}
     
-    failed_count = 0
+    def _verify(ip, pg, name, values):
+        frame = grab_frame(ip, pg)
+        if name == "Base":
+            references[ip] = frame
+            return True
+        kind = "mirroring" if values['mirroring'] != 'off' else "pivot"
+        return verify_orientation(references.get(ip), frame, values[kind], kind)
 
-    print_step(1, 2, "Mirroring 테스트")
-    for mode in VIDEO_MIRRORING_OPTS:
-        print(f"\n   👉 Mirroring: {mode}")
-        
-        curr_set = api_get_video_image(page, camera_ip)
-        if not curr_set: continue
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['mirroring'] = mode
-        
-        if api_set_video_image(page, camera_ip, payload):
-            print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            trigger_iras_snapshot(page, camera_ip, f"Mirroring_{mode}.png")
-            curr = api_get_video_image(page, camera_ip)
-            if curr and curr.get('mirroring') == mode: 
-                print(f"   ✅ Pass")
-            else: 
-                print("   ❌ Fail")
-                failed_count += 1
-        else: failed_count += 1
-    
-    # Step 1 복구: Mirroring을 off로
-    print("\n   🔄 Step 1 복구: Mirroring → off")
-    curr_set = api_get_video_image(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['mirroring'] = 'off'
-        api_set_video_image(page, camera_ip, payload)
-        time.sleep(2)
-    
-    print_step(2, 2, "Pivot 테스트")
-    for mode in VIDEO_PIVOT_OPTS:
-        print(f"\n   👉 Pivot: {mode}")
-        
-        curr_set = api_get_video_image(page, camera_ip)
-        if not curr_set: continue
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['pivot'] = mode
-        
-        if api_set_video_image(page, camera_ip, payload):
-            print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            trigger_iras_snapshot(page, camera_ip, f"Pivot_{mode}.png")
-            curr = api_get_video_image(page, camera_ip)
-            if curr and curr.get('pivot') == mode:
-                print(f"   ✅ Pass")
-            else: 
-                print("   ❌ Fail")
-                failed_count += 1
-        else: failed_count += 1
-    
-    # Step 2 복구: Pivot을 off로
-    print("\n   🔄 Step 2 복구: Pivot → off")
-    curr_set = api_get_video_image(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['pivot'] = 'off'
-        api_set_video_image(page, camera_ip, payload)
-        time.sleep(2)
+    print_step(1, 1, "Mirroring / Pivot 테스트")
+    matrix = Matrix("videoImage", [Axis("mirroring", VIDEO_MIRRORING_OPTS, base="off", label="Mirroring"),
+                                   Axis("pivot", VIDEO_PIVOT_OPTS, base="off", label="Pivot")],
+                    verify=_verify, snapshot_prefix="Image")
+    failed_count = run_matrix(page, camera_ip, matrix)
+    if failed_count is None: return False, "설정 조회 실패"
 
     if failed_count == 0: return True, "Video Image 성공"
     else: return False, f"Video Image 실패 ({failed_count}건)"
@@ -489,124 +489,58 @@ def run_white_balance_test(page: Page, camera_ip: str):
     trigger_iras_snapshot(page, camera_ip, "WB_기본값.png")
     failed_count = 0
 
-    print_step(1, 3, "Preset Mode 테스트")
-    for mode_val, mode_name in VIDEO_WB_MODES.items():
-        if mode_val in ["manual", "hold"]: continue  # manual과 hold는 별도 테스트
-        print(f"\n   👉 설정: {mode_name} ({mode_val})")
-        
-        curr_set = api_get_video_wb(page, camera_ip)
-        if not curr_set: continue
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['wbMode'] = mode_val
-        
-        if api_set_video_wb(page, camera_ip, payload):
-            print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            trigger_iras_snapshot(page, camera_ip, f"WB_{mode_name.replace(' ', '_')}.png")
-            curr = api_get_video_wb(page, camera_ip)
-            if curr and curr.get("wbMode") == mode_val: 
-                print("   ✅ Pass")
-            else: 
-                print(f"   ❌ Fail (기대: {mode_val}, 실제: {curr.get('wbMode') if curr else 'None'})")
-                failed_count += 1
-        else: 
-            print("   ❌ API 설정 실패")
-            failed_count += 1
-    
-    # Step 1 복구: Auto로 복구
-    print("\n   🔄 Step 1 복구: WB Mode → auto")
-    curr_set = api_get_video_wb(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['wbMode'] = 'auto'
-        api_set_video_wb(page, camera_ip, payload)
-        time.sleep(2)
-
-    print_step(2, 3, "Hold Mode 테스트")
+    print_step(1, 2, "Preset / Hold Mode 테스트")
+    # manual은 별도 테스트, hold는 프리셋 이후에 확인
+    modes = [m for m in VIDEO_WB_MODES if m not in ["manual", "hold"]]
     if "hold" in VIDEO_WB_MODES:
-        print(f"   👉 설정: {VIDEO_WB_MODES['hold']} (hold)")
-        
-        curr_set = api_get_video_wb(page, camera_ip)
-        if not curr_set: 
-            print("   ⚠️ 설정 조회 실패")
-        else:
-            payload = curr_set.copy()
-            if 'returnCode' in payload: del payload['returnCode']
-            payload['wbMode'] = 'hold'
-            
-            if api_set_video_wb(page, camera_ip, payload):
-                print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-                time.sleep(VIDEO_WAIT_TIME)
-                trigger_iras_snapshot(page, camera_ip, f"WB_{VIDEO_WB_MODES['hold'].replace(' ', '_')}.png")
-                curr = api_get_video_wb(page, camera_ip)
-                if curr and curr.get("wbMode") == 'hold': 
-                    print("   ✅ Pass")
-                else: 
-                    print(f"   ❌ Fail (기대: hold, 실제: {curr.get('wbMode') if curr else 'None'})")
-                    failed_count += 1
-            else: 
-                print("   ❌ API 설정 실패")
-                failed_count += 1
+        modes.append("hold")
+    cases = [(VIDEO_WB_MODES[m].replace(' ', '_'), {"wbMode": m}) for m in modes]
+    frames = {}
+    
+    def _verify_wb(name, delta):
+        """
+        프리셋: Auto 대비 색조(R/G, B/G) 변화
+        Manual: 같은 게인의 이전 케이스 대비 증감 방향으로 R/G 또는 B/G가 변했는지
+        """
+        frame = grab_frame(camera_ip, page)
+        if frame is None:
+            return True
+        mode = delta.get("wbMode")
+        min_shift = IMAGE_VERIFY_SETTINGS["min_chroma_shift"]
+        if mode == "auto":
+            frames["auto"] = frame
+            return True
+        if mode == "manual":
+            for param, index, label in (("redGain", 0, "R/G"), ("blueGain", 1, "B/G")):
+                if param not in delta:
+                    continue
+                previous = frames.get(param)
+                frames[param] = (int(delta[param]), frame)
+                if previous and previous[0] != int(delta[param]):
+                    direction = 1 if int(delta[param]) > previous[0] else -1
+                    return judge_shift(chroma_shift(previous[1], frame)[index], min_shift, f"{name} {label} 변화", direction)
+            return True
+        if mode == "hold" or "auto" not in frames:
+            return True
+        shift = max(chroma_shift(frames["auto"], frame), key=abs)
+        return judge_shift(shift, min_shift, f"{name} 색조 변화 (Auto 대비)")
     
-    # Step 2 복구: Auto로 복구
-    print("\n   🔄 Step 2 복구: WB Mode → auto")
-    curr_set = api_get_video_wb(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['wbMode'] = 'auto'
-        api_set_video_wb(page, camera_ip, payload)
-        time.sleep(2)
+    failed = apply_video_cases(page, camera_ip, "videoWb", cases, snapshot_prefix="WB", verify=_verify_wb)
+    if failed is None: return False, "설정 조회 실패"
+    failed_count += failed
 
-    print_step(3, 3, "Manual Mode (Gain) 테스트")
-    
-    curr_set = api_get_video_wb(page, camera_ip)
-    if not curr_set: return False, "설정 조회 실패"
-    payload = curr_set.copy()
-    if 'returnCode' in payload: del payload['returnCode']
-    payload['wbMode'] = 'manual'
-    
-    if not api_set_video_wb(page, camera_ip, payload):
-        return False, "Manual 진입 실패"
-    
-    time.sleep(2)
-    trigger_iras_snapshot(page, camera_ip, "WB_Manual_진입.png")
-    
+    print_step(2, 2, "Manual Mode (Gain) 테스트")
+    cases = [("Manual_진입", {"wbMode": "manual"})]
     for param, name in [("redGain", "Red"), ("blueGain", "Blue")]:
-        print(f"\n   --- [Target: {name}] ---")
         for val in VIDEO_WB_GAIN_TEST_VALUES:
-            print(f"   👉 값 변경: {val}")
-            
-            curr_set = api_get_video_wb(page, camera_ip)
-            if not curr_set: continue
-            
-            payload = curr_set.copy()
-            if 'returnCode' in payload: del payload['returnCode']
-            payload['wbMode'] = 'manual'
-            payload[param] = val
-            
-            if api_set_video_wb(page, camera_ip, payload):
-                print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-                time.sleep(VIDEO_WAIT_TIME)
-                trigger_iras_snapshot(page, camera_ip, f"WB_Manual_{name}Gain_{val}.png")
-                curr = api_get_video_wb(page, camera_ip)
-                if curr and curr.get(param) == val: print(f"   ✅ Pass: {val}")
-                else: 
-                    print("   ❌ Fail")
-                    failed_count += 1
-            else: failed_count += 1
+            cases.append((f"Manual_{name}Gain_{val}", {"wbMode": "manual", param: val}))
     
-    # Step 3 복구: Auto로 복구
-    print("\n   🔄 Step 3 복구: WB Mode → auto")
-    curr_set = api_get_video_wb(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['wbMode'] = 'auto'
-        api_set_video_wb(page, camera_ip, payload)
-        time.sleep(10)
+    failed = apply_video_cases(page, camera_ip, "videoWb", cases, snapshot_prefix="WB", verify=_verify_wb)
+    if failed is None: return False, "설정 조회 실패"
+    failed_count += failed
+    
+    # Auto WB 색 수렴은 API로 관측할 수 없으므로 영상이 안정될 때까지 대기 (비교 불가 시 10초)
+    wait_for_stable_image(camera_ip, page, fallback=10, label="videoWb_restore")
     
     if failed_count == 0: return True, "WB Test 성공"
     else: return False, f"WB Test 실패 ({failed_count}건)"
@@ -624,41 +558,25 @@ def run_exposure_test(page: Page, camera_ip: str):
     failed_count = 0
 
     print_step(1, 3, "AE Target Gain 테스트")
-    for val in VIDEO_TARGET_GAIN_VALUES:
-        print(f"   👉 Target Gain: {val}")
-        
-        curr_set = api_get_video_exposure(page, camera_ip)
-        if not curr_set: failed_count += 1; continue
-            
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        
-        # 충돌 방지
-        payload['manualAeControl'] = 'off'
-        payload['wdr'] = 'off' 
-        payload['targetGain'] = val
-        
-        if api_set_video_exposure(page, camera_ip, payload):
-            print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            trigger_iras_snapshot(page, camera_ip, f"Exposure_TargetGain_{val}.png")
-            curr = api_get_video_exposure(page, camera_ip)
-            if curr and curr.get('targetGain') == val:
-                print(f"   ✅ Pass")
-            else:
-                print(f"   ❌ Fail")
-                failed_count += 1
-        else: failed_count += 1
+    # manualAeControl/wdr off: 충돌 방지
+    cases = [(f"TargetGain_{val}", {'manualAeControl': 'off', 'wdr': 'off', 'targetGain': val})
+             for val in VIDEO_TARGET_GAIN_VALUES]
+    previous = {}
+    
+    def _verify_gain(name, delta):
+        """이전 케이스 대비 목표 게인 증감 방향으로 평균 밝기가 변했는지"""
+        frame = grab_frame(camera_ip, page)
+        prev_gain, prev_frame = previous.get("gain"), previous.get("frame")
+        previous.update(gain=int(delta['targetGain']), frame=frame)
+        if frame is None or prev_frame is None or prev_gain == int(delta['targetGain']):
+            return True
+        direction = 1 if int(delta['targetGain']) > prev_gain else -1
+        return judge_shift(luma_shift(prev_frame, frame), IMAGE_VERIFY_SETTINGS["min_luma_shift"],
+                           f"{name} 밝기 변화", direction)
     
-    # Step 1 복구: Target Gain을 0으로
-    print("\n   🔄 Step 1 복구: Target Gain → 0")
-    curr_set = api_get_video_exposure(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['targetGain'] = '0'
-        api_set_video_exposure(page, camera_ip, payload)
-        time.sleep(2)
+    failed = apply_video_cases(page, camera_ip, "videoExposure", cases, snapshot_prefix="Exposure",
+                               verify=_verify_gain)
+    failed_count += len(cases) if failed is None else failed
 
     # # 2. Manual Shutter Speed (Fixed Logic)
     # print("\n[Step 2] Manual Shutter Speed (1/30 vs 1/8000)")
@@ -693,7 +611,7 @@ def run_exposure_test(page: Page, camera_ip: str):
         
     #     if api_set_video_exposure(page, camera_ip, payload):
     #         print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-    #         time.sleep(VIDEO_WAIT_TIME)
+    #         tracing.sleep(VIDEO_WAIT_TIME)
     #         trigger_iras_snapshot()
             
     #         curr = api_get_video_exposure(page, camera_ip)
@@ -711,7 +629,7 @@ def run_exposure_test(page: Page, camera_ip: str):
     print("    Slow Shutter 동작 확인을 위해 카메라 렌즈를 가리거나,")
     print("    주변 환경을 어둡게 만든 뒤 Enter 키를 눌러주세요.")
     print("="*60)
-    input(">> 준비되었으면 Enter를 누르세요...")
+    wait_for_operator()
     print("   ▶️ 테스트를 계속 진행합니다...\n")
 
     # Day 모드로 고정
@@ -723,8 +641,8 @@ def run_exposure_test(page: Page, camera_ip: str):
         daynight_payload['bwMode'] = 'schedule'
         daynight_payload['icrMode'] = 'schedule'
         daynight_payload['schedule'] = VIDEO_DAY_SCHEDULE_STR  # 항상 Day
-        api_set_video_daynight(page, camera_ip, daynight_payload)
-        time.sleep(2)
+        if api_set_video_daynight(page, camera_ip, daynight_payload):
+            wait_for_setting(page, camera_ip, "videoDaynight", {'bwMode': 'schedule', 'icrMode': 'schedule'}, dwell=0)
     
     # 기준 스냅샷 (Slow Shutter off 상태)
     print("   📸 기준 스냅샷 (Slow Shutter Off)")
@@ -735,9 +653,10 @@ def run_exposure_test(page: Page, camera_ip: str):
         payload['manualAeControl'] = 'off'
         payload['wdr'] = 'off'
         payload['slowShutter'] = 'off'
-        api_set_video_exposure(page, camera_ip, payload)
-        time.sleep(VIDEO_WAIT_TIME)
+        if api_set_video_exposure(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoExposure", {'slowShutter': 'off', 'wdr': 'off'})
         trigger_iras_snapshot(page, camera_ip, "Exposure_SlowShutter_Before.png")
+    before_frame = grab_frame(camera_ip, page)
     
     # Slow Shutter 설정
     slow_shutter_val = "1/7.5s" 
@@ -754,26 +673,28 @@ def run_exposure_test(page: Page, camera_ip: str):
         
         if api_set_video_exposure(page, camera_ip, payload):
             # 설정 검증
-            curr = api_get_video_exposure(page, camera_ip)
+            curr = wait_for_setting(page, camera_ip, "videoExposure", {'slowShutter': slow_shutter_val}, dwell=0)
             if curr and curr.get('slowShutter') == slow_shutter_val:
                 print(f"   ✅ 설정 적용 확인")
             else:
                 print(f"   ❌ 설정 검증 실패")
                 failed_count += 1
             
-            # IPS가 떨어질 때까지 10초 대기
-            print(f"   ⏳ IPS 감소 대기 중 (10초)...")
-            time.sleep(10)
-            
-            # IPS 확인
-            print(f"   📊 IPS 확인 중...")
-            screen_text = get_iras_clipboard_text()
-            info = parse_stream_info(screen_text)
+            # IPS가 10 이하로 떨어질 때까지 대기 (최대 10초)
+            info = wait_for_stream_info(lambda i: 0 < i.get('ips', -1.0) <= 10.0, "SlowShutter IPS", timeout=10,
+                                        camera_ip=camera_ip)
             detected_ips = info.get('ips', -1.0)
             
             # 스냅샷
             trigger_iras_snapshot(page, camera_ip, f"Exposure_SlowShutter_{slow_shutter_val.replace('/', '_')}.png")
             
+            # 영상 검증: 노출 시간이 길어져 평균 밝기가 올라갔는지
+            after_frame = grab_frame(camera_ip, page)
+            if before_frame is not None and after_frame is not None:
+                if not judge_shift(luma_shift(before_frame, after_frame), IMAGE_VERIFY_SETTINGS["min_luma_shift"],
+                                   "Slow Shutter 밝기 변화", +1):
+                    failed_count += 1
+            
             # 검증
             if detected_ips > 0:
                 print(f"   📊 현재 IPS: {detected_ips}")
@@ -796,50 +717,18 @@ def run_exposure_test(page: Page, camera_ip: str):
         payload = curr_set.copy()
         if 'returnCode' in payload: del payload['returnCode']
         payload['slowShutter'] = 'off'
-        api_set_video_exposure(page, camera_ip, payload)
-        time.sleep(2)
+        if api_set_video_exposure(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoExposure", {'slowShutter': 'off'}, dwell=0)
 
     print_step(3, 3, "WDR 테스트")
+    cases = []
     for mode in VIDEO_WDR_MODES:
-        print(f"   👉 WDR: {mode}")
-        
-        curr_set = api_get_video_exposure(page, camera_ip)
-        if not curr_set: failed_count += 1; continue
-
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        
-        payload['wdr'] = mode
-        if mode == 'on': 
-            payload['wdrLevel'] = '2'
-            payload['slowShutter'] = 'off' # WDR과 충돌 방지
-            payload['targetGain'] = '0'
-        
-        # 모드에 상관없이 충돌 방지
-        if mode == 'off':
-            payload['slowShutter'] = 'off' # 깔끔하게
-
-        if api_set_video_exposure(page, camera_ip, payload):
-            print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            trigger_iras_snapshot(page, camera_ip, f"Exposure_WDR_{mode.upper()}.png")
-            curr = api_get_video_exposure(page, camera_ip)
-            if curr and curr.get('wdr') == mode:
-                print(f"   ✅ Pass")
-            else:
-                print(f"   ❌ Fail")
-                failed_count += 1
-        else: failed_count += 1
-    
-    # Step 4 복구: WDR을 off로
-    print("\n   🔄 Step 4 복구: WDR → off")
-    curr_set = api_get_video_exposure(page, camera_ip)
-    if curr_set:
-        payload = curr_set.copy()
-        if 'returnCode' in payload: del payload['returnCode']
-        payload['wdr'] = 'off'
-        api_set_video_exposure(page, camera_ip, payload)
-        time.sleep(2)
+        delta = {'wdr': mode, 'slowShutter': 'off'}  # Slow Shutter는 WDR과 충돌
+        if mode == 'on':
+            delta.update({'wdrLevel': '2', 'targetGain': '0'})
+        cases.append((f"WDR_{mode.upper()}", delta))
+    failed = apply_video_cases(page, camera_ip, "videoExposure", cases, snapshot_prefix="Exposure")
+    failed_count += len(cases) if failed is None else failed
     
     if failed_count == 0: return True, "Exposure Test 성공"
     else: return False, f"Exposure Test 실패 ({failed_count}건)"
@@ -879,10 +768,10 @@ def run_daynight_test(page: Page, camera_ip: str):
     print("    1. 카메라의 렌즈와 조도 센서를 가려주세요.")
     print("    2. '딸깍' 소리와 함께 흑백(Night)으로 바뀌면 Enter를 누르세요.")
     print("="*60)
-    input(">> 준비되었으면 Enter를 누르세요...")
+    wait_for_operator()
     
-    print("   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-    time.sleep(VIDEO_WAIT_TIME)
+    # 사용자가 전환을 확인한 뒤이므로 영상 안정화만 대기
+    wait_for_stable_image(camera_ip, page, label="videoDaynight")
     trigger_iras_snapshot(page, camera_ip, "DayNight_Auto_Night.png") # 흑백 영상 캡처
 
     # 3. Day 전환 유도 (사용자 개입)
@@ -891,10 +780,10 @@ def run_daynight_test(page: Page, camera_ip: str):
     print("    1. 가림막을 제거하여 밝게 해주세요.")
     print("    2. 컬러(Day)로 돌아오면 Enter를 누르세요.")
     print("="*60)
-    input(">> 준비되었으면 Enter를 누르세요...")
+    wait_for_operator()
     
-    print("   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-    time.sleep(VIDEO_WAIT_TIME)
+    # 사용자가 전환을 확인한 뒤이므로 영상 안정화만 대기
+    wait_for_stable_image(camera_ip, page, label="videoDaynight")
     trigger_iras_snapshot(page, camera_ip, "DayNight_Auto_Day.png") # 컬러 영상 캡처
 
     print_step(2, 2, "Schedule Mode 테스트")
@@ -907,11 +796,8 @@ def run_daynight_test(page: Page, camera_ip: str):
     payload['schedule'] = VIDEO_NIGHT_SCHEDULE_STR # 5555...
     
     if api_set_video_daynight(page, camera_ip, payload):
-        print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s) -> 흑백이어야 함")
-        time.sleep(VIDEO_WAIT_TIME)
+        curr = wait_for_setting(page, camera_ip, "videoDaynight", {'bwMode': 'schedule', 'schedule': VIDEO_NIGHT_SCHEDULE_STR})
         trigger_iras_snapshot(page, camera_ip, "DayNight_Schedule_Night.png")
-        
-        curr = api_get_video_daynight(page, camera_ip)
         if curr and curr.get('bwMode') == 'schedule':
             print(f"   ✅ 설정 적용 확인")
         else:
@@ -927,10 +813,13 @@ def run_daynight_test(page: Page, camera_ip: str):
     payload['schedule'] = VIDEO_DAY_SCHEDULE_STR # 0000...
     
     if api_set_video_daynight(page, camera_ip, payload):
-        print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s) -> 컬러여야 함")
-        time.sleep(VIDEO_WAIT_TIME)
+        curr = wait_for_setting(page, camera_ip, "videoDaynight", {'schedule': VIDEO_DAY_SCHEDULE_STR})
         trigger_iras_snapshot(page, camera_ip, "DayNight_Schedule_Day.png")
-        print(f"   ✅ 설정 적용 확인")
+        if curr and curr.get('schedule') == VIDEO_DAY_SCHEDULE_STR:
+            print(f"   ✅ 설정 적용 확인")
+        else:
+            print(f"   ❌ 검증 실패")
+            failed_count += 1
     else:
         print("   ❌ API 전송 실패")
         failed_count += 1
@@ -943,8 +832,8 @@ def run_daynight_test(page: Page, camera_ip: str):
         if 'returnCode' in payload: del payload['returnCode']
         payload['bwMode'] = 'auto'
         payload['icrMode'] = 'auto'
-        api_set_video_daynight(page, camera_ip, payload)
-        time.sleep(2)
+        if api_set_video_daynight(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoDaynight", {'bwMode': 'auto', 'icrMode': 'auto'}, dwell=0)
 
     if failed_count == 0: return True, "Day&Night Test 성공"
     else: return False, f"Day&Night Test 실패 ({failed_count}건)"
@@ -977,11 +866,8 @@ def run_video_misc_test(page: Page, camera_ip: str):
         payload['imageStabilizer'] = mode
         
         if api_set_video_misc(page, camera_ip, payload):
-            print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
+            curr = wait_for_setting(page, camera_ip, "videoMisc", {'imageStabilizer': mode})
             trigger_iras_snapshot(page, camera_ip, f"EIS_{mode_name}.png")
-            
-            curr = api_get_video_misc(page, camera_ip)
             if curr and curr.get('imageStabilizer') == mode:
                 print(f"   ✅ 설정 적용 확인 (EIS {mode_name})")
             else:
@@ -996,8 +882,8 @@ def run_video_misc_test(page: Page, camera_ip: str):
             print(f"   🔄 EIS {mode_name} 테스트 후 복구: EIS → off")
             restore_payload = curr_set.copy()
             restore_payload['imageStabilizer'] = 'off'
-            api_set_video_misc(page, camera_ip, restore_payload)
-            time.sleep(2)
+            if api_set_video_misc(page, camera_ip, restore_payload):
+                wait_for_setting(page, camera_ip, "videoMisc", {'imageStabilizer': 'off'}, dwell=0)
 
     if failed_count == 0: return True, "Video Misc (EIS) Test 성공"
     else: return False, f"Video Misc (EIS) Test 실패 ({failed_count}건)"
@@ -1057,12 +943,12 @@ def run_streaming_test(page: Page, camera_ip: str):
 
     if api_set_video_streaming(page, camera_ip, payload):
         print("   ✅ 스트림 2, 3, 4번 설정 완료")
-        time.sleep(3) 
+        wait_for_setting(page, camera_ip, "videoStreaming", {'useStream2': 'on', 'useStream3': 'on', 'useStream4': 'on'})
     else:
         print("   ❌ 스트림 설정 실패")
         failed_count += 1
 
-    print_step(2, 5, "iRAS 스트림 전환 검증")
+    print_step(2, 5, "스트림 검증")
     
     # 스트림 2, 3, 4 설정 정보
     stream_configs = {
@@ -1071,43 +957,52 @@ def run_streaming_test(page: Page, camera_ip: str):
         4: {"codec": "h265", "resolution": "1920x1080", "ips": 5.0}
     }
     
-    for stream_num, expected in stream_configs.items():
-        print(f"\n   👉 스트림 {stream_num}번으로 전환")
+    if use_rtsp_probe(camera_ip):
+        # 스트림 1은 현재 설정값을 기대값으로 함께 동시 측정
+        expected = dict(stream_configs)
+        curr_set = api_get_video_streaming(page, camera_ip)
+        if curr_set and curr_set.get('codecStream1'):
+            expected[1] = {"codec": curr_set['codecStream1'], "resolution": curr_set.get('resolutionStream1'),
+                           "ips": float(curr_set.get('framerateStream1', 0))}
+        report = verify_streams(camera_ip, expected)
+        for stream_num, r in sorted(report.items()):
+            if r["ok"]:
+                print(f"   ✅ 스트림 {stream_num} 검증 성공")
+            else:
+                print(f"   ❌ 스트림 {stream_num} 검증 실패")
+                failed_count += 1
+    else:
+        for stream_num, expected in stream_configs.items():
+            print(f"\n   👉 스트림 {stream_num}번으로 전환")
+            
+            ctrl = IRASController()
+            if not ctrl.switch_stream(stream_num):
+                print(f"   ❌ 스트림 {stream_num} 전환 실패")
+                failed_count += 1
+                continue
+            
+            # 클립보드 텍스트에서 스트림 정보 읽기 (기대값이 보일 때까지 폴링)
+            info = wait_for_stream_info(lambda i, expected=expected: all(stream_checks(i, expected).values()),
+                                        f"Stream{stream_num} 전환")
+            checks = stream_checks(info, expected)
+            
+            print(f"      코덱: {info.get('codec', 'Unknown')} (기대: {expected['codec']}) {'✅' if checks['codec'] else '❌'}")
+            print(f"      해상도: {info.get('res_str', 'Unknown')} (기대: {expected['resolution']}) {'✅' if checks['resolution'] else '❌'}")
+            print(f"      IPS: {info.get('ips', 'Unknown')} (기대: {expected['ips']}) {'✅' if checks['ips'] else '❌'}")
+            
+            if all(checks.values()):
+                print(f"   ✅ 스트림 {stream_num} 검증 성공")
+            else:
+                print(f"   ❌ 스트림 {stream_num} 검증 실패")
+                failed_count += 1
         
+        # 스트림 1번으로 복귀
+        print(f"\n   👉 스트림 1번으로 복귀")
         ctrl = IRASController()
-        if not ctrl.switch_stream(stream_num):
-            print(f"   ❌ 스트림 {stream_num} 전환 실패")
-            failed_count += 1
-            continue
-        
-        # 클립보드 텍스트에서 스트림 정보 읽기
-        print(f"   📊 스트림 {stream_num} 정보 확인 중...")
-        screen_text = get_iras_clipboard_text()
-        info = parse_stream_info(screen_text)
-        
-        # 검증
-        codec_ok = info.get('codec') == expected['codec']
-        res_ok = info.get('res_str') == expected['resolution']
-        ips_ok = abs(info.get('ips', -1.0) - expected['ips']) < 1.0
-        
-        print(f"      코덱: {info.get('codec', 'Unknown')} (기대: {expected['codec']}) {'✅' if codec_ok else '❌'}")
-        print(f"      해상도: {info.get('res_str', 'Unknown')} (기대: {expected['resolution']}) {'✅' if res_ok else '❌'}")
-        print(f"      IPS: {info.get('ips', 'Unknown')} (기대: {expected['ips']}) {'✅' if ips_ok else '❌'}")
-        
-        if codec_ok and res_ok and ips_ok:
-            print(f"   ✅ 스트림 {stream_num} 검증 성공")
+        if not ctrl.switch_stream(1):
+            print(f"   ⚠️ 스트림 1 복귀 실패")
         else:
-            print(f"   ❌ 스트림 {stream_num} 검증 실패")
-            failed_count += 1
-    
-    # 스트림 1번으로 복귀
-    print(f"\n   👉 스트림 1번으로 복귀")
-    ctrl = IRASController()
-    if not ctrl.switch_stream(1):
-        print(f"   ⚠️ 스트림 1 복귀 실패")
-    else:
-        print(f"   ✅ 스트림 1 복귀 완료")
-        time.sleep(1)
+            print(f"   ✅ 스트림 1 복귀 완료")
 
     print_step(3, 5, "코덱 변경 확인 (Stream 1)")
     codecs_to_test = VIDEO_STREAMING_CODECS 
@@ -1124,12 +1019,9 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload[f'codecStream{target_stream}'] = codec
         
         if api_set_video_streaming(page, camera_ip, payload):
-            print(f"   ⏳ 반영 대기 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            
-            # 클립보드 텍스트 읽기
-            screen_text = get_iras_clipboard_text()
-            info = parse_stream_info(screen_text)
+            # 클립보드 텍스트 읽기 (iRAS 화면 정보에 반영될 때까지 폴링)
+            info = wait_for_stream_info(lambda i: i.get('codec') == codec, f"codec {codec}",
+                                        camera_ip=camera_ip, stream=int(target_stream))
             
             # 검증
             detected_codec = info.get('codec', 'Unknown')
@@ -1148,8 +1040,8 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload = curr_set.copy()
         if 'returnCode' in payload: del payload['returnCode']
         payload[f'codecStream{target_stream}'] = initial_set[f'codecStream{target_stream}']
-        api_set_video_streaming(page, camera_ip, payload)
-        time.sleep(2)
+        if api_set_video_streaming(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoStreaming", {f'codecStream{target_stream}': payload[f'codecStream{target_stream}']}, dwell=0)
 
     print_step(4, 5, "해상도 변경 확인 (Stream 1)")
     resolutions = ["1920x1080"]  # 1920x1080만 확인 
@@ -1164,11 +1056,8 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload[f'resolutionStream{target_stream}'] = res
         
         if api_set_video_streaming(page, camera_ip, payload):
-            print(f"   ⏳ 반영 대기 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            
-            screen_text = get_iras_clipboard_text()
-            info = parse_stream_info(screen_text)
+            info = wait_for_stream_info(lambda i: i.get('res_str') == res, f"resolution {res}",
+                                        camera_ip=camera_ip, stream=int(target_stream))
             
             # 검증 (API "WxH" == 화면정보 "WxH")
             detected_res = info.get('res_str', 'Unknown')
@@ -1187,8 +1076,8 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload = curr_set.copy()
         if 'returnCode' in payload: del payload['returnCode']
         payload[f'resolutionStream{target_stream}'] = initial_set[f'resolutionStream{target_stream}']
-        api_set_video_streaming(page, camera_ip, payload)
-        time.sleep(2)
+        if api_set_video_streaming(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoStreaming", {f'resolutionStream{target_stream}': payload[f'resolutionStream{target_stream}']}, dwell=0)
 
     print_step(5, 5, "IPS(FPS) 확인")
     ips_values = VIDEO_STREAMING_IPS_VALUES
@@ -1203,12 +1092,8 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload[f'framerateStream{target_stream}'] = ips
         
         if api_set_video_streaming(page, camera_ip, payload):
-            print(f"   ⏳ 반영 대기 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
-            
-            screen_text = get_iras_clipboard_text()
-            info = parse_stream_info(screen_text)
-            
+            info = wait_for_stream_info(lambda i: abs(i.get('ips', -1.0) - float(ips)) < 1.0, f"IPS {ips}",
+                                        camera_ip=camera_ip, stream=int(target_stream))
             detected_ips = info.get('ips', -1.0)
             
             # float 비교 (1.0 오차 허용)
@@ -1227,8 +1112,8 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload = curr_set.copy()
         if 'returnCode' in payload: del payload['returnCode']
         payload[f'framerateStream{target_stream}'] = initial_set[f'framerateStream{target_stream}']
-        api_set_video_streaming(page, camera_ip, payload)
-        time.sleep(2)
+        if api_set_video_streaming(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoStreaming", {f'framerateStream{target_stream}': payload[f'framerateStream{target_stream}']}, dwell=0)
 
     # ---------------------------------------------------------
     # [Step 5] VBR vs CBR 데이터 크기 비교
@@ -1257,11 +1142,11 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload[f'bitrateControlStream{target_stream}'] = mode
         
         if api_set_video_streaming(page, camera_ip, payload):
-            print(f"   ⏳ 데이터 안정화 대기 ({VIDEO_WAIT_TIME}s)...")
-            time.sleep(VIDEO_WAIT_TIME)
+            # 반영 확인 후 비트레이트 측정 구간 동안 대기 (측정값 안정화)
+            wait_for_setting(page, camera_ip, "videoStreaming",
+                             {f'bitrateControlStream{target_stream}': mode}, dwell=VIDEO_WAIT_TIME)
             
-            screen_text = get_iras_clipboard_text()
-            info = parse_stream_info(screen_text)
+            info = read_stream_info(camera_ip, int(target_stream))
             mbps = info.get('mbps')
             
             if mbps is not None:
@@ -1295,8 +1180,8 @@ def run_streaming_test(page: Page, camera_ip: str):
         payload = curr_set.copy()
         if 'returnCode' in payload: del payload['returnCode']
         payload[f'bitrateControlStream{target_stream}'] = initial_set[f'bitrateControlStream{target_stream}']
-        api_set_video_streaming(page, camera_ip, payload)
-        time.sleep(2)
+        if api_set_video_streaming(page, camera_ip, payload):
+            wait_for_setting(page, camera_ip, "videoStreaming", {f'bitrateControlStream{target_stream}': payload[f'bitrateControlStream{target_stream}']}, dwell=0)
 
     if failed_count == 0: return True, "Streaming Test 성공"
     else: return False, f"Streaming Test 실패 ({failed_count}건)"
@@ -1304,6 +1189,80 @@ def run_streaming_test(page: Page, camera_ip: str):
 # ===========================================================
 # 🧪 [Test 8] MAT (Motion Adaptive Transmission) Test
 # ===========================================================
+def run_mat_reduction_step(page, camera_ip, payload, sampler=None):
+    """
+    MAT On 후 IPS가 목표값으로 떨어지는 시점 측정 (감소 확인 즉시 종료)
+    - sampler(RTSP): 활성화 시점부터 IPS 시계열을 기록하고 프레임 간격으로 감소 시작 시점 계산
+    - sampler 없음(iRAS): 스트림 정보 폴링, 감소 확인 시각을 지연 상한으로 보고
+
+    Returns:
+        실패 건수
+    """
+    def _reduced(ips):
+        return abs(ips - VIDEO_MAT_TARGET_IPS) <= STREAM_PROBE_SETTINGS["ips_tolerance"]
+
+    if not api_set_video_mat(page, camera_ip, payload):
+        print(f"   ❌ MAT On 설정 실패")
+        return 1
+    activated = time.monotonic()
+    print(f"   ✅ MAT 설정 완료")
+    failed = 0
+    
+    # IPS가 떨어지기까지 대기 (최대 VIDEO_MAT_WAIT_TIME, 감소 확인 즉시 진행)
+    print(f"      (MAT는 움직임이 없으면 {VIDEO_MAT_INACTIVITY_PERIOD}초 후 프레임레이트를 낮춥니다)")
+    if sampler:
+        sampler.mark()
+        print(f"   ⏳ IPS 시계열 기록 중 (목표 {VIDEO_MAT_TARGET_IPS}, 최대 {VIDEO_MAT_WAIT_TIME}s)...", end="")
+        try:
+            onset = sampler.wait_for(_reduced, timeout=VIDEO_MAT_WAIT_TIME)
+        except (OSError, StreamProbeError) as e:
+            # 프레임레이트 변경으로 카메라가 RTSP 세션을 끊을 수 있음 → 스트림 정보 폴링으로 대체
+            print(" 연결 끊김")
+            print_warning(f"RTSP 기록 중단, 스트림 정보 폴링으로 대체: {e}")
+            sampler = None
+        else:
+            print(f" {time.monotonic() - activated:.1f}s" if onset is not None else " 타임아웃")
+            reduced_ips = sampler.samples[-1][1] if sampler.samples else -1.0
+            if sampler.samples:
+                print(f"   📈 IPS 추이: {format_ips_trend(sampler.samples)}")
+    if not sampler:
+        remaining = max(VIDEO_MAT_WAIT_TIME - (time.monotonic() - activated), 1.0)
+        info = wait_for_stream_info(lambda i: _reduced(i.get('ips', -1.0)),
+                                    "MAT IPS 감소", timeout=remaining, camera_ip=camera_ip)
+        reduced_ips = info.get('ips', -1.0)
+        onset = time.monotonic() - activated if reduced_ips > 0 and _reduced(reduced_ips) else None
+    
+    trigger_iras_snapshot(page, camera_ip, "MAT_On_Reduced.png")
+    
+    # 설정 적용 확인 (IPS 기록이 끊기지 않도록 측정 후 조회)
+    curr = api_get_video_mat(page, camera_ip)
+    if curr and curr.get('useMat') == 'on':
+        print(f"   ✅ MAT 활성화 확인")
+    else:
+        print(f"   ❌ MAT 설정 검증 실패")
+        failed += 1
+    
+    if reduced_ips <= 0:
+        print(f"   ⚠️ IPS 값을 읽을 수 없습니다.")
+        return failed + 1
+    
+    print(f"   📊 현재 IPS (MAT On): {reduced_ips}")
+    if onset is None:
+        print(f"   ❌ Fail: IPS가 목표값으로 감소하지 않음 (목표: {VIDEO_MAT_TARGET_IPS}, 실제: {reduced_ips})")
+        print(f"   ℹ️  Tip: 화면에 움직임이 있거나 대기 시간이 부족할 수 있습니다.")
+        return failed + 1
+    
+    print(f"   ✅ Pass: IPS가 {VIDEO_MAT_TARGET_IPS}로 감소됨 (실제: {reduced_ips})")
+    
+    # 무동작 → IPS 감소 지연을 inactivityPeriod와 비교 (정적인 화면 기준이므로 참고용 경고만)
+    inactivity = float(VIDEO_MAT_INACTIVITY_PERIOD)
+    delta = onset - inactivity
+    basis = "프레임 간격 기준" if sampler else "폴링 기준 상한"
+    print(f"   ⏱️ IPS 감소 지연: 활성화 후 {onset:.1f}s ({basis}, inactivityPeriod {inactivity:g}s, 차이 {delta:+.1f}s)")
+    if abs(delta) > STREAM_PROBE_SETTINGS["mat_latency_margin"]:
+        print(f"   ⚠️ 감소 시점이 inactivityPeriod와 {STREAM_PROBE_SETTINGS['mat_latency_margin']}s 이상 차이납니다.")
+    return failed
+
 def run_video_mat_test(page: Page, camera_ip: str):
     print("\n=======================================================")
     print(f"🎬 [Video Test 8/10] MAT (Motion Adaptive Transmission)")
@@ -1324,7 +1283,7 @@ def run_video_mat_test(page: Page, camera_ip: str):
     print("    2. (예: 벽면, 정지된 물체, 고정된 배경)")
     print("    3. 준비되었으면 Enter를 눌러주세요.")
     print("="*60)
-    input(">> 준비되었으면 Enter를 누르세요...")
+    wait_for_operator()
     print("   ▶️ MAT 테스트를 시작합니다...\n")
 
     print_step(1, 2, "MAT Off (기준 프레임레이트 확인)")
@@ -1333,13 +1292,11 @@ def run_video_mat_test(page: Page, camera_ip: str):
     payload['useMat'] = 'off'
     
     if api_set_video_mat(page, camera_ip, payload):
-        print(f"   ⏳ 영상 안정화 대기 (5초)...")
-        time.sleep(5)
+        wait_for_setting(page, camera_ip, "videoMat", {'useMat': 'off'})
         trigger_iras_snapshot(page, camera_ip, "MAT_Off.png")
         
         # 현재 IPS 확인
-        screen_text = get_iras_clipboard_text()
-        info = parse_stream_info(screen_text)
+        info = wait_for_stream_info(lambda i: i.get('ips', -1.0) > 0, "MAT Off IPS", camera_ip=camera_ip)
         base_ips = info.get('ips', -1.0)
         
         if base_ips > 0:
@@ -1361,55 +1318,23 @@ def run_video_mat_test(page: Page, camera_ip: str):
     payload['inactivityPeriod'] = VIDEO_MAT_INACTIVITY_PERIOD
     payload['framerateStream1'] = VIDEO_MAT_TARGET_FRAMERATE
     
-    if api_set_video_mat(page, camera_ip, payload):
-        print(f"   ✅ MAT 설정 완료")
-        
-        # 설정 적용 확인
-        curr = api_get_video_mat(page, camera_ip)
-        if curr and curr.get('useMat') == 'on':
-            print(f"   ✅ MAT 활성화 확인")
-        else:
-            print(f"   ❌ MAT 설정 검증 실패")
-            failed_count += 1
-        
-        # IPS가 떨어지기까지 대기 (inactivityPeriod + 여유 시간)
-        print(f"   ⏳ IPS 감소 대기 중 ({VIDEO_MAT_WAIT_TIME}초)...")
-        print(f"      (MAT는 움직임이 없으면 {VIDEO_MAT_INACTIVITY_PERIOD}초 후 프레임레이트를 낮춥니다)")
-        time.sleep(VIDEO_MAT_WAIT_TIME)
-        
-        trigger_iras_snapshot(page, camera_ip, "MAT_On_Reduced.png")
-        
-        # 감소된 IPS 확인
-        screen_text = get_iras_clipboard_text()
-        info = parse_stream_info(screen_text)
-        reduced_ips = info.get('ips', -1.0)
-        
-        if reduced_ips > 0:
-            print(f"   📊 현재 IPS (MAT On): {reduced_ips}")
-            
-            # 목표 IPS로 떨어졌는지 확인 (±1 오차 허용)
-            if abs(reduced_ips - VIDEO_MAT_TARGET_IPS) <= 1.0:
-                print(f"   ✅ Pass: IPS가 {VIDEO_MAT_TARGET_IPS}로 감소됨 (실제: {reduced_ips})")
-            else:
-                print(f"   ❌ Fail: IPS가 목표값으로 감소하지 않음 (목표: {VIDEO_MAT_TARGET_IPS}, 실제: {reduced_ips})")
-                print(f"   ℹ️  Tip: 화면에 움직임이 있거나 대기 시간이 부족할 수 있습니다.")
-                failed_count += 1
+    # RTSP 측정이면 활성화 전에 연결해 두고 활성화 시점부터 IPS를 연속 기록
+    sampler = open_ips_sampler(camera_ip)
+    try:
+        failed_count += run_mat_reduction_step(page, camera_ip, payload, sampler)
+    finally:
+        if sampler:
+            sampler.close()
+        
+        # Step 2 복구: MAT를 off로 (측정 중 예외가 나도 MAT/테스트 프레임레이트가 남지 않도록)
+        print("\n   🔄 Step 2 복구: MAT → off")
+        restore_payload = curr_set.copy()
+        restore_payload['useMat'] = 'off'
+        if api_set_video_mat(page, camera_ip, restore_payload):
+            wait_for_setting(page, camera_ip, "videoMat", {'useMat': 'off'}, dwell=0)
+            print("   ✅ 설정 복구 완료")
         else:
-            print(f"   ⚠️ IPS 값을 읽을 수 없습니다.")
-            failed_count += 1
-    else:
-        print(f"   ❌ MAT On 설정 실패")
-        failed_count += 1
-    
-    # Step 2 복구: MAT를 off로
-    print("\n   🔄 Step 2 복구: MAT → off")
-    restore_payload = curr_set.copy()
-    restore_payload['useMat'] = 'off'
-    if api_set_video_mat(page, camera_ip, restore_payload):
-        time.sleep(2)
-        print("   ✅ 설정 복구 완료")
-    else:
-        print("   ⚠️ 설정 복구 실패")
+            print("   ⚠️ 설정 복구 실패")
 
     if failed_count == 0: return True, "MAT Test 성공"
     else: return False, f"MAT Test 실패 ({failed_count}건)"
@@ -1446,8 +1371,7 @@ def run_privacy_mask_test(page: Page, camera_ip: str):
         payload[f'useZone{i}'] = 'off'
     
     if api_set_video_privacy(page, camera_ip, payload):
-        print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-        time.sleep(VIDEO_WAIT_TIME)
+        wait_for_setting(page, camera_ip, "videoPrivacy", {'usePrivacy': 'off'}, channel=1)
         trigger_iras_snapshot(page, camera_ip, "Privacy_Off.png")
         print(f"   ✅ Privacy Mask Off 확인")
     else:
@@ -1483,12 +1407,19 @@ def run_privacy_mask_test(page: Page, camera_ip: str):
         print(f"   👉 Zone {i}: [{zone['left']},{zone['top']}] ~ [{zone['right']},{zone['bottom']}]")
     
     if api_set_video_privacy(page, camera_ip, payload):
-        print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-        time.sleep(VIDEO_WAIT_TIME)
+        expected_zones = {f'useZone{i}': 'on' for i in range(1, VIDEO_PRIVACY_ZONE_COUNT + 1)}
+        curr = wait_for_setting(page, camera_ip, "videoPrivacy", {'usePrivacy': 'on', **expected_zones}, channel=1)
         trigger_iras_snapshot(page, camera_ip, f"Privacy_{VIDEO_PRIVACY_ZONE_COUNT}Zones.png")
         
+        # 영상 검증: Zone 영역이 마스크 색으로 채워졌는지
+        frame = grab_frame(camera_ip, page)
+        if frame is not None:
+            image_ok, detail = check_privacy_zones(frame, zones[:VIDEO_PRIVACY_ZONE_COUNT], max_width, max_height)
+            print(f"   🖼️ 마스크 영역 판정: {'Pass' if image_ok else 'Fail'} [{detail}]")
+            if not image_ok:
+                failed_count += 1
+        
         # 설정 검증
-        curr = api_get_video_privacy(page, camera_ip)
         if curr and curr.get('usePrivacy') == 'on':
             print(f"   ✅ Privacy Mask 활성화 확인")
             
@@ -1516,7 +1447,7 @@ def run_privacy_mask_test(page: Page, camera_ip: str):
         restore_payload[f'useZone{i}'] = 'off'
     
     if api_set_video_privacy(page, camera_ip, restore_payload):
-        time.sleep(2)
+        wait_for_setting(page, camera_ip, "videoPrivacy", {'usePrivacy': 'off'}, channel=1, dwell=0)
         print("   ✅ 설정 복구 완료")
     else:
         print("   ⚠️ 설정 복구 실패")
@@ -1550,11 +1481,9 @@ def run_osd_test(page: Page, camera_ip: str):
     payload['useOsd'] = 'off'
     
     if api_set_video_osd_text(page, camera_ip, payload):
-        time.sleep(2)
-        trigger_iras_snapshot(page, camera_ip, "OSD_Text_Off.png")
-        
         # API로 실제 적용 확인
-        curr = api_get_video_osd_text(page, camera_ip)
+        curr = wait_for_setting(page, camera_ip, "videoOsdText", {'useOsd': 'off'})
+        trigger_iras_snapshot(page, camera_ip, "OSD_Text_Off.png")
         if curr and curr.get('useOsd') == 'off':
             print(f"   ✅ OSD Text Off 확인 (API 검증 완료)")
         else:
@@ -1577,7 +1506,7 @@ def run_osd_test(page: Page, camera_ip: str):
     
     if api_set_video_osd_text(page, camera_ip, payload):
         # API로 실제 적용 확인
-        curr = api_get_video_osd_text(page, camera_ip)
+        curr = wait_for_setting(page, camera_ip, "videoOsdText", {'useOsd': 'on'})
         if curr and curr.get('useOsd') == 'on':
             print(f"   ✅ OSD Text On 확인 (API 검증 완료)")
             print(f"   📝 설정된 텍스트: '{curr.get('text')}'")
@@ -1586,56 +1515,17 @@ def run_osd_test(page: Page, camera_ip: str):
             failed_count += 1
         
         # 스냅샷 촬영
-        print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-        time.sleep(VIDEO_WAIT_TIME)
         trigger_iras_snapshot(page, camera_ip, "OSD_Text_On.png")
         
         # API 검증만 수행 (스냅샷 없이)
         print(f"\n   --- [속성 검증] ---")
-        
-        # 크기 검증
-        for size in VIDEO_OSD_TEXT_SIZES:
-            payload['textSize'] = size
-            if api_set_video_osd_text(page, camera_ip, payload):
-                time.sleep(1)
-                curr = api_get_video_osd_text(page, camera_ip)
-                if curr and curr.get('textSize') == size:
-                    print(f"   ✅ 크기 {size}: Pass")
-                else:
-                    print(f"   ❌ 크기 {size}: Fail")
-                    failed_count += 1
-            else:
-                failed_count += 1
-        
-        # 색상 검증
-        payload['textSize'] = VIDEO_OSD_TEXT_SIZES[1]  # 중간 크기로 복구
-        for color in VIDEO_OSD_TEXT_COLORS:
-            payload['textColor'] = color
-            if api_set_video_osd_text(page, camera_ip, payload):
-                time.sleep(1)
-                curr = api_get_video_osd_text(page, camera_ip)
-                if curr and curr.get('textColor') == color:
-                    print(f"   ✅ 색상 {color}: Pass")
-                else:
-                    print(f"   ❌ 색상 {color}: Fail")
-                    failed_count += 1
-            else:
-                failed_count += 1
-        
-        # 투명도 검증
-        payload['textColor'] = VIDEO_OSD_TEXT_COLORS[0]  # 흰색으로 복구
-        for transp in VIDEO_OSD_TEXT_TRANSPARENCIES:
-            payload['textTransparency'] = transp
-            if api_set_video_osd_text(page, camera_ip, payload):
-                time.sleep(1)
-                curr = api_get_video_osd_text(page, camera_ip)
-                if curr and curr.get('textTransparency') == transp:
-                    print(f"   ✅ 투명도 {transp}: Pass")
-                else:
-                    print(f"   ❌ 투명도 {transp}: Fail")
-                    failed_count += 1
-            else:
-                failed_count += 1
+        matrix = Matrix("videoOsdText", [
+            Axis("textSize", VIDEO_OSD_TEXT_SIZES, base=VIDEO_OSD_TEXT_SIZES[1], label="크기"),
+            Axis("textColor", VIDEO_OSD_TEXT_COLORS, label="색상"),
+            Axis("textTransparency", VIDEO_OSD_TEXT_TRANSPARENCIES, label="투명도"),
+        ], settle=False)
+        failed = run_matrix(page, camera_ip, matrix)
+        failed_count += len(matrix.cases()) if failed is None else failed
     else:
         print(f"   ❌ 설정 실패")
         failed_count += 1
@@ -1648,9 +1538,8 @@ def run_osd_test(page: Page, camera_ip: str):
         if 'returnCode' in payload: del payload['returnCode']
         payload['useOsd'] = 'off'
         if api_set_video_osd_text(page, camera_ip, payload):
-            time.sleep(2)
             # 복구 검증
-            verify = api_get_video_osd_text(page, camera_ip)
+            verify = wait_for_setting(page, camera_ip, "videoOsdText", {'useOsd': 'off'}, dwell=0)
             if verify and verify.get('useOsd') == 'off':
                 print("   ✅ 설정 복구 완료 (API 검증 완료)")
             else:
@@ -1673,11 +1562,9 @@ def run_osd_test(page: Page, camera_ip: str):
     payload['useOsd'] = 'off'
     
     if api_set_video_osd_datetime(page, camera_ip, payload):
-        time.sleep(2)
-        trigger_iras_snapshot(page, camera_ip, "OSD_DateTime_Off.png")
-        
         # API로 실제 적용 확인
-        curr = api_get_video_osd_datetime(page, camera_ip)
+        curr = wait_for_setting(page, camera_ip, "videoOsdDateTime", {'useOsd': 'off'})
+        trigger_iras_snapshot(page, camera_ip, "OSD_DateTime_Off.png")
         if curr and curr.get('useOsd') == 'off':
             print(f"   ✅ OSD DateTime Off 확인 (API 검증 완료)")
         else:
@@ -1701,7 +1588,7 @@ def run_osd_test(page: Page, camera_ip: str):
     
     if api_set_video_osd_datetime(page, camera_ip, payload):
         # API로 실제 적용 확인
-        curr = api_get_video_osd_datetime(page, camera_ip)
+        curr = wait_for_setting(page, camera_ip, "videoOsdDateTime", {'useOsd': 'on'})
         if curr and curr.get('useOsd') == 'on':
             print(f"   ✅ OSD DateTime On 확인 (API 검증 완료)")
             print(f"   📝 날짜형식: {curr.get('dateFormat')}, 시간형식: {curr.get('timeFormat')}")
@@ -1710,41 +1597,16 @@ def run_osd_test(page: Page, camera_ip: str):
             failed_count += 1
         
         # 스냅샷 촬영
-        print(f"   ⏳ 영상 확인 ({VIDEO_WAIT_TIME}s)...")
-        time.sleep(VIDEO_WAIT_TIME)
         trigger_iras_snapshot(page, camera_ip, "OSD_DateTime_On.png")
         
         # 형식 검증만 수행 (스냅샷 없이)
         print(f"\n   --- [형식 검증] ---")
-        
-        # 날짜 형식 검증
-        for date_format in VIDEO_OSD_DATETIME_DATE_FORMATS:
-            payload['dateFormat'] = date_format
-            if api_set_video_osd_datetime(page, camera_ip, payload):
-                time.sleep(1)
-                curr = api_get_video_osd_datetime(page, camera_ip)
-                if curr and curr.get('dateFormat') == date_format:
-                    print(f"   ✅ 날짜형식 {date_format}: Pass")
-                else:
-                    print(f"   ❌ 날짜형식 {date_format}: Fail")
-                    failed_count += 1
-            else:
-                failed_count += 1
-        
-        # 시간 형식 검증
-        payload['dateFormat'] = VIDEO_OSD_DATETIME_DATE_FORMATS[0]  # 첫 번째 날짜 형식으로 복구
-        for time_format in VIDEO_OSD_DATETIME_TIME_FORMATS:
-            payload['timeFormat'] = time_format
-            if api_set_video_osd_datetime(page, camera_ip, payload):
-                time.sleep(1)
-                curr = api_get_video_osd_datetime(page, camera_ip)
-                if curr and curr.get('timeFormat') == time_format:
-                    print(f"   ✅ 시간형식 {time_format}: Pass")
-                else:
-                    print(f"   ❌ 시간형식 {time_format}: Fail")
-                    failed_count += 1
-            else:
-                failed_count += 1
+        matrix = Matrix("videoOsdDateTime", [
+            Axis("dateFormat", VIDEO_OSD_DATETIME_DATE_FORMATS, label="날짜형식"),
+            Axis("timeFormat", VIDEO_OSD_DATETIME_TIME_FORMATS, label="시간형식"),
+        ], settle=False)
+        failed = run_matrix(page, camera_ip, matrix)
+        failed_count += len(matrix.cases()) if failed is None else failed
     else:
         print(f"   ❌ 설정 실패")
         failed_count += 1
@@ -1757,9 +1619,8 @@ def run_osd_test(page: Page, camera_ip: str):
         if 'returnCode' in payload: del payload['returnCode']
         payload['useOsd'] = 'off'
         if api_set_video_osd_datetime(page, camera_ip, payload):
-            time.sleep(2)
             # 복구 검증
-            verify = api_get_video_osd_datetime(page, camera_ip)
+            verify = wait_for_setting(page, camera_ip, "videoOsdDateTime", {'useOsd': 'off'}, dwell=0)
             if verify and verify.get('useOsd') == 'off':
                 print("   ✅ 설정 복구 완료 (API 검증 완료)")
             else:
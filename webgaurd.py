@@ -1,4 +1,4 @@
-import time
+import tracing
 import ctypes
 import win32gui
 import win32com.client
@@ -62,17 +62,17 @@ class WebGuardController:
             rect = elem.BoundingRectangle
             cx, cy = int((rect.left + rect.right) / 2), int((rect.top + rect.bottom) / 2)
             
-            win32api.SetCursorPos((cx, cy)); time.sleep(0.2)
+            win32api.SetCursorPos((cx, cy)); tracing.sleep(0.2)
             win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-            time.sleep(0.1)
+            tracing.sleep(0.1)
             win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
             return True
         except: return False
 
     def _input(self, hwnd, auto_id, text):
         if self._click(hwnd, auto_id):
-            time.sleep(0.3)
-            self.shell.SendKeys("^a{BACKSPACE}"); time.sleep(0.1)
+            tracing.sleep(0.3)
+            self.shell.SendKeys("^a{BACKSPACE}"); tracing.sleep(0.1)
             try:
                 win32clipboard.OpenClipboard()
                 win32clipboard.EmptyClipboard()
@@ -92,7 +92,7 @@ class WebGuardController:
         for i in range(20):
             hwnd = self._get_handle(TITLE_WEBGUARD)
             if hwnd: break
-            time.sleep(1)
+            tracing.sleep(1)
             if i % 3 == 0: print(f"   -> '{TITLE_WEBGUARD}' 창 대기 중... ({i+1}s)")
             
         if not hwnd: